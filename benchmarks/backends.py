@@ -0,0 +1,96 @@
+"""
+Benchmark of the pandas and polars backends.
+
+Builds a folder of copies of the tensile test data (1,000 files by default)
+and times load_all and summarise with each backend. The polars backend is
+timed with a single thread and with every core (polars reads its thread
+count from POLARS_MAX_THREADS at import so each run is its own process).
+
+Usage:
+    python benchmarks/backends.py --files 1000 --repeats 3
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+DATA = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+
+def make_folder(folder: Path, n_files: int) -> None:
+    sources = sorted(DATA.glob("*.csv"))
+    for i in range(n_files):
+        shutil.copy(sources[i % len(sources)], folder.joinpath(f"specimen_{i}.csv"))
+
+
+def run(folder: str, backend: str, method: str, repeats: int) -> None:
+    """
+    Times one method in this process, called in a subprocess by main.
+    """
+
+    from pymechtest import Tensile
+
+    times = []
+    for _ in range(repeats):
+        obj = Tensile(folder, id_row=3, header=8, backend=backend)
+        start = time.perf_counter()
+        getattr(obj, method)()
+        times.append(time.perf_counter() - start)
+
+    print(min(times))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--run", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run(*args.run, repeats=args.repeats)
+        return
+
+    cores = os.cpu_count() or 1
+    configs = [
+        ("pandas", "pandas", {}),
+        ("polars x1", "polars", {"POLARS_MAX_THREADS": "1"}),
+    ]
+    if cores > 1:
+        configs.append(
+            (f"polars x{cores}", "polars", {"POLARS_MAX_THREADS": str(cores)})
+        )
+
+    with tempfile.TemporaryDirectory() as folder:
+        make_folder(Path(folder), args.files)
+        print(f"{args.files} files, {cores} cores, best of {args.repeats}\n")
+
+        for method in ("load_all", "summarise"):
+            baseline = None
+            for name, backend, env in configs:
+                out = subprocess.run(
+                    [sys.executable, __file__, "--repeats", str(args.repeats)]
+                    + ["--run", folder, backend, method],
+                    env={**os.environ, **env},
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                seconds = float(out.stdout)
+                baseline = baseline or seconds
+                print(
+                    f"{method:<10} {name:<10} {seconds:>8.3f} s  "
+                    f"{baseline / seconds:>5.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
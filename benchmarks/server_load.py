@@ -0,0 +1,111 @@
+"""
+Load test of the local HTTP analysis service.
+
+Starts a server on a free port, fires concurrent /summarise requests at it
+with the tensile test data and reports throughput and latency. For comparison,
+it also times the cold start alternative: a fresh 'python -m pymechtest
+summarise' process per specimen.
+
+Usage:
+    python benchmarks/server_load.py --requests 500 --concurrency 8 --workers 4
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import argparse
+import concurrent.futures
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import List
+
+from pymechtest.server import make_server
+
+DATA = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+QUERY = "type=tensile&header=8&id_row=3&strain1=0.005&strain2=0.015"
+
+
+def percentile(times: List[float], p: float) -> float:
+    return sorted(times)[min(int(len(times) * p / 100), len(times) - 1)]
+
+
+def report(name: str, times: List[float], elapsed: float) -> None:
+    print(
+        f"{name:<8} {len(times):>6} requests  {len(times) / elapsed:>8.1f} req/s  "
+        f"mean {1000 * statistics.mean(times):>7.1f} ms  "
+        f"p50 {1000 * percentile(times, 50):>7.1f} ms  "
+        f"p99 {1000 * percentile(times, 99):>7.1f} ms"
+    )
+
+
+def warm(n_requests: int, concurrency: int, workers: int) -> None:
+    files = [fp.read_bytes() for fp in sorted(DATA.glob("*.csv"))]
+
+    server = make_server(port=0, workers=workers, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/summarise?{QUERY}"
+
+    def post(i: int) -> float:
+        start = time.perf_counter()
+        request = urllib.request.Request(url, data=files[i % len(files)])
+        with urllib.request.urlopen(request) as r:
+            r.read()
+        return time.perf_counter() - start
+
+    try:
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(concurrency) as pool:
+            times = list(pool.map(post, range(n_requests)))
+        report("warm", times, time.perf_counter() - start)
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.pool.shutdown()
+
+
+def cold(n_requests: int) -> None:
+    fp = sorted(DATA.glob("*.csv"))[0]
+    times = []
+
+    with tempfile.TemporaryDirectory() as folder:
+        shutil.copy(fp, folder)
+        command = [sys.executable, "-m", "pymechtest", "summarise", folder]
+        command += ["--header", "8", "--id-row", "3"]
+
+        start = time.perf_counter()
+        for _ in range(n_requests):
+            t = time.perf_counter()
+            subprocess.run(command, check=True, capture_output=True)
+            times.append(time.perf_counter() - t)
+        report("cold", times, time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--cold-requests",
+        type=int,
+        default=10,
+        help="Cold start processes to time, 0 to skip.",
+    )
+    args = parser.parse_args()
+
+    warm(args.requests, args.concurrency, args.workers)
+
+    if args.cold_requests:
+        cold(args.cold_requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 from pymechtest.compression import Compression
+from pymechtest.creep import Creep
+from pymechtest.fatigue import Fatigue
 from pymechtest.flexure import Flexure
 from pymechtest.shear import Shear
 from pymechtest.tensile import Tensile
 
 __version__ = "0.1.4"
 
-__all__ = ["Tensile", "Compression", "Flexure", "Shear"]
+__all__ = ["Tensile", "Compression", "Flexure", "Shear", "Fatigue", "Creep"]
@@ -0,0 +1,13 @@
+"""
+Allows running pymechtest as 'python -m pymechtest'.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import sys
+
+from pymechtest.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
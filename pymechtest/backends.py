@@ -0,0 +1,175 @@
+"""
+Polars implementations of the loading and aggregation done with pandas
+in BaseMechanicalTest, used when backend="polars".
+
+Every file is scanned lazily and all of them are collected together so
+polars parses, cleans and aggregates them across all the available cores.
+Results are converted back to pandas before they're returned to the user.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    import polars as pl
+
+BACKENDS = ("pandas", "polars")
+
+# Column holding each row's label (its row number after the header,
+# the same as the pandas index)
+ROW_COL = "_row"
+
+# Column holding the position of each row's file in the list of files
+FILE_COL = "_file"
+
+
+def import_polars() -> ModuleType:
+    """
+    Imports polars, which is an optional dependency.
+
+    Raises:
+        ImportError: If polars is not installed.
+
+    Returns:
+        ModuleType: The polars module.
+    """
+
+    try:
+        import polars
+    except ImportError as e:
+        raise ImportError(
+            "The polars backend requires polars. "
+            "Install it with 'pip install pymechtest[polars]'."
+        ) from e
+
+    return polars
+
+
+def check_backend(backend: str) -> bool:
+    """
+    Validates a backend name.
+
+    Args:
+        backend (str): Backend name.
+
+    Raises:
+        ValueError: If backend isn't one of BACKENDS.
+
+    Returns:
+        bool: Whether it's the polars backend.
+    """
+
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {list(BACKENDS)}. Got: {backend!r}")
+
+    return backend == "polars"
+
+
+def scan_csv(source: Path, skip_rows: int) -> "pl.LazyFrame":
+    """
+    Lazily reads a csv file's table with every column as a string.
+
+    Args:
+        source (Path): Plain (or decompressed) csv file.
+        skip_rows (int): Number of lines (including blank ones) above the header.
+
+    Returns:
+        pl.LazyFrame: The raw table, with ROW_COL.
+    """
+
+    polars = import_polars()
+
+    options = dict(skip_rows=skip_rows, infer_schema=False, truncate_ragged_lines=True)
+
+    lf: "pl.LazyFrame" = polars.scan_csv(source, **options)
+
+    return lf.with_row_index(ROW_COL)
+
+
+def to_numeric(lf: "pl.LazyFrame") -> "pl.LazyFrame":
+    """
+    Polars version of BaseMechanicalTest._clean: strips whitespace and
+    thousands separators, makes anything that isn't a number null and drops
+    the rows that end up completely empty.
+
+    Args:
+        lf (pl.LazyFrame): Raw table from scan_csv.
+
+    Returns:
+        pl.LazyFrame: Cleaned numeric table.
+    """
+
+    polars = import_polars()
+
+    data = polars.exclude(ROW_COL)
+
+    return lf.with_columns(
+        data.str.strip_chars()
+        .str.replace_all(",", "", literal=True)
+        # Empty strings would cast to null anyway, nan keeps pandas' missing values
+        .cast(polars.Float64, strict=False)
+        .fill_null(float("nan"))
+    ).filter(~polars.all_horizontal(data.is_nan()))
+
+
+def fit_aggregations(
+    strain_col: str, stress_col: str, strain1: float, strain2: float
+) -> List["pl.Expr"]:
+    """
+    Per specimen aggregations: the strength and the least squares line
+    through the points between strain1 and strain2.
+
+    Args:
+        strain_col (str): Strain column.
+        stress_col (str): Stress column.
+        strain1 (float): Lower strain bound.
+        strain2 (float): Upper strain bound.
+
+    Returns:
+        List[pl.Expr]: "Strength", "Slope" and "Intercept" aggregations.
+    """
+
+    polars = import_polars()
+
+    in_window = polars.col(strain_col).is_between(strain1, strain2)
+    x = polars.col(strain_col).filter(in_window)
+    y = polars.col(stress_col).filter(in_window)
+    slope = polars.cov(x, y) / x.var()
+
+    return [
+        polars.col(stress_col).fill_nan(None).max().alias("Strength"),
+        slope.alias("Slope"),
+        (y.mean() - slope * x.mean()).alias("Intercept"),
+    ]
+
+
+def truncate_at_break(
+    lf: "pl.LazyFrame", stress_col: str, fraction: float
+) -> "pl.LazyFrame":
+    """
+    Polars version of BaseMechanicalTest._truncate: drops every row from
+    the first one after the peak with a stress below 'fraction' of the peak.
+
+    Args:
+        lf (pl.LazyFrame): Cleaned specimen data.
+        stress_col (str): Stress column.
+        fraction (float): Fraction of the peak stress taken as fracture.
+
+    Returns:
+        pl.LazyFrame: Data up to the break.
+    """
+
+    polars = import_polars()
+
+    stress = polars.col(stress_col).fill_nan(None)
+    position = polars.int_range(polars.len())
+    dropped = (
+        (position > stress.arg_max()) & (stress < fraction * stress.max())
+    ).fill_null(False)
+    end = polars.when(dropped.any()).then(dropped.arg_max()).otherwise(polars.len())
+
+    return lf.filter(position < end)
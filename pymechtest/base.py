@@ -7,15 +7,206 @@ Created: 09/12/2020
 
 import collections
 import csv
+import functools
+import gzip
+import hashlib
+import inspect
 import itertools
+import lzma
+import os
+import re
+import shutil
+import tempfile
+import warnings
+import weakref
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-import altair as alt
-import altair_data_server  # noqa: F401
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from altair_saver import save
+
+from pymechtest import (
+    backends,
+    calculators,
+    checkpoints,
+    hashing,
+    kernels,
+    report,
+    results,
+    screening,
+    stats,
+    units,
+    viewer,
+    writers,
+)
+
+if TYPE_CHECKING:
+    # Altair is slow to import and only needed for plotting
+    import altair as alt
+    import polars as pl
+
+# Compression suffixes pymechtest knows how to stream decompress
+COMPRESSION_SUFFIXES = (".gz", ".xz", ".zst")
+
+# All the data file suffixes discovered when searching 'folder'
+DATA_SUFFIXES = (".csv",) + tuple(".csv" + s for s in COMPRESSION_SUFFIXES)
+
+# Rows parsed at a time when streaming a file rather than loading it whole
+CHUNKSIZE = 50_000
+
+# Characters copied at a time when decompressing a file for the polars backend
+DECOMPRESS_CHUNK = 1024**2
+
+# Summary rows written at a time by export
+SUMMARY_BATCH = 1_000
+
+# Fracture is the last point before the stress falls below this fraction of its peak
+BREAK_FRACTION = 0.5
+
+# Names of the stress and strain columns derived from load and extension
+DERIVED_STRESS = "Stress"
+DERIVED_STRAIN = "Strain"
+
+# Metadata rows holding the specimen's dimensions, see _get_geometry
+GEOMETRY_ROWS = ("length", "gauge length", "width", "thickness", "diameter", "area")
+
+# Most memory the parsed curves kept between summarise calls can take up (bytes)
+PARSE_CACHE_BYTES = 256 * 1024**2
+
+# Most specimen summaries kept for settings summarise has already been run with
+ANALYSIS_CACHE_SIZE = 100_000
+
+# Files summarised between saves to a checkpoint, see summarise
+CHECKPOINT_BATCH = 100
+
+# Settings that don't change the results, left out of _settings
+NEUTRAL_SETTINGS = ("folder", "backend", "jit", "chunksize")
+
+# How summarise handles a file that fails to summarise, see summarise
+ERROR_POLICIES = ("raise", "skip", "collect")
+
+# Summary column holding why a file failed, with errors="collect"
+ERROR_COL = "Error"
+
+# Group key referring to a specimen's subfolder rather than a header row
+FOLDER_KEY = "Folder"
+
+# Fewest points the automatic modulus window will fit over
+MIN_WINDOW_POINTS = 10
+
+# R^2 a window must reach to be considered linear by the automatic modulus window
+MIN_R_SQUARED = 0.99
+
+# Summary columns stats gives basis values for: strengths and moduli, not
+# strains or diagnostics
+BASIS_COLUMNS = re.compile(r"(.+ )?(Strength|Modulus|Yield)|ReH|ReL|Rp[\d.]+")
+
+
+def _encode(df: pd.DataFrame, ids: pd.CategoricalDtype) -> pd.DataFrame:
+    """
+    Prepares a chunk for export: numeric columns as float, the Specimen ID as
+    'ids' and any other text column as categorical.
+
+    Args:
+        df (pd.DataFrame): Curves or summary chunk.
+        ids (pd.CategoricalDtype): Every Specimen ID, shared by all the chunks.
+
+    Returns:
+        pd.DataFrame: The encoded chunk, Specimen ID first.
+    """
+
+    df = df.copy()
+    for col in df.columns.drop("Specimen ID"):
+        if pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = df[col].to_numpy(dtype=float, na_value=np.nan)
+        else:
+            values = df[col].dropna().unique().tolist()
+            df[col] = df[col].astype(pd.CategoricalDtype(values))
+
+    col = df.pop("Specimen ID").astype(ids)
+    df.insert(0, "Specimen ID", col)
+
+    return df
+
+
+def _is_data_file(fp: Path) -> bool:
+    """
+    Checks whether a discovered file is a (possibly compressed) csv file.
+
+    Args:
+        fp (Path): File to check.
+
+    Returns:
+        bool: True if the file is a csv, csv.gz, csv.xz or csv.zst file.
+    """
+    return fp.is_file() and fp.name.lower().endswith(DATA_SUFFIXES)
+
+
+def _match_col(df: pd.DataFrame, text: str) -> Optional[str]:
+    """
+    Naive text match of a column name, the last match wins.
+
+    Args:
+        df (pd.DataFrame): DataFrame to search the columns of.
+        text (str): Lower case text to look for in the column names.
+
+    Returns:
+        Optional[str]: Matching column, None if there isn't one.
+    """
+
+    match = None
+    for col in df.columns.tolist():
+        if text in col.strip().lower():
+            match = col
+
+    return match
+
+
+def _open_text(fp: Path) -> IO[str]:
+    """
+    Opens a (possibly compressed) csv file for reading as text.
+
+    Compressed files are decompressed as a stream as they are read
+    so the whole decompressed file is never held in memory at once.
+
+    Args:
+        fp (Path): File to open.
+
+    Raises:
+        ImportError: If fp is a .zst file and zstandard is not installed.
+
+    Returns:
+        IO[str]: Open text file object.
+    """
+
+    suffix = fp.suffix.lower()
+
+    if suffix == ".gz":
+        return gzip.open(fp, "rt")
+    elif suffix == ".xz":
+        return lzma.open(fp, "rt")
+    elif suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                f"Reading zstandard compressed file: {str(fp)} requires zstandard. "
+                "Install it with 'pip install pymechtest[zstd]'."
+            ) from e
+        return zstandard.open(fp, "rt")  # type: ignore[no-any-return]
+    else:
+        return open(fp, "r")
 
 
 class BaseMechanicalTest:
@@ -29,6 +220,15 @@ class BaseMechanicalTest:
         strain1: float = 0.05,
         strain2: float = 0.15,
         expect_yield: bool = True,
+        auto_modulus: bool = False,
+        stress_units: Optional[str] = None,
+        strain_units: Optional[str] = None,
+        methods: Optional[List[str]] = None,
+        backend: str = "pandas",
+        jit: bool = False,
+        screen: Optional[str] = None,
+        detect_break: bool = False,
+        dedupe: Optional[str] = None,
     ) -> None:
         """
         Base Mechanical test class.
@@ -62,6 +262,61 @@ class BaseMechanicalTest:
             expect_yield (bool, optional): Whether the specimens are expected to be
                 elastic to failure (False) or they are expected to have a
                 yield strength (True). Defaults to True.
+
+            auto_modulus (bool, optional): Whether to search each specimen's curve
+                for its most linear section and calculate the modulus from that
+                (True) or to use strain1 and strain2 (False). The automatic window
+                spans as many points as lie between strain1 and strain2 and the
+                chosen bounds are reported in the summary. Defaults to False.
+
+            stress_units (str, optional): Units of the stress data e.g. "kPa", "psi".
+                If not passed, pymechtest reads them from the units row under the
+                table header, falling back to MPa. Stress is converted to MPa
+                as it's loaded.
+
+            strain_units (str, optional): Units of the strain data e.g. "mm/mm",
+                "microstrain". If not passed, pymechtest reads them from the units
+                row under the table header, falling back to %. Strain is converted
+                to % as it's loaded.
+
+            methods (List[str], optional): Additional modulus and yield strength
+                calculation methods to include in the summary, e.g.
+                ["chord", "secant", "rp0.5", "reh"]. See the calculators module
+                for what's available. If not passed, only the elastic modulus
+                and 0.2% offset yield are calculated.
+
+            backend (str, optional): Dataframe library used to parse, clean and
+                aggregate the data in load_all and summarise. "pandas" or "polars"
+                (multi-threaded, requires polars). Results are always returned
+                as pandas dataframes. Defaults to "pandas".
+
+            jit (bool, optional): Whether to calculate the strength, modulus and
+                yield strength with the fused kernel in pymechtest.kernels
+                (compiled with numba if it's installed, numpy otherwise) rather
+                than the calculators. The results are the same to within floating
+                point rounding. Defaults to False.
+
+            screen (str, optional): Data quality screening of each specimen as it's
+                summarised, see pymechtest.screening. "flag" adds the diagnostics
+                and a "Flags" column with the reasons a specimen failed (empty if
+                it passed) to the summary, "exclude" leaves the failed specimens
+                out of the summary (and so stats) altogether. If not passed,
+                specimens aren't screened.
+
+            detect_break (bool, optional): Whether to find each specimen's fracture
+                and cut its data off there as it's loaded, dropping anything logged
+                after the break. Fracture is the last point before the stress first
+                falls below BREAK_FRACTION of the peak stress. Adds a "Strain at
+                Break" column to the summary. Defaults to False.
+
+            dedupe (str, optional): What to do with specimens whose data table is
+                identical to another's, e.g. a file copied between lot folders,
+                see pymechtest.hashing. Each distinct table is only analysed once.
+                "flag" adds a "Duplicate Of" column with the Specimen ID of the
+                first copy (missing for the first copy itself) to the summary and
+                counts each specimen once in stats, "exclude" leaves the
+                duplicates out of the summary altogether. If not passed, files
+                aren't checked for duplicates.
         """
         self.folder = folder
         self.id_row = id_row
@@ -71,6 +326,39 @@ class BaseMechanicalTest:
         self.strain1 = strain1
         self.strain2 = strain2
         self.expect_yield = expect_yield
+        self.auto_modulus = auto_modulus
+        self.stress_units = stress_units
+        self.strain_units = strain_units
+        self.methods = methods
+        self.backend = backend
+        self.jit = jit
+        self.screen = screen
+        self.detect_break = detect_break
+        self.dedupe = dedupe
+
+        # Last load_all and summarise results, see _cached
+        self._cache: Dict[str, Tuple[str, pd.DataFrame]] = {}
+
+        # Columns stress and strain are derived from, see _get_stress_strain_cols
+        self._load_col: Optional[str] = None
+        self._extension_col: Optional[str] = None
+
+        # Parsed curves and specimen summaries reused by later calls,
+        # see _parse and _analyse
+        self._parsed: "collections.OrderedDict[Tuple[str, ...], pd.DataFrame]" = (
+            collections.OrderedDict()
+        )
+        self._parsed_bytes = 0
+        self._analysed: "collections.OrderedDict[Tuple[str, ...], pd.Series]" = (
+            collections.OrderedDict()
+        )
+
+        # (process ID, folder) of the decompressed copies the polars backend
+        # scans, see _decompressed
+        self._scratch: Optional[Tuple[int, str]] = None
+
+        # Files that failed in the last summarise, see summarise's errors
+        self.errors = pd.DataFrame(columns=["File", "Specimen ID", ERROR_COL])
 
     def __repr__(self) -> str:
 
@@ -82,7 +370,16 @@ class BaseMechanicalTest:
             f"header={self.header!r}, "
             f"strain1={self.strain1!r}, "
             f"strain2={self.strain2!r}, "
-            f"expect_yield={self.expect_yield!r})"
+            f"expect_yield={self.expect_yield!r}, "
+            f"auto_modulus={self.auto_modulus!r}, "
+            f"stress_units={self.stress_units!r}, "
+            f"strain_units={self.strain_units!r}, "
+            f"methods={self.methods!r}, "
+            f"backend={self.backend!r}, "
+            f"jit={self.jit!r}, "
+            f"screen={self.screen!r}, "
+            f"detect_break={self.detect_break!r}, "
+            f"dedupe={self.dedupe!r})"
         )
 
     @property
@@ -101,12 +398,31 @@ class BaseMechanicalTest:
     def strain_col(self, value: str) -> None:
         self._strain_col = value
 
+    def _settings(self) -> Dict[str, Any]:
+        """
+        The settings that determine the results, i.e. every constructor
+        argument except those in NEUTRAL_SETTINGS, used to key stored results.
+
+        Returns:
+            Dict[str, Any]: Argument name: current value.
+        """
+
+        names = inspect.signature(type(self).__init__).parameters
+
+        return {
+            name: getattr(self, name)
+            for name in names
+            if name != "self" and name not in NEUTRAL_SETTINGS
+        }
+
     def _get_specimen_id(self, fp: Path) -> str:
         """
         Uses arg: self.id_row to grab the Specimen ID from a csv file.
-        Only loads the row specified using itertools.islice for performance.
+        Only loads the row specified using itertools.islice for performance,
+        compressed files are only decompressed as far as this row.
 
-        If no id_row passed, will just grab the filename.
+        If no id_row passed, will just grab the filename (minus any
+        compression suffix).
 
         Args:
             fp (Path): Individual specimen's data csv file.
@@ -120,11 +436,13 @@ class BaseMechanicalTest:
 
         if self.id_row is None:
             # Nothing passed for id_row
-            # Use filename instead
+            # Use filename instead, without any compression suffix
+            if fp.suffix.lower() in COMPRESSION_SUFFIXES:
+                return fp.stem
             return fp.name
 
         # If user passes int for id_row
-        with open(fp, "r") as f:
+        with _open_text(fp) as f:
             spec_id = next(
                 itertools.islice(csv.reader(f), self.id_row, self.id_row + 1)
             )
@@ -134,6 +452,63 @@ class BaseMechanicalTest:
         else:
             raise ValueError(f"Specimen ID in file: {str(fp)} not found!")
 
+    def _get_metadata(self, fp: Path) -> Dict[str, str]:
+        """
+        Parses the metadata above the table header into a dictionary.
+
+        Test machines typically write rows like 'Width,"10.14400",mm' above the
+        data, these become {"Width": "10.14400"}. Only the rows above 'header'
+        are read.
+
+        Args:
+            fp (Path): Individual specimen's data csv file.
+
+        Returns:
+            Dict[str, str]: Metadata name: value.
+        """
+
+        with _open_text(fp) as f:
+            rows = list(itertools.islice(csv.reader(f), self.header))
+
+        return {
+            row[0].strip(): row[1].strip()
+            for row in rows
+            if len(row) >= 2 and row[0].strip()
+        }
+
+    def _get_group_keys(self, fp: Path, by: List[str]) -> Dict[str, str]:
+        """
+        Gets the values of the grouping keys 'by' for a single specimen.
+
+        The special key "Folder" is the specimen's subfolder relative
+        to 'folder', any other key is looked up in the header metadata.
+
+        Args:
+            fp (Path): Individual specimen's data csv file.
+            by (List[str]): Grouping keys.
+
+        Raises:
+            ValueError: If a key isn't in the specimen's header metadata.
+
+        Returns:
+            Dict[str, str]: Grouping key: value.
+        """
+
+        metadata = self._get_metadata(fp) if set(by) - {FOLDER_KEY} else {}
+
+        keys = {}
+        for key in by:
+            if key == FOLDER_KEY:
+                keys[key] = fp.parent.relative_to(
+                    Path(self.folder).resolve()
+                ).as_posix()
+            elif key in metadata:
+                keys[key] = metadata[key]
+            else:
+                raise ValueError(f"Group key {key!r} not found in file: {str(fp)}")
+
+        return keys
+
     def _get_stress_strain_cols(self, df: pd.DataFrame) -> None:
         """
         Attempts to auto-detect the names of the stress and strain columns
@@ -141,6 +516,11 @@ class BaseMechanicalTest:
 
         If one is passed and the other not, this should only auto-detect the other.
 
+        If there's no stress column but there is a load column, stress is
+        derived from the load and the specimen's cross sectional area as each
+        file is loaded (see _unit_factors) into DERIVED_STRESS. The same goes for
+        strain from an extension column and the gauge length, into DERIVED_STRAIN.
+
         If none can be found, raises an exception and asks the user to specify.
 
         Args:
@@ -151,13 +531,17 @@ class BaseMechanicalTest:
         """
 
         if not self.stress_col:
-            for col in df.columns.tolist():
-                if "stress" in col.strip().lower():
-                    self.stress_col = col
+            self._stress_col = _match_col(df, "stress")
+        if not self.stress_col:
+            self._load_col = _match_col(df, "load")
+            if self._load_col:
+                self.stress_col = DERIVED_STRESS
+        if not self.strain_col:
+            self._strain_col = _match_col(df, "strain")
         if not self.strain_col:
-            for col in df.columns.tolist():
-                if "strain" in col.strip().lower():
-                    self.strain_col = col
+            self._extension_col = _match_col(df, "extension")
+            if self._extension_col:
+                self.strain_col = DERIVED_STRAIN
 
         # Now that's been done, neither should be None
         # If either are still None, it means detection failed
@@ -167,298 +551,2121 @@ class BaseMechanicalTest:
         elif self.strain_col is None:
             raise ValueError("Could not detect strain_col.")
 
-    def _load(self, fp: Path) -> pd.DataFrame:
+    def _get_units(self, fp: Path) -> Dict[str, str]:
         """
-        Method to load individual data csv file into a pandas DataFrame.
+        Reads the units row directly under the table header
+        e.g. '(s),(mm),(N),(%),(MPa)' into a dictionary.
+
+        Only the header and units rows are read. If the row under the header
+        is data rather than units, nothing is returned.
 
         Args:
-            fp (Path): csv file to load. Exclusively pathlib.Path as files
-                are discovered with an rglob in load_all.
+            fp (Path): Individual specimen's data csv file.
 
         Returns:
-            pd.DataFrame: DataFrame containing single sample's data.
+            Dict[str, str]: Column name: units.
         """
-        # Incase there are any non-numerics below header
-        df = (
-            (pd.read_csv(fp, header=self.header))
-            .applymap(lambda x: x.strip().replace(",", "") if isinstance(x, str) else x)
-            .apply(pd.to_numeric, errors="coerce")
-            .dropna(how="all")
-        )
-        df["Specimen ID"] = self._get_specimen_id(fp)
 
-        # Attempt to detect stress/strain columns
-        self._get_stress_strain_cols(df)
+        with _open_text(fp) as f:
+            # Like pandas, header doesn't count blank lines
+            rows = list(
+                itertools.islice(
+                    filter(None, csv.reader(f)), self.header, self.header + 2
+                )
+            )
 
-        return df
+        if len(rows) < 2:
+            return {}
 
-    def _calc_slope(self, df: pd.DataFrame) -> Tuple[float, float]:
-        """
-        Calculates the slope and the intercept of the linear portion
-        of the stress-strain curve.
+        def is_number(value: str) -> bool:
+            try:
+                float(value.replace(",", ""))
+            except ValueError:
+                return False
+            return True
 
-        Uses numpy to calculate the slope and intercept
-        from a single specimen's data using strain1 and strain2
-        as the upper and lower limits.
+        return {
+            col: unit.strip()
+            for col, unit in zip(*rows)
+            if unit.strip() and not is_number(unit)
+        }
+
+    def _get_geometry(self, fp: Path) -> Dict[str, float]:
+        """
+        Reads the specimen's dimensions from the metadata above the
+        table header e.g. 'Width,"10.14400",mm', converted to mm.
 
         Args:
-            df (pd.DataFrame): DataFrame for the specimen.
+            fp (Path): Individual specimen's data csv file.
+
+        Raises:
+            ValueError: If a dimension isn't a number or its units
+                aren't recognised.
 
         Returns:
-            Tuple[float, float]: slope, intercept.
+            Dict[str, float]: Lower case dimension name (e.g. "width",
+                "gauge length"): value in mm (mm^2 for "area").
         """
-        # Grab stress and strain data between strain1 and strain2
-        # Elastic portion of the stress-strain curve
-        mod_filt = (df[self.strain_col] >= self.strain1) & (
-            df[self.strain_col] <= self.strain2
-        )
 
-        mod_df = df[mod_filt][[self.strain_col, self.stress_col]]
+        with _open_text(fp) as f:
+            rows = list(itertools.islice(csv.reader(f), self.header))
+
+        geometry = {}
+        for row in rows:
+            name = row[0].strip().lower() if row else ""
+            if name not in GEOMETRY_ROWS or len(row) < 2:
+                continue
+            unit = row[2] if len(row) > 2 and row[2].strip() else None
+            try:
+                value = float(row[1].replace(",", ""))
+            except ValueError:
+                raise ValueError(
+                    f"{row[0]} in file: {str(fp)} is not a number: {row[1]!r}"
+                ) from None
+            power = 2 if name == "area" else 1
+            geometry[name] = value * units.length_factor(unit, power=power)
+
+        return geometry
+
+    def _derived_factors(self, fp: Path) -> Tuple[float, float]:
+        """
+        Factors turning a file's extension and load into strain (%)
+        and stress (MPa), for whichever of them are being derived.
+
+        Strain is extension over the gauge length ("Gauge Length" or
+        "Length" row) and stress is load over the cross sectional area
+        ("Area", "Width" times "Thickness" or a round "Diameter" row).
 
-        # A is here to convert x to a matrix so numpy can be used
-        x = np.array(mod_df[self.strain_col])
-        y = np.array(mod_df[self.stress_col])
+        Args:
+            fp (Path): Individual specimen's data csv file.
 
-        A = np.vstack([x, np.ones(len(x))]).T
+        Raises:
+            ValueError: If the dimensions needed aren't in the file.
 
-        # As in y = mx + c
-        slope, intercept = np.linalg.lstsq(A, y, rcond=None)[0]
+        Returns:
+            Tuple[float, float]: strain factor, stress factor.
+        """
 
-        return slope, intercept
+        geometry = self._get_geometry(fp)
+        detected = self._get_units(fp)
+        strain_factor = stress_factor = 1.0
+
+        if self._extension_col:
+            length = geometry.get("gauge length", geometry.get("length"))
+            if not length:
+                raise ValueError(
+                    "Deriving strain needs a 'Gauge Length' or 'Length' row "
+                    f"in file: {str(fp)}"
+                )
+            strain_factor = (
+                100 * units.length_factor(detected.get(self._extension_col)) / length
+            )
 
-    def _calc_modulus(self, df: pd.DataFrame) -> float:
+        if self._load_col:
+            if "area" in geometry:
+                area = geometry["area"]
+            elif "width" in geometry and "thickness" in geometry:
+                area = geometry["width"] * geometry["thickness"]
+            elif "diameter" in geometry:
+                area = np.pi * geometry["diameter"] ** 2 / 4
+            else:
+                raise ValueError(
+                    "Deriving stress needs an 'Area', 'Width' and 'Thickness' or "
+                    f"'Diameter' row in file: {str(fp)}"
+                )
+            stress_factor = units.load_factor(detected.get(self._load_col)) / area
+
+        return strain_factor, stress_factor
+
+    def _unit_factors(self, fp: Path) -> Tuple[float, float]:
         """
-        Uses the calc slope method to get elastic modulus in GPa.
+        Factors converting a file's strain and stress data to % and MPa.
+
+        Units passed as stress_units/strain_units take precedence,
+        otherwise they are read from the file's units row.
 
-        Note: stress must be in MPa and strain must be in % for this to work.
+        Derived stress and strain (see _get_stress_strain_cols) are calculated
+        with the same factors, from the load and extension columns.
 
         Args:
-            df (pd.DataFrame): Input df passed to _calc_slope.
+            fp (Path): Individual specimen's data csv file.
+
+        Raises:
+            ValueError: If the units aren't recognised.
 
         Returns:
-            float: Elastic Modulus in GPa.
+            Tuple[float, float]: strain factor, stress factor.
         """
-        # If stress is MPa and strain is in % this will always work
-        return 0.1 * self._calc_slope(df)[0]
 
-    def _calc_yield(self, df: pd.DataFrame, offset: float = 0.2) -> float:
-        """
-        Calculates the % offset yield strength for a specimen who's data is contained
-        in 'df'.
+        detected = (
+            self._get_units(fp)
+            if self.stress_units is None or self.strain_units is None
+            else {}
+        )
 
-        Args:
-            df (pd.DataFrame): DataFrame containing single specimens' data.
+        strain_factor = units.strain_factor(
+            self.strain_units or detected.get(str(self.strain_col))
+        )
+        stress_factor = units.stress_factor(
+            self.stress_units or detected.get(str(self.stress_col))
+        )
 
-            offset (float, optional): Strain offset to apply (%). Defaults to 0.2.
+        if self._load_col or self._extension_col:
+            derived = self._derived_factors(fp)
+            if self._extension_col:
+                strain_factor = derived[0]
+            if self._load_col:
+                stress_factor = derived[1]
+
+        return strain_factor, stress_factor
+
+    def _source_cols(self) -> List[str]:
+        """
+        The columns strain and stress are read from, either strain_col and
+        stress_col themselves or the extension and load columns they're
+        derived from.
 
         Returns:
-            float: Offset yield strength in MPa
+            List[str]: [strain source column, stress source column]
         """
 
-        if not self.expect_yield:
-            raise AttributeError(
-                f"""Cannot calculate yield strength when expect_yield is False.
-                expect_yield = {self.expect_yield}"""
-            )
+        return [
+            str(self._extension_col or self.strain_col),
+            str(self._load_col or self.stress_col),
+        ]
 
-        slope, intercept = self._calc_slope(df)
+    def _convert_units(
+        self, df: pd.DataFrame, factors: Tuple[float, float]
+    ) -> pd.DataFrame:
+        """
+        Converts the strain and stress columns of freshly loaded data to %
+        and MPa in place so every later calculation works in canonical units.
 
-        # Avoids pandas view/copy warning
-        offset_df = df.copy()
+        Derived stress and strain columns are added here, calculated from
+        their load and extension columns.
 
-        # Apply the offset to determine offset stress at each row
-        # Offset stress vs strain is straight line of gradient = modulus
-        # Yield is where this line intersects the original curve
-        offset_df["offset_stress"] = slope * (df[self.strain_col] - offset) + intercept
+        Args:
+            df (pd.DataFrame): Cleaned specimen data.
+            factors (Tuple[float, float]): strain factor, stress factor
+                from _unit_factors.
 
-        # Diff between offset stress and actual
-        # Intersect is where this is = 0
-        offset_df["offset_delta"] = (
-            offset_df["offset_stress"] - offset_df[self.stress_col]
-        )
+        Returns:
+            pd.DataFrame: The same dataframe, converted.
+        """
 
-        # Find actual stress value of the intersect
-        yield_index = offset_df["offset_delta"].abs().idxmin()
+        cols = (self.strain_col, self.stress_col)
 
-        yield_strength = offset_df.iloc[yield_index][self.stress_col]
+        for col, source, factor in zip(cols, self._source_cols(), factors):
+            if col != source and source in df:
+                df[col] = df[source] * factor
+            elif factor != 1 and col in df:
+                df[col] *= factor
 
-        return float(yield_strength)
+        return df
 
-    def _extract_values(self, df: pd.DataFrame) -> pd.Series:
+    def _cached(self, name: str) -> Optional[pd.DataFrame]:
         """
-        Extracts key test values from a specimens' data.
+        Gets the last result of 'name' (load_all or summarise) if it was
+        produced with the current settings.
 
-        Uses a pd.Series to make summarising in a dataframe later
-        much easier.
+        The settings are compared by repr so changing anything
+        (e.g. the folder) means the cached result is no longer used.
 
         Args:
-            df (pd.DataFrame): Specimens' data
+            name (str): Method name.
 
         Returns:
-            pd.Series: Series of key test values.
+            Optional[pd.DataFrame]: The cached result, None if there isn't one.
         """
 
-        cols = ["Specimen ID", "Strength", "Modulus"]
+        settings, df = self._cache.get(name, ("", None))
 
-        # Only one specimen in df here so specimen ID is constant for each
-        spec_id = df["Specimen ID"].iloc[0]
-        uts = df[self.stress_col].max()
-        modulus = self._calc_modulus(df)
+        return df if settings == repr(self) else None
 
-        vals = [spec_id, uts, modulus]
+    def _axes(self) -> Tuple[str, str, str, str, str]:
+        """
+        What plot_curves and view draw: the curves' x and y columns along
+        with the default axis labels and title.
 
-        if self.expect_yield:
-            cols.append("Yield Strength")
-            yield_strength = self._calc_yield(df)
+        Returns:
+            Tuple[str, str, str, str, str]: x column, y column, x label,
+                y label and title.
+        """
 
-            vals.append(yield_strength)
+        name = self.__class__.__qualname__
 
-        data_dict = collections.OrderedDict(
-            {col: val for (col, val) in zip(cols, vals)}
+        return (
+            str(self.strain_col),
+            str(self.stress_col),
+            f"{name} Strain (%)",
+            f"{name} Stress (MPa)",
+            f"{name} Stress Strain Curves",
         )
 
-        return pd.Series(data=data_dict)
-
-    def load_all(self) -> pd.DataFrame:
+    def _unsupported(self, method: str) -> TypeError:
         """
-        Loads all the found files in 'folder' into a dataframe.
+        Error for a method that only applies to static stress strain tests,
+        for the test types that don't support it.
 
-        Recursively searches 'folder' for all csv files, grabs the specimen identifier
-        specified during 'id_row' and includes this in the dataframe.
+        Args:
+            method (str): Method name.
 
         Returns:
-            pd.DataFrame: All found test data with specimen identifier.
+            TypeError: The error, for the caller to raise.
         """
 
-        # Cast to Path so can glob even if user passed str
-        fp = Path(self.folder).resolve()
-
-        df = (
-            (pd.concat([self._load(f) for f in sorted(fp.rglob("*.csv"))]))
-            .assign(spec_id=lambda x: pd.Categorical(x["Specimen ID"]))
-            .drop(columns=["Specimen ID"])
-            .rename(columns={"spec_id": "Specimen ID"})
+        return TypeError(
+            f"{self.__class__.__qualname__}.{method} is not supported, "
+            "it only applies to static stress strain tests."
         )
 
-        # Reorder the columns for OCD reasons
-        col = df.pop("Specimen ID")
-        df.insert(0, "Specimen ID", col)
-
-        return df
-
-    def summarise(self) -> pd.DataFrame:
+    def _find_files(self) -> List[Path]:
         """
-        High level summary method, generates a dataframe containing key
-        test values such as UTS, Modulus etc. for all the data in the
-        target folder.
+        Recursively searches 'folder' for all the data files.
+
+        Plain csv files as well as gzip (.csv.gz), xz (.csv.xz) and
+        zstandard (.csv.zst) compressed csv files are discovered.
 
         Returns:
-            pd.DataFrame: Dataframe containing test summary values for each
-                specimen.
+            List[Path]: Sorted list of data files.
         """
 
+        # Cast to Path so can glob even if user passed str
         fp = Path(self.folder).resolve()
 
-        rows = [
-            self._extract_values(df)
-            for df in [self._load(f) for f in sorted(fp.rglob("*.csv"))]
-        ]
-
-        # .T transposes to that it's the expected dataframe format
-        return (pd.concat(rows, axis=1, ignore_index=True).T).convert_dtypes()
+        return sorted(f for f in fp.rglob("*.csv*") if _is_data_file(f))
 
-    def stats(self) -> pd.DataFrame:
+    def _content_hash(self, fp: Path) -> str:
         """
-        Returns a table of summary statistics e.g. mean, std, cov etc.
-        for the data in folder.
+        Hashes a file's data table, see pymechtest.hashing.
 
-        Uses pandas df.describe() to do the bulk of the work, just adds in
-        cov for good measure.
+        Args:
+            fp (Path): csv file to hash.
 
         Returns:
-            pd.DataFrame: Summary statistics.
+            str: Hex digest of the table.
         """
 
-        df = self.summarise().describe()
+        with _open_text(fp) as f:
+            return hashing.table_hash(f, self.header)
 
-        df.loc["cov%"] = df.loc["std"] / df.loc["mean"] * 100
-
-        # Reorganise so cov is close to std
-        new_index = ["count", "mean", "std", "cov%", "min", "25%", "50%", "75%", "max"]
-        df = df.reindex(new_index)
-
-        return df
-
-    def plot_curves(
-        self,
-        title: Optional[str] = None,
-        save_path: Optional[Union[str, Path]] = None,
-        save_method: Optional[str] = "selenium",
-        x_label: Optional[str] = None,
-        y_label: Optional[str] = None,
-        height: int = 500,
-        width: int = 750,
-    ) -> alt.Chart:
+    def _content_hashes(self, files: List[Path], errors: str) -> List[Optional[str]]:
         """
-        Creates a nice looking stress strain plot of all the specimens using altair.
+        Hashes every file's data table for dedupe.
 
-        Will use the class name to fill in axis labels if not passed, e.g
-        'Tensile' Strain
+        Unless errors is "raise", a file that can't be read (e.g. a truncated
+        archive) is left out of deduplication rather than stopping the run,
+        summarising it then fails and is skipped or collected like any other.
 
         Args:
-            title (str, optional): Title for the plot.
-                Defaults to "{class_name} Stress-Strain Curves".
+            files (List[Path]): Files to hash.
+            errors (str): Error policy, see summarise.
 
-            save_path (Union[str, Path], optional): str or Pathlike path to save
-                a png of the plot. Requires chrome and selenium. If not passed, plot
-                is simply returned and not saved.
+        Returns:
+            List[Optional[str]]: Each file's hash, None if it couldn't be read.
+        """
 
-            save_method (str, optional): One of 2 altair save methods:
-                'selenium' or 'node'.
-                if 'selenium' requires a configured geckodriver or chromedriver on PATH.
-                if 'node' requires nodejs installation. Defaults to 'selenium'
+        if errors == "raise":
+            return [self._content_hash(f) for f in files]
 
-            x_label (str, optional): Label for x-axis.
-                Defaults to "{class name}Strain (%)".
+        hashes: List[Optional[str]] = []
+        for f in files:
+            try:
+                hashes.append(self._content_hash(f))
+            except Exception:
+                hashes.append(None)
 
-            y_label (str, optional): Label for y-axis.
-                Defaults to "{class name}Stress (MPa)".
+        return hashes
 
-            height (int, optional): Height of the plot.
-                Defaults to 500.
+    @staticmethod
+    def _clean(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts freshly parsed csv data to numeric.
 
-            width (int, optional): Width of the plot.
-                Defaults to 750.
+        Strips whitespace and thousands separators, coerces anything that still
+        isn't a number (e.g. a units row below the header) to NaN and drops
+        the rows that end up completely empty.
+
+        Args:
+            df (pd.DataFrame): Raw data as parsed by pd.read_csv.
 
         Returns:
-            alt.Chart: Stress strain plot.
+            pd.DataFrame: Cleaned numeric data.
         """
 
-        # Altair will warn if over 5,000 rows in a notebook. This is cleanest solution.
-        alt.data_transformers.enable("data_server")
+        def to_numeric(col: pd.Series) -> pd.Series:
+            numeric = pd.to_numeric(col, errors="coerce")
+            # Only the values that didn't parse need their separators removing
+            failed = numeric.isna() & col.notna()
+            if failed.any():
+                numeric[failed] = pd.to_numeric(
+                    col[failed].astype(str).str.replace(",", "", regex=False),
+                    errors="coerce",
+                )
+            return numeric
 
-        if not x_label:
-            x_label = f"{self.__class__.__qualname__} Strain (%)"
+        return df.apply(to_numeric).dropna(how="all")
 
-        if not y_label:
-            y_label = f"{self.__class__.__qualname__} Stress (MPa)"
+    def _summary_cols(self, fp: Path) -> List[str]:
+        """
+        Returns the only columns summarise needs to read: strain and stress.
 
-        if not title:
-            title = f"{self.__class__.__qualname__} Stress Strain Curves"
+        If either hasn't been passed or detected yet, just the header row
+        of 'fp' is parsed to auto-detect them.
 
-        df = self.load_all()
+        Args:
+            fp (Path): csv file about to be summarised.
 
-        chart = (
-            alt.Chart(data=df)
+        Returns:
+            List[str]: [strain_col, stress_col]
+        """
+
+        if not self.stress_col or not self.strain_col:
+            with _open_text(fp) as f:
+                self._get_stress_strain_cols(
+                    pd.read_csv(f, header=self.header, nrows=0)
+                )
+
+        return self._source_cols()
+
+    def _load(self, fp: Path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Method to load individual data csv file into a pandas DataFrame.
+
+        Compressed files are decompressed as a stream here so that the
+        decompression happens wherever the file is being loaded.
+
+        Args:
+            fp (Path): csv file to load. Exclusively pathlib.Path as files
+                are discovered with an rglob in load_all.
+
+            usecols (List[str], optional): Only parse these columns.
+                If not passed, all the columns are loaded.
+
+        Returns:
+            pd.DataFrame: DataFrame containing single sample's data.
+        """
+        # Incase there are any non-numerics below header
+        with _open_text(fp) as f:
+            df = self._clean(pd.read_csv(f, header=self.header, usecols=usecols))
+
+        df["Specimen ID"] = self._get_specimen_id(fp)
+
+        # Attempt to detect stress/strain columns
+        self._get_stress_strain_cols(df)
+
+        df = self._convert_units(df, self._unit_factors(fp))
+
+        return self._truncate(df) if self.detect_break else df
+
+    @staticmethod
+    def _file_key(fp: Path) -> Tuple[str, ...]:
+        """
+        Identifies a file's current contents by its path, modification
+        time and size, so cached results are dropped if it changes.
+
+        Args:
+            fp (Path): Data file.
+
+        Returns:
+            Tuple[str, ...]: Path, modification time (ns) and size.
+        """
+
+        stat = fp.stat()
+
+        return str(fp), str(stat.st_mtime_ns), str(stat.st_size)
+
+    def _parse_key(self, fp: Path) -> Tuple[str, ...]:
+        """
+        Key of a file's parsed curve in the parse cache: the file and
+        only the settings that change how it's parsed.
+
+        Args:
+            fp (Path): Data file.
+
+        Returns:
+            Tuple[str, ...]: Cache key.
+        """
+
+        settings = (
+            self.id_row,
+            self.header,
+            self.stress_col,
+            self.strain_col,
+            self.stress_units,
+            self.strain_units,
+            self.detect_break,
+        )
+
+        return self._file_key(fp) + (repr(settings),)
+
+    def _parse(self, fp: Path) -> pd.DataFrame:
+        """
+        Loads the columns summarise needs from a file, reusing the curve
+        parsed by an earlier call if none of the settings that change how
+        it's parsed (columns, units, header etc.) have changed since.
+
+        The least recently used curves are dropped once they take up more
+        than PARSE_CACHE_BYTES.
+
+        Args:
+            fp (Path): csv file to load.
+
+        Returns:
+            pd.DataFrame: The specimen's data, as _load. Shared with the cache
+                so mustn't be modified.
+        """
+
+        usecols = self._summary_cols(fp)
+        key = self._parse_key(fp)
+
+        if key in self._parsed:
+            self._parsed.move_to_end(key)
+            return self._parsed[key]
+
+        df = self._load(fp, usecols=usecols)
+        self._keep_parsed(key, df)
+
+        return df
+
+    def _keep_parsed(self, key: Tuple[str, ...], df: pd.DataFrame) -> None:
+        """
+        Adds a parsed curve to the parse cache, dropping the least recently
+        used curves once they take up more than PARSE_CACHE_BYTES.
+
+        Args:
+            key (Tuple[str, ...]): Parse key, see _parse_key.
+            df (pd.DataFrame): The curve, as _parse would return it.
+        """
+
+        if key in self._parsed:
+            self._parsed_bytes -= int(self._parsed.pop(key).memory_usage().sum())
+
+        self._parsed[key] = df
+        self._parsed_bytes += int(df.memory_usage().sum())
+        while self._parsed_bytes > PARSE_CACHE_BYTES and len(self._parsed) > 1:
+            _, dropped = self._parsed.popitem(last=False)
+            self._parsed_bytes -= int(dropped.memory_usage().sum())
+
+    def _keep_summary_cols(self, fp: Path, df: pd.DataFrame) -> None:
+        """
+        Keeps the columns summarise needs from a fully loaded file in the
+        parse cache, so summarising after load_all doesn't parse it again.
+
+        Args:
+            fp (Path): The file.
+            df (pd.DataFrame): All its data, as loaded by _load.
+        """
+
+        strain_source, stress_source = self._source_cols()
+        columns = [strain_source, stress_source, "Specimen ID"]
+        columns += [str(self.strain_col), str(self.stress_col)]
+
+        # The rows _load would have kept had it only parsed the source columns
+        self._keep_parsed(
+            self._parse_key(fp),
+            df[list(dict.fromkeys(columns))].dropna(
+                how="all", subset=[strain_source, stress_source]
+            ),
+        )
+
+    def _truncate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cuts a specimen's data off at fracture, dropping everything
+        logged after the break.
+
+        The break is the last point before the stress, after the peak, first
+        falls below BREAK_FRACTION of the peak. If it never does (e.g. the
+        machine stopped the test itself), nothing is dropped.
+
+        Args:
+            df (pd.DataFrame): Specimen's data.
+
+        Returns:
+            pd.DataFrame: Data up to and including the break.
+        """
+
+        stress = df[self.stress_col].to_numpy(dtype=float)
+        if np.isnan(stress).all():
+            return df
+
+        peak = int(np.nanargmax(stress))
+        dropped = np.flatnonzero(stress[peak:] < BREAK_FRACTION * stress[peak])
+
+        if len(dropped) == 0:
+            return df
+
+        return df.iloc[: peak + dropped[0]].copy()
+
+    def _header_line(self, fp: Path) -> int:
+        """
+        Line number of the table header counting blank lines, which
+        'header' (like pandas) doesn't.
+
+        Args:
+            fp (Path): csv file.
+
+        Raises:
+            ValueError: If the file has fewer than 'header' rows.
+
+        Returns:
+            int: 0-indexed line number of the header.
+        """
+
+        with _open_text(fp) as f:
+            reader = csv.reader(f)
+            rows = (reader.line_num - 1 for row in reader if row)
+            line = next(itertools.islice(rows, self.header, None), None)
+
+        if line is None:
+            raise ValueError(f"No header row {self.header} in file: {str(fp)}")
+
+        return line
+
+    def _scan(self, fp: Path, usecols: Optional[List[str]] = None) -> "pl.LazyFrame":
+        """
+        Polars backend version of _load: lazily loads, cleans and converts
+        the units of a single data file.
+
+        Nothing is read until the frame is collected. Compressed files are
+        first streamed to a decompressed copy to scan (see _decompressed), so
+        their text is never held in memory.
+
+        Args:
+            fp (Path): csv file to load.
+
+            usecols (List[str], optional): Only load these columns.
+                If not passed, all the columns are loaded.
+
+        Returns:
+            pl.LazyFrame: Specimen's data with each row's label in
+                backends.ROW_COL.
+        """
+
+        pl = backends.import_polars()
+
+        source = fp
+        if fp.suffix.lower() in COMPRESSION_SUFFIXES:
+            source = self._decompressed(fp)
+
+        lf = backends.scan_csv(source, skip_rows=self._header_line(fp))
+
+        if not self.stress_col or not self.strain_col:
+            # Only the column names are needed for detection
+            columns = lf.collect_schema().names()
+            self._get_stress_strain_cols(pd.DataFrame(columns=columns))
+
+        if usecols:
+            lf = lf.select([backends.ROW_COL, *usecols])
+
+        strain_factor, stress_factor = self._unit_factors(fp)
+
+        strain_source, stress_source = self._source_cols()
+
+        lf = backends.to_numeric(lf).with_columns(
+            (pl.col(strain_source) * strain_factor).alias(str(self.strain_col)),
+            (pl.col(stress_source) * stress_factor).alias(str(self.stress_col)),
+        )
+
+        if self.detect_break:
+            lf = backends.truncate_at_break(lf, str(self.stress_col), BREAK_FRACTION)
+
+        return lf
+
+    def _decompressed(self, fp: Path) -> Path:
+        """
+        Decompresses a compressed file to a temporary copy polars can scan,
+        streaming it across in DECOMPRESS_CHUNK sized pieces.
+
+        The copy is reused until the file changes and is deleted along with
+        this object. Each process (e.g. report workers) keeps its own copies.
+
+        Args:
+            fp (Path): Compressed csv file.
+
+        Returns:
+            Path: Decompressed copy.
+        """
+
+        if (
+            self._scratch is None
+            or self._scratch[0] != os.getpid()
+            or not os.path.isdir(self._scratch[1])
+        ):
+            folder = tempfile.mkdtemp(prefix="pymechtest-")
+            weakref.finalize(self, shutil.rmtree, folder, ignore_errors=True)
+            self._scratch = (os.getpid(), folder)
+
+        name = hashlib.sha256(repr(self._file_key(fp)).encode()).hexdigest()
+        copy = Path(self._scratch[1], name + ".csv")
+
+        if not copy.exists():
+            partial = copy.with_suffix(".part")
+            with _open_text(fp) as src, open(partial, "w") as dst:
+                shutil.copyfileobj(src, dst, DECOMPRESS_CHUNK)
+            partial.replace(copy)
+
+        return copy
+
+    def _find_modulus_window(self, df: pd.DataFrame) -> Tuple[float, float]:
+        """
+        Finds the strain bounds of the most linear section of a specimen's
+        curve before its maximum stress.
+
+        Every window of a fixed number of consecutive points is scored by the
+        R^2 of its least squares line. The sums each fit needs are all taken
+        from running cumulative sums, so every window is scored in one O(n)
+        vectorised pass rather than refitting each one.
+
+        The window spans as many points as lie between strain1 and strain2
+        (at least MIN_WINDOW_POINTS). If the curve is too short for that,
+        strain1 and strain2 are returned unchanged.
+
+        Args:
+            df (pd.DataFrame): DataFrame for the specimen.
+
+        Returns:
+            Tuple[float, float]: Lower and upper strain bounds.
+        """
+
+        data = df[[self.strain_col, self.stress_col]].dropna()
+        x = data[self.strain_col].to_numpy(dtype=float)
+        y = data[self.stress_col].to_numpy(dtype=float)
+
+        # Only search the curve up to the maximum stress
+        end = int(np.argmax(y)) + 1 if len(y) else 0
+        x, y = x[:end], y[:end]
+
+        n_window = max(
+            int(((x >= self.strain1) & (x <= self.strain2)).sum()), MIN_WINDOW_POINTS
+        )
+
+        if len(x) < n_window:
+            return self.strain1, self.strain2
+
+        # Centre the data to limit cancellation in the differenced sums
+        x_c = x - x.mean()
+        y_c = y - y.mean()
+
+        def window_sums(a: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+            cumulative = np.concatenate([[0.0], np.cumsum(a)])
+            return np.asarray(cumulative[n_window:] - cumulative[:-n_window])
+
+        sx, sy = window_sums(x_c), window_sums(y_c)
+        sxx = window_sums(x_c * x_c) - sx * sx / n_window
+        syy = window_sums(y_c * y_c) - sy * sy / n_window
+        sxy = window_sums(x_c * y_c) - sx * sy / n_window
+
+        valid = (sxx > 0) & (syy > 0) & (sxy > 0)
+
+        if not valid.any():
+            return self.strain1, self.strain2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_squared = np.where(valid, sxy * sxy / (sxx * syy), -np.inf)
+            slope = np.where(valid, sxy / sxx, -np.inf)
+
+        # Post-yield sections can be very linear too, so pick the steepest
+        # of the sufficiently linear windows. Falls back to the most linear
+        # window if none are linear enough (e.g. very noisy data)
+        linear = r_squared >= min(MIN_R_SQUARED, r_squared.max())
+        start = int(np.argmax(np.where(linear, slope, -np.inf)))
+        window = x[start : start + n_window]
+
+        return float(window.min()), float(window.max())
+
+    def _modulus_window(self, df: pd.DataFrame) -> Tuple[float, float]:
+        """
+        The strain bounds to calculate the modulus between, either
+        strain1 and strain2 or the automatically detected window.
+
+        Args:
+            df (pd.DataFrame): DataFrame for the specimen.
+
+        Returns:
+            Tuple[float, float]: Lower and upper strain bounds.
+        """
+
+        if self.auto_modulus:
+            return self._find_modulus_window(df)
+
+        return self.strain1, self.strain2
+
+    def _curve(self, df: pd.DataFrame) -> calculators.Curve:
+        """
+        Wraps a specimen's data up as a Curve for the calculators.
+
+        Args:
+            df (pd.DataFrame): DataFrame for the specimen.
+
+        Returns:
+            calculators.Curve: The specimen's curve.
+        """
+
+        strain1, strain2 = self._modulus_window(df)
+
+        return calculators.Curve(
+            strain=df[self.strain_col].to_numpy(dtype=float),
+            stress=df[self.stress_col].to_numpy(dtype=float),
+            labels=df.index.to_numpy(),
+            strain1=strain1,
+            strain2=strain2,
+        )
+
+    def _calculators(self) -> List[calculators.Calculator]:
+        """
+        The additional calculation methods requested with 'methods',
+        plus the strain at break if detect_break.
+
+        Raises:
+            ValueError: If any of the methods don't exist.
+
+        Returns:
+            List[calculators.Calculator]: Calculation methods.
+        """
+
+        methods = [calculators.get_calculator(name) for name in self.methods or []]
+
+        if self.detect_break and "break" not in [m.name for m in methods]:
+            methods.append(calculators.get_calculator("break"))
+
+        return methods
+
+    def _calc_slope(self, df: pd.DataFrame) -> Tuple[float, float]:
+        """
+        Calculates the slope and the intercept of the linear portion
+        of the stress-strain curve.
+
+        Uses numpy to calculate the slope and intercept
+        from a single specimen's data using strain1 and strain2
+        (or the automatically detected window if auto_modulus)
+        as the upper and lower limits.
+
+        Args:
+            df (pd.DataFrame): DataFrame for the specimen.
+
+        Returns:
+            Tuple[float, float]: slope, intercept.
+        """
+
+        return self._curve(df).fit
+
+    def _calc_modulus(self, df: pd.DataFrame) -> float:
+        """
+        Uses the calc slope method to get elastic modulus in GPa.
+
+        Stress and strain are converted to MPa and % as they're loaded
+        so this always works.
+
+        Args:
+            df (pd.DataFrame): Input df passed to _calc_slope.
+
+        Returns:
+            float: Elastic Modulus in GPa.
+        """
+
+        return calculators.modulus(self._curve(df))
+
+    def _calc_yield(self, df: pd.DataFrame, offset: float = 0.2) -> float:
+        """
+        Calculates the % offset yield strength for a specimen who's data is contained
+        in 'df'.
+
+        Args:
+            df (pd.DataFrame): DataFrame containing single specimens' data.
+
+            offset (float, optional): Strain offset to apply (%). Defaults to 0.2.
+
+        Returns:
+            float: Offset yield strength in MPa
+        """
+
+        if not self.expect_yield:
+            raise AttributeError(
+                f"""Cannot calculate yield strength when expect_yield is False.
+                expect_yield = {self.expect_yield}"""
+            )
+
+        return calculators.offset_yield(self._curve(df), offset=offset)
+
+    def _extract_values(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Extracts key test values from a specimens' data.
+
+        The curve is wrapped up once and every calculation
+        (including any additional 'methods') shares it.
+
+        Uses a pd.Series to make summarising in a dataframe later
+        much easier.
+
+        Args:
+            df (pd.DataFrame): Specimens' data
+
+        Returns:
+            pd.Series: Series of key test values.
+        """
+
+        # Only one specimen in df here so specimen ID is constant for each
+        spec_id = df["Specimen ID"].iloc[0]
+        curve = self._curve(df)
+
+        if not self.jit:
+            return self._curve_values(spec_id, df[self.stress_col].max(), curve)
+
+        uts, slope, intercept, yield_strength = kernels.curve_metrics(
+            curve.strain,
+            curve.stress,
+            curve.labels,
+            curve.strain1,
+            curve.strain2,
+            offset=0.2 if self.expect_yield else None,
+        )
+        curve = calculators.Curve(
+            strain=curve.strain,
+            stress=curve.stress,
+            labels=curve.labels,
+            strain1=curve.strain1,
+            strain2=curve.strain2,
+            fit=(slope, intercept),
+        )
+
+        return self._curve_values(spec_id, uts, curve, yield_strength=yield_strength)
+
+    def _curve_values(
+        self,
+        spec_id: str,
+        uts: float,
+        curve: calculators.Curve,
+        yield_strength: Optional[float] = None,
+    ) -> pd.Series:
+        """
+        Builds a specimen's summary from its strength and curve.
+
+        Args:
+            spec_id (str): Specimen ID.
+            uts (float): Strength.
+            curve (calculators.Curve): The specimen's curve.
+            yield_strength (float, optional): 0.2% offset yield strength if it's
+                already been calculated. If not passed, it's calculated
+                from the curve.
+
+        Returns:
+            pd.Series: Series of key test values.
+        """
+
+        cols = ["Specimen ID", "Strength", "Modulus"]
+        vals = [spec_id, uts, calculators.modulus(curve)]
+
+        if self.auto_modulus:
+            cols.extend(["Modulus Strain1", "Modulus Strain2"])
+            vals.extend([curve.strain1, curve.strain2])
+
+        if self.expect_yield:
+            cols.append("Yield Strength")
+            vals.append(
+                calculators.offset_yield(curve)
+                if yield_strength is None
+                else yield_strength
+            )
+
+        for calculator in self._calculators():
+            cols.append(calculator.column)
+            vals.append(calculator.func(curve))
+
+        if self.screen:
+            for col, val in screening.diagnostics(curve).items():
+                cols.append(col)
+                vals.append(val)
+
+        data_dict = collections.OrderedDict(
+            {col: val for (col, val) in zip(cols, vals)}
+        )
+
+        return pd.Series(data=data_dict)
+
+    def _reduce(self, fp: Path) -> pd.DataFrame:
+        """
+        Streams a specimen's strain and stress columns in chunks keeping
+        only the rows needed for an elastic to failure summary: those
+        between strain1 and strain2 (for the modulus) and the row with the
+        highest stress (for the strength).
+
+        The chunks are also kept until they take up more than
+        PARSE_CACHE_BYTES, and if the whole curve fits it goes in the parse cache
+        (see _parse) so summarising again with e.g. a different modulus window
+        doesn't read the file again. Larger curves are never held in memory.
+
+        Args:
+            fp (Path): csv file to reduce.
+
+        Returns:
+            pd.DataFrame: The reduced specimen data, suitable for _extract_values.
+        """
+
+        usecols = self._summary_cols(fp)
+        factors = self._unit_factors(fp)
+        spec_id = self._get_specimen_id(fp)
+
+        window_chunks: List[pd.DataFrame] = []
+        peak_stress = -np.inf
+        peak_row = pd.DataFrame(columns=usecols)
+
+        curve_chunks: Optional[List[pd.DataFrame]] = []
+        curve_bytes = 0
+
+        with _open_text(fp) as f:
+            for chunk in pd.read_csv(
+                f, header=self.header, usecols=usecols, chunksize=CHUNKSIZE
+            ):
+                chunk = self._convert_units(
+                    self._clean(chunk).assign(**{"Specimen ID": spec_id}), factors
+                )
+
+                if curve_chunks is not None:
+                    curve_chunks.append(chunk)
+                    curve_bytes += int(chunk.memory_usage().sum())
+                    if curve_bytes > PARSE_CACHE_BYTES:
+                        curve_chunks = None
+
+                in_window = (chunk[self.strain_col] >= self.strain1) & (
+                    chunk[self.strain_col] <= self.strain2
+                )
+                window_chunks.append(chunk[in_window])
+
+                # Running maximum, window rows are kept anyway so don't duplicate
+                stress = chunk[self.stress_col]
+                if stress.max() > peak_stress:
+                    peak_stress = stress.max()
+                    peak_index = [stress.idxmax()]
+                    peak_row = chunk.loc[peak_index][~in_window.loc[peak_index]]
+
+        if curve_chunks:
+            curve = pd.concat(curve_chunks)
+            self._keep_parsed(
+                self._parse_key(fp),
+                self._truncate(curve) if self.detect_break else curve,
+            )
+
+        df = pd.concat(window_chunks + [peak_row])
+        df["Specimen ID"] = spec_id
+
+        return df
+
+    def _summarise_file(self, fp: Path) -> pd.Series:
+        """
+        Extracts the summary values for a single specimen's data file.
+
+        Only the strain and stress columns are parsed. If none of the
+        calculations need the whole curve, the file is streamed through _reduce,
+        which only keeps the curve if it fits in the parse cache. The yield
+        calculations and the automatic modulus window need the whole curve so in
+        those cases the two columns are loaded in full. Either way, a curve
+        that's already in the parse cache isn't read again.
+
+        Args:
+            fp (Path): csv file to summarise.
+
+        Returns:
+            pd.Series: Series of key test values.
+        """
+
+        full_curve = any(c.full_curve for c in self._calculators()) or bool(self.screen)
+        parsed = self._parse_key(fp) in self._parsed if self.stress_col else False
+
+        if self.expect_yield or self.auto_modulus or full_curve or parsed:
+            return self._extract_values(self._parse(fp))
+
+        return self._extract_values(self._reduce(fp))
+
+    def load_all(self) -> pd.DataFrame:
+        """
+        Loads all the found files in 'folder' into a dataframe.
+
+        Recursively searches 'folder' for all csv files (including compressed
+        ones), grabs the specimen identifier specified during 'id_row' and includes
+        this in the dataframe.
+
+        The strain and stress of each file are kept in the parse cache (see
+        _parse) too, so a summarise straight after doesn't parse anything again.
+
+        Returns:
+            pd.DataFrame: All found test data with specimen identifier.
+        """
+
+        if self._polars():
+            df = self._load_all_polars()
+        else:
+            frames = []
+            for f in self._find_files():
+                frames.append(self._load(f))
+                self._keep_summary_cols(f, frames[-1])
+            df = pd.concat(frames)
+
+        df = (
+            df.assign(spec_id=lambda x: pd.Categorical(x["Specimen ID"]))
+            .drop(columns=["Specimen ID"])
+            .rename(columns={"spec_id": "Specimen ID"})
+        )
+
+        # Reorder the columns for OCD reasons
+        col = df.pop("Specimen ID")
+        df.insert(0, "Specimen ID", col)
+
+        self._cache["load_all"] = (repr(self), df)
+
+        return df
+
+    def _polars(self) -> bool:
+        """
+        Whether to use the polars backend.
+
+        Raises:
+            ValueError: If backend isn't recognised.
+
+        Returns:
+            bool: True if backend is "polars".
+        """
+
+        return backends.check_backend(self.backend)
+
+    def _load_all_polars(self) -> pd.DataFrame:
+        """
+        Polars backend version of load_all's loading and concatenation,
+        every file is loaded in parallel.
+
+        Returns:
+            pd.DataFrame: All found test data with specimen identifier, indexed
+                like the pandas backend.
+        """
+
+        pl = backends.import_polars()
+
+        files = self._find_files()
+        frames = [
+            self._scan(f).with_columns(
+                pl.lit(self._get_specimen_id(f)).alias("Specimen ID")
+            )
+            for f in files
+        ]
+
+        if not frames:
+            raise ValueError(f"No data files found in {str(self.folder)}")
+
+        collected = pl.collect_all(frames)
+
+        for f, frame in zip(files, collected):
+            self._keep_summary_cols(f, self._to_pandas(frame))
+
+        return self._to_pandas(pl.concat(collected, how="diagonal_relaxed"))
+
+    @staticmethod
+    def _to_pandas(frame: "pl.DataFrame") -> pd.DataFrame:
+        """
+        Converts data loaded by the polars backend to pandas, indexed like
+        the pandas backend.
+
+        Args:
+            frame (pl.DataFrame): Data with each row's label in backends.ROW_COL.
+
+        Returns:
+            pd.DataFrame: The data.
+        """
+
+        df = frame.to_pandas().set_index(backends.ROW_COL)
+        df.index = df.index.astype("int64").rename(None)
+
+        return df
+
+    def _summarise_polars(self, files: List[Path]) -> List[pd.Series]:
+        """
+        Polars backend version of summarising each file.
+
+        Every file's strain and stress are loaded and the strength and the
+        least squares fit through the modulus window are aggregated for every
+        specimen in parallel. The curves themselves are only converted to
+        numpy if anything else (yield strength, the automatic modulus
+        window or additional methods) needs them.
+
+        Args:
+            files (List[Path]): Files to summarise.
+
+        Returns:
+            List[pd.Series]: Series of key test values for each file.
+        """
+
+        pl = backends.import_polars()
+
+        data = pl.concat(
+            [
+                self._scan(f, usecols=self._summary_cols(f)).with_columns(
+                    pl.lit(i).alias(backends.FILE_COL)
+                )
+                for i, f in enumerate(files)
+            ]
+        )
+        strain_col, stress_col = str(self.strain_col), str(self.stress_col)
+
+        aggregated = (
+            data.group_by(backends.FILE_COL)
+            .agg(
+                backends.fit_aggregations(
+                    strain_col, stress_col, self.strain1, self.strain2
+                )
+            )
+            .fill_null(float("nan"))
+        )
+
+        needs_curve = (
+            self.expect_yield
+            or self.auto_modulus
+            or bool(self._calculators())
+            or bool(self.screen)
+        )
+
+        if needs_curve:
+            curves, aggs = pl.collect_all([data, aggregated])
+            parts = curves.partition_by(backends.FILE_COL, as_dict=True)
+        else:
+            aggs = aggregated.collect()
+
+        values = {row[backends.FILE_COL]: row for row in aggs.iter_rows(named=True)}
+
+        rows = []
+        for i, f in enumerate(files):
+            if i not in values:
+                raise ValueError(f"No data found in file: {str(f)}")
+
+            row = values[i]
+            fit = (row["Slope"], row["Intercept"])
+
+            if not needs_curve:
+                # Only the fit is needed for the modulus
+                curve = calculators.Curve(
+                    strain=np.empty(0),
+                    stress=np.empty(0),
+                    labels=np.empty(0, dtype="int64"),
+                    strain1=self.strain1,
+                    strain2=self.strain2,
+                    fit=fit,
+                )
+            elif self.auto_modulus:
+                part = parts[(i,)].to_pandas().set_index(backends.ROW_COL)
+                curve = self._curve(part)
+            else:
+                part = parts[(i,)]
+                curve = calculators.Curve(
+                    strain=part[strain_col].to_numpy(),
+                    stress=part[stress_col].to_numpy(),
+                    labels=part[backends.ROW_COL].to_numpy().astype("int64"),
+                    strain1=self.strain1,
+                    strain2=self.strain2,
+                    fit=fit,
+                )
+
+            rows.append(
+                self._curve_values(self._get_specimen_id(f), row["Strength"], curve)
+            )
+
+        return rows
+
+    def summarise(
+        self,
+        by: Optional[Union[str, List[str]]] = None,
+        store: Optional[Union[Path, str, results.ResultsStore]] = None,
+        errors: str = "raise",
+        checkpoint: Optional[Union[Path, str]] = None,
+    ) -> pd.DataFrame:
+        """
+        High level summary method, generates a dataframe containing key
+        test values such as UTS, Modulus etc. for all the data in the
+        target folder.
+
+        Files that fail to summarise (e.g. a malformed csv) are handled
+        according to 'errors', with "skip" or "collect" the rest of the batch
+        is still summarised and the failed files, and why, are left in the
+        'errors' attribute. Only the files that succeeded are saved to 'store'
+        and remembered for the next call, so rerunning after fixing the bad
+        files only summarises those.
+
+        For long runs, pass a 'checkpoint' file and the specimens are saved to
+        it every CHECKPOINT_BATCH files. If the run is interrupted, running it
+        again with the same settings and checkpoint only summarises the files
+        that weren't saved (or have changed since).
+
+        Args:
+            by (Union[str, List[str]], optional): Grouping key(s) to include as
+                columns after the Specimen ID e.g. lot, temperature etc.
+                "Folder" is the specimen's subfolder relative to 'folder',
+                anything else is the name of a metadata row above the
+                table header (e.g. "Width"). If not passed, no extra
+                columns are included.
+
+            store (Union[Path, str, results.ResultsStore], optional): Results
+                store (or the path to one) to save the summary to, along with
+                each file's metadata and the analysis settings, see
+                pymechtest.results. If not passed, nothing is saved.
+
+            errors (str, optional): What to do when a file fails to summarise.
+                "raise" to stop and raise the error, "skip" to leave the file
+                out of the summary with a warning or "collect" to include it
+                with missing values and the error in an "Error" column.
+                Defaults to "raise".
+
+            checkpoint (Union[Path, str], optional): Checkpoint file to save
+                progress to and resume from, created if it doesn't exist, see
+                pymechtest.checkpoints. If not passed, progress isn't saved.
+
+        Raises:
+            ValueError: If errors isn't one of "raise", "skip" or "collect".
+
+        Returns:
+            pd.DataFrame: Dataframe containing test summary values for each
+                specimen.
+        """
+
+        if errors not in ERROR_POLICIES:
+            raise ValueError(
+                f"errors must be one of {list(ERROR_POLICIES)}. Got: {errors!r}"
+            )
+
+        if self.screen:
+            screening.check_mode(self.screen)
+
+        files = self._find_files()
+
+        if self.dedupe:
+            hashing.check_mode(self.dedupe)
+            originals = hashing.first_copies(self._content_hashes(files, errors))
+            unique = [f for i, f in enumerate(files) if originals[i] == i]
+        else:
+            unique = files
+
+        rows = self._analyse(unique, errors=errors, checkpoint=checkpoint)
+
+        if self.dedupe == "flag":
+            rows = self._duplicate_rows(files, originals, rows)
+        else:
+            files = unique
+
+        # .T transposes to that it's the expected dataframe format
+        df = (pd.concat(rows, axis=1, ignore_index=True).T).convert_dtypes()
+
+        if self.dedupe == "flag":
+            df["Duplicate Of"] = pd.array(
+                [
+                    pd.NA if j == i else df.at[j, "Specimen ID"]
+                    for i, j in enumerate(originals)
+                ],
+                dtype="string",
+            )
+
+        failed = self._record_errors(df, files)
+
+        if by:
+            by = [by] if isinstance(by, str) else list(by)
+            keys = pd.DataFrame(
+                [
+                    {} if bad else self._get_group_keys(f, by)
+                    for f, bad in zip(files, failed)
+                ],
+                columns=by,
+            )
+            for i, key in enumerate(by, start=1):
+                df.insert(i, key, keys[key].astype("string"))
+
+        errored = df[failed]
+        df = df[~failed].drop(columns=[ERROR_COL], errors="ignore")
+
+        if self.screen:
+            df = self._screen(df)
+
+        if store is not None:
+            self._store(store, df, [files[i] for i in df.index])
+
+        if errors == "collect" and not errored.empty:
+            columns = [c for c in errored.columns if c in df.columns or c == ERROR_COL]
+            df = pd.concat([df, errored[columns]]).sort_index()
+        elif errors == "skip" and not errored.empty:
+            warnings.warn(
+                f"Skipped {len(errored)} files that failed to summarise, see .errors",
+                stacklevel=2,
+            )
+
+        df = df.reset_index(drop=True)
+
+        if not by and errored.empty:
+            self._cache["summarise"] = (repr(self), df)
+
+        return df
+
+    def _record_errors(
+        self, df: pd.DataFrame, files: List[Path]
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Finds the files in a summary that failed to summarise and records
+        them, and why, in the 'errors' attribute.
+
+        Args:
+            df (pd.DataFrame): Summary, including the "Error" column if any failed.
+            files (List[Path]): Each row's data file.
+
+        Returns:
+            np.ndarray: Whether each row failed.
+        """
+
+        if ERROR_COL not in df.columns:
+            failed = np.zeros(len(df), dtype=bool)
+        else:
+            failed = df[ERROR_COL].notna().to_numpy(dtype=bool)
+
+        self.errors = pd.DataFrame(
+            {
+                "File": [str(f) for f, bad in zip(files, failed) if bad],
+                "Specimen ID": df.loc[failed, "Specimen ID"].tolist(),
+                ERROR_COL: df.loc[failed, ERROR_COL].tolist() if failed.any() else [],
+            }
+        )
+
+        return failed
+
+    def _store(
+        self,
+        store: Union[Path, str, results.ResultsStore],
+        df: pd.DataFrame,
+        files: List[Path],
+    ) -> None:
+        """
+        Saves a summary to a results store.
+
+        Args:
+            store (Union[Path, str, results.ResultsStore]): Results store or
+                the path to one, which is opened and closed again.
+            df (pd.DataFrame): The summary.
+            files (List[Path]): Each row's data file.
+        """
+
+        args = (
+            df,
+            self.__class__.__qualname__,
+            self._settings(),
+            files,
+            [self._get_metadata(f) for f in files],
+        )
+
+        if isinstance(store, results.ResultsStore):
+            store.add(*args)
+        else:
+            with results.ResultsStore(store) as opened:
+                opened.add(*args)
+
+    def _analyse(
+        self,
+        files: List[Path],
+        errors: str = "raise",
+        checkpoint: Optional[Union[Path, str]] = None,
+    ) -> List[pd.Series]:
+        """
+        Summarises each file, reusing the summary from an earlier call
+        with exactly the same settings if the file hasn't changed.
+
+        Only the files that haven't been summarised with these settings (in
+        this session or, if passed, saved to the checkpoint) are summarised,
+        with whichever backend is set. The least recently used summaries are
+        dropped after ANALYSIS_CACHE_SIZE. Failed files (see _summarise_files)
+        are never kept, so they're tried again next time.
+
+        Args:
+            files (List[Path]): Files to summarise.
+            errors (str, optional): Error policy, see summarise.
+                Defaults to "raise".
+            checkpoint (Union[Path, str], optional): Checkpoint file to resume
+                from and save to every CHECKPOINT_BATCH files. Defaults to None.
+
+        Returns:
+            List[pd.Series]: Series of key test values for each file.
+        """
+
+        keys = [self._file_key(f) + (repr(self),) for f in files]
+        missing = [i for i, key in enumerate(keys) if key not in self._analysed]
+        failures: Dict[int, pd.Series] = {}
+
+        # Before any columns are detected, so it matches an interrupted run
+        settings = results.settings_hash(self._settings(), self.__class__.__qualname__)
+
+        if missing and checkpoint is not None:
+            saved = checkpoints.read(checkpoint, settings)
+            for i in missing:
+                if keys[i][:-1] in saved:
+                    self._analysed[keys[i]] = saved[keys[i][:-1]]
+            missing = [i for i in missing if keys[i] not in self._analysed]
+
+        batch = CHECKPOINT_BATCH if checkpoint is not None else len(missing)
+
+        for start in range(0, len(missing), max(batch, 1)):
+            todo = missing[start : start + batch]
+            computed = self._summarise_files([files[i] for i in todo], errors)
+
+            done = []
+            for i, row in zip(todo, computed):
+                if ERROR_COL in row.index:
+                    failures[i] = row
+                    continue
+                # Stress and strain columns may have been detected along the way
+                keys[i] = self._file_key(files[i]) + (repr(self),)
+                self._analysed[keys[i]] = row
+                done.append((keys[i][:-1], row))
+
+            if checkpoint is not None:
+                checkpoints.append(checkpoint, settings, done)
+
+        rows = []
+        for i, key in enumerate(keys):
+            if i in failures:
+                rows.append(failures[i])
+                continue
+            self._analysed.move_to_end(key)
+            rows.append(self._analysed[key])
+
+        while len(self._analysed) > ANALYSIS_CACHE_SIZE:
+            self._analysed.popitem(last=False)
+
+        return rows
+
+    def _summarise_files(self, files: List[Path], errors: str) -> List[pd.Series]:
+        """
+        Summarises files with whichever backend is set, isolating the files
+        that fail unless errors is "raise".
+
+        The polars backend summarises the files together, so if that fails
+        they're summarised again one at a time to find the bad ones. If every
+        file's curve is already parsed (e.g. by load_all), they're summarised
+        from those instead whichever the backend.
+
+        Args:
+            files (List[Path]): Files to summarise.
+            errors (str): Error policy, see summarise.
+
+        Returns:
+            List[pd.Series]: Series of key test values for each file, or for
+                a failed file its Specimen ID (if it could be read) and the
+                error in ERROR_COL.
+        """
+
+        parsed = bool(self.stress_col) and all(
+            self._parse_key(f) in self._parsed for f in files
+        )
+
+        if self._polars() and not parsed:
+            if errors == "raise":
+                return self._summarise_polars(files)
+            try:
+                return self._summarise_polars(files)
+            except Exception:
+                pass
+
+            def summarise_one(fp: Path) -> pd.Series:
+                return self._summarise_polars([fp])[0]
+
+        else:
+            summarise_one = self._summarise_file
+            if errors == "raise":
+                return [summarise_one(f) for f in files]
+
+        rows = []
+        for f in files:
+            try:
+                rows.append(summarise_one(f))
+            except Exception as e:
+                rows.append(self._error_row(f, e))
+
+        return rows
+
+    def _error_row(self, fp: Path, error: Exception) -> pd.Series:
+        """
+        Summary row of a file that failed to summarise.
+
+        Args:
+            fp (Path): The file.
+            error (Exception): Why it failed.
+
+        Returns:
+            pd.Series: The Specimen ID (missing if that couldn't be read either)
+                and the error in ERROR_COL.
+        """
+
+        try:
+            spec_id: Any = self._get_specimen_id(fp)
+        except Exception:
+            spec_id = pd.NA
+
+        return pd.Series(
+            {"Specimen ID": spec_id, ERROR_COL: f"{type(error).__name__}: {error}"}
+        )
+
+    def _duplicate_rows(
+        self, files: List[Path], originals: List[int], rows: List[pd.Series]
+    ) -> List[pd.Series]:
+        """
+        Expands the summary values of the unique files back out to every file,
+        each duplicate getting a copy of its first copy's values.
+
+        Args:
+            files (List[Path]): Every file found.
+            originals (List[int]): Position of each file's first copy,
+                from hashing.first_copies.
+            rows (List[pd.Series]): Summary values of each first copy, in order.
+
+        Returns:
+            List[pd.Series]: Summary values for every file.
+        """
+
+        analysed = {i: row for i, row in zip(sorted(set(originals)), rows)}
+
+        expanded = []
+        for i, f in enumerate(files):
+            row = analysed[originals[i]]
+            if originals[i] != i:
+                row = row.copy()
+                row["Specimen ID"] = self._get_specimen_id(f)
+            expanded.append(row)
+
+        return expanded
+
+    def _screen(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Flags or excludes the specimens in a summary that fail
+        screening, see pymechtest.screening.
+
+        Args:
+            df (pd.DataFrame): Summary including the diagnostic columns.
+
+        Returns:
+            pd.DataFrame: The summary with a "Flags" column if screen is
+                "flag" or without the failed specimens and the diagnostic
+                columns if screen is "exclude", either way with the original
+                index.
+        """
+
+        flags = screening.flags(df)
+
+        if self.screen == "flag":
+            return df.assign(Flags=flags)
+
+        return df[(flags == "").to_numpy(dtype=bool)].drop(
+            columns=list(screening.DIAGNOSTIC_COLUMNS)
+        )
+
+    def sweep(self, strain_windows: Sequence[Tuple[float, float]]) -> pd.DataFrame:
+        """
+        Calculates every specimen's modulus over many strain windows at once,
+        e.g. to see how sensitive the modulus is to strain1 and strain2.
+
+        Each specimen's curve is parsed once (or reused from an earlier call,
+        see _parse) and all the windows are fitted in one vectorised pass
+        with kernels.window_slopes. The moduli are the same as summarise
+        would give with each window as strain1 and strain2.
+
+        Args:
+            strain_windows (Sequence[Tuple[float, float]]): (strain1, strain2)
+                of each window, in %.
+
+        Raises:
+            ValueError: If a window's strain1 is above its strain2.
+
+        Returns:
+            pd.DataFrame: "Specimen ID", "Strain1", "Strain2" and "Modulus",
+                one row per specimen per window.
+        """
+
+        bounds = np.asarray(strain_windows, dtype=float).reshape(-1, 2)
+        strain1, strain2 = bounds[:, 0], bounds[:, 1]
+
+        if (strain1 > strain2).any():
+            raise ValueError(
+                "Each strain window must be (strain1, strain2) with strain1 <= strain2"
+            )
+
+        frames = []
+        for fp in self._find_files():
+            df = self._parse(fp)
+            slopes = kernels.window_slopes(
+                df[self.strain_col].to_numpy(dtype=float),
+                df[self.stress_col].to_numpy(dtype=float),
+                strain1,
+                strain2,
+            )
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "Specimen ID": df["Specimen ID"].iloc[0],
+                        "Strain1": strain1,
+                        "Strain2": strain2,
+                        "Modulus": 0.1 * slopes,
+                    }
+                )
+            )
+
+        if not frames:
+            raise ValueError(f"No data files found in {str(self.folder)}")
+
+        return pd.concat(frames, ignore_index=True)
+
+    def export(
+        self, path: Union[Path, str], format: str = "parquet", errors: str = "raise"
+    ) -> Tuple[Path, Path]:
+        """
+        Exports the curves (as in load_all) and the summary (as in summarise)
+        to files in 'path' that can be queried without loading them whole,
+        e.g. with polars' scan_parquet or DuckDB.
+
+        Each specimen is loaded, written and dropped before the next so
+        only one specimen's data is held in memory. Its strain and stress are
+        kept in the parse cache (see _parse) so the summary, which is exactly
+        what summarise gives (screening, dedupe and all), doesn't parse the files
+        again. Curves are written a specimen at a time (one row group/record
+        batch each) and the summary in batches of SUMMARY_BATCH rows.
+
+        The Specimen ID column, and any other text column of the summary
+        (e.g. "Flags"), is dictionary encoded (categorical) in both files.
+
+        Args:
+            path (Union[Path, str]): Folder to write 'curves' and 'summary' files
+                to, created if it doesn't exist.
+
+            format (str, optional): One of "parquet", "arrow" (Arrow IPC/Feather v2)
+                or "hdf5". "parquet" and "arrow" require pyarrow, "hdf5"
+                requires PyTables. Defaults to "parquet".
+
+            errors (str, optional): What to do when a file fails to load or
+                summarise, see summarise. A file that fails to load is left out
+                of the curves unless errors is "raise". Defaults to "raise".
+
+        Raises:
+            ValueError: If format or errors are not supported or the files
+                don't all have the same columns.
+
+        Returns:
+            Tuple[Path, Path]: Paths of the curves and summary files.
+        """
+
+        if format not in writers.FORMATS:
+            raise ValueError(
+                f"format must be one of {list(writers.FORMATS)}. Got: {format!r}"
+            )
+
+        if errors not in ERROR_POLICIES:
+            raise ValueError(
+                f"errors must be one of {list(ERROR_POLICIES)}. Got: {errors!r}"
+            )
+
+        folder = Path(path)
+        folder.mkdir(parents=True, exist_ok=True)
+        curves_path = folder.joinpath("curves" + writers.FORMATS[format])
+        summary_path = folder.joinpath("summary" + writers.FORMATS[format])
+
+        files = self._find_files()
+
+        # One dictionary shared by every chunk, Arrow IPC files can't
+        # replace a dictionary part way through
+        spec_ids = []
+        for f in files:
+            try:
+                spec_ids.append(self._get_specimen_id(f))
+            except Exception:
+                if errors == "raise":
+                    raise
+        ids = pd.CategoricalDtype(list(dict.fromkeys(spec_ids)))
+
+        curves = writers.make_writer(curves_path, format)
+        try:
+            for f in files:
+                try:
+                    df = self._load(f)
+                except Exception:
+                    if errors == "raise":
+                        raise
+                    continue
+                self._keep_summary_cols(f, df)
+                curves.write(_encode(df.reset_index(drop=True), ids))
+        finally:
+            curves.close()
+
+        summary_df = _encode(self.summarise(errors=errors).reset_index(drop=True), ids)
+
+        summary = writers.make_writer(summary_path, format)
+        try:
+            for start in range(0, len(summary_df), SUMMARY_BATCH):
+                summary.write(summary_df.iloc[start : start + SUMMARY_BATCH])
+        finally:
+            summary.close()
+
+        return curves_path, summary_path
+
+    def stats(
+        self,
+        by: Optional[Union[str, List[str]]] = None,
+        basis: Optional[str] = None,
+        distribution: str = "normal",
+        n_resamples: int = 0,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns a table of summary statistics e.g. mean, std, cov etc.
+        for the data in folder.
+
+        Uses pandas df.describe() to do the bulk of the work, just adds in
+        cov for good measure.
+
+        Optionally adds CMH-17 style basis values and bootstrap confidence
+        intervals on the mean, see pymechtest.stats for the details.
+
+        Args:
+            by (Union[str, List[str]], optional): Grouping key(s), see summarise.
+                If passed, the folder is summarised once and the statistics
+                are calculated for each group, the group values becoming the
+                outer levels of the returned index. If not passed, the whole
+                folder is treated as one population.
+
+            basis (str, optional): 'A' or 'B', if passed adds an e.g. 'B-basis'
+                row to the table with a value for each strength and modulus
+                column (see BASIS_COLUMNS). NaN for the other columns and where
+                there are too few values. If not passed, no basis value is
+                calculated.
+
+            distribution (str, optional): Population distribution assumed for
+                the basis values. One of 'normal', 'lognormal' or 'weibull'.
+                Defaults to 'normal'.
+
+            n_resamples (int, optional): Number of bootstrap resamples used to
+                calculate a confidence interval on the mean. If 0, no interval
+                is calculated. Defaults to 0.
+
+            confidence (float, optional): Confidence level of the bootstrap
+                interval. Defaults to 0.95.
+
+            seed (int, optional): Random seed for reproducible bootstrap intervals.
+
+        Returns:
+            pd.DataFrame: Summary statistics.
+        """
+
+        describe = functools.partial(
+            self._describe,
+            basis=basis,
+            distribution=distribution,
+            n_resamples=n_resamples,
+            confidence=confidence,
+            seed=seed,
+        )
+
+        if not by:
+            return describe(self._unique(self.summarise()))
+
+        by = [by] if isinstance(by, str) else list(by)
+        summary = self._unique(self.summarise(by=by))
+
+        return pd.concat(
+            {
+                key: describe(group.drop(columns=by))
+                for key, group in summary.groupby(by if len(by) > 1 else by[0])
+            },
+            names=by,
+        )
+
+    @staticmethod
+    def _unique(summary: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drops the duplicates flagged by dedupe="flag" from a summary so each
+        specimen is only counted once.
+
+        Args:
+            summary (pd.DataFrame): Output of summarise.
+
+        Returns:
+            pd.DataFrame: The summary without duplicates or "Duplicate Of".
+        """
+
+        if "Duplicate Of" not in summary:
+            return summary
+
+        return summary[summary["Duplicate Of"].isna().to_numpy(dtype=bool)].drop(
+            columns="Duplicate Of"
+        )
+
+    @staticmethod
+    def _describe(
+        summary: pd.DataFrame,
+        basis: Optional[str] = None,
+        distribution: str = "normal",
+        n_resamples: int = 0,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Calculates the statistics table for a single population of
+        specimens, see stats for the arguments.
+
+        Args:
+            summary (pd.DataFrame): Output of summarise for the population.
+
+        Returns:
+            pd.DataFrame: Summary statistics.
+        """
+
+        df = summary.describe()
+
+        df.loc["cov%"] = df.loc["std"] / df.loc["mean"] * 100
+
+        # Reorganise so cov is close to std
+        new_index = ["count", "mean", "std", "cov%", "min", "25%", "50%", "75%", "max"]
+        df = df.reindex(new_index)
+
+        values = summary[df.columns].to_numpy(dtype=float, na_value=np.nan)
+
+        if basis:
+            metrics = [
+                i
+                for i, col in enumerate(df.columns)
+                if BASIS_COLUMNS.fullmatch(str(col))
+            ]
+            row = np.full(len(df.columns), np.nan)
+            row[metrics] = stats.basis_values(
+                values[:, metrics], basis=basis, distribution=distribution
+            )
+            df.loc[f"{basis.upper()}-basis"] = row
+
+        if n_resamples:
+            lower, upper = stats.bootstrap_ci(
+                values, n_resamples=n_resamples, confidence=confidence, seed=seed
+            )
+            df.loc[f"mean {confidence:.0%} CI lower"] = lower
+            df.loc[f"mean {confidence:.0%} CI upper"] = upper
+
+        return df
+
+    def _markers(self, data: pd.DataFrame, summary: pd.DataFrame) -> pd.DataFrame:
+        """
+        Finds each specimen's strength and yield strength points on its curve.
+
+        Both are stresses of actual data points so each is located by position,
+        as the point of the specimen's curve closest to the summary value. The
+        yield point is only searched for up to the strength point, so a point
+        of the same stress after the peak is never picked instead.
+
+        Args:
+            data (pd.DataFrame): Curves, as returned by load_all.
+            summary (pd.DataFrame): Summary, as returned by summarise.
+
+        Returns:
+            pd.DataFrame: Specimen ID, strain, stress and Marker
+                ("Strength" or "Yield Strength") of every point. Empty if the
+                summary has neither.
+        """
+
+        columns = ["Specimen ID", self.strain_col, self.stress_col]
+
+        data = data.reset_index(drop=True)
+        spec_ids = data["Specimen ID"].astype(str)
+        stress = data[self.stress_col].to_numpy(dtype=float)
+
+        summary = summary.assign(**{"Specimen ID": summary["Specimen ID"].astype(str)})
+        summary = summary.set_index("Specimen ID")
+
+        positions: Dict[str, List[int]] = {
+            col: [] for col in ("Strength", "Yield Strength") if col in summary
+        }
+
+        for spec_id, rows in spec_ids.groupby(spec_ids, sort=False).indices.items():
+            curve = stress[rows]
+            if spec_id not in summary.index or np.isnan(curve).all():
+                continue
+
+            end = len(curve)
+            for col, found in positions.items():
+                target = float(summary.at[spec_id, col])
+                if np.isnan(target):
+                    continue
+
+                closest = int(np.nanargmin(np.abs(curve[:end] - target)))
+                found.append(int(rows[closest]))
+                if col == "Strength":
+                    end = closest + 1
+
+        points = [
+            data.loc[found, columns].assign(Marker=col)
+            for col, found in positions.items()
+        ]
+
+        if not points:
+            return pd.DataFrame(columns=columns + ["Marker"])
+
+        return pd.concat(points, ignore_index=True)
+
+    def report(
+        self,
+        path: Union[Path, str],
+        format: str = "html",
+        charts: str = "vega",
+        basis: Optional[str] = None,
+        markers: bool = True,
+        save_method: str = "selenium",
+    ) -> Path:
+        """
+        Writes a static report of the folder: the stress strain curves, stats,
+        summary and analysis settings, see pymechtest.report.
+
+        The data is only loaded once for the whole report. To write reports
+        for lots of folders in parallel, see pymechtest.report.build_reports.
+
+        Args:
+            path (Union[Path, str]): Report file to write e.g. "lot_1.html".
+
+            format (str, optional): "html" or "pdf" (requires WeasyPrint).
+                Defaults to "html".
+
+            charts (str, optional): How the curves are embedded in an HTML report.
+                "vega" for an interactive chart drawn when the page is opened
+                (the vega scripts are inlined, so no network access is needed),
+                "png" for an image (requires the same setup as plot_curves'
+                save_path). PDF reports always use "png". Defaults to "vega".
+
+            basis (str, optional): 'A' or 'B' to include basis values in the
+                stats, see stats. Defaults to None.
+
+            markers (bool, optional): Whether to mark each specimen's strength
+                and yield strength on its curve. Defaults to True.
+
+            save_method (str, optional): altair_saver method for "png" charts,
+                'selenium' or 'node'. Defaults to 'selenium'.
+
+        Raises:
+            ValueError: If format or charts aren't recognised.
+            ImportError: If format is "pdf" and WeasyPrint isn't installed.
+
+        Returns:
+            Path: The report file.
+        """
+
+        return report.write_report(
+            self,
+            path,
+            format=format,
+            charts=charts,
+            basis=basis,
+            markers=markers,
+            save_method=save_method,
+        )
+
+    def plot_curves(
+        self,
+        title: Optional[str] = None,
+        save_path: Optional[Union[str, Path]] = None,
+        save_method: Optional[str] = "selenium",
+        x_label: Optional[str] = None,
+        y_label: Optional[str] = None,
+        height: int = 500,
+        width: int = 750,
+        data: Optional[pd.DataFrame] = None,
+        summary: Optional[pd.DataFrame] = None,
+        markers: bool = False,
+    ) -> Union["alt.Chart", "alt.LayerChart"]:
+        """
+        Creates a nice looking stress strain plot of all the specimens using altair.
+
+        Will use the class name to fill in axis labels if not passed, e.g
+        'Tensile' Strain
+
+        The curves come from 'data' if passed, otherwise from the last call to
+        load_all (if the settings haven't changed since) and only if neither
+        are available are the files loaded again.
+
+        Args:
+            title (str, optional): Title for the plot.
+                Defaults to "{class_name} Stress-Strain Curves".
+
+            save_path (Union[str, Path], optional): str or Pathlike path to save
+                a png of the plot. Requires chrome and selenium. If not passed, plot
+                is simply returned and not saved.
+
+            save_method (str, optional): One of 2 altair save methods:
+                'selenium' or 'node'.
+                if 'selenium' requires a configured geckodriver or chromedriver on PATH.
+                if 'node' requires nodejs installation. Defaults to 'selenium'
+
+            x_label (str, optional): Label for x-axis.
+                Defaults to "{class name}Strain (%)".
+
+            y_label (str, optional): Label for y-axis.
+                Defaults to "{class name}Stress (MPa)".
+
+            height (int, optional): Height of the plot.
+                Defaults to 500.
+
+            width (int, optional): Width of the plot.
+                Defaults to 750.
+
+            data (pd.DataFrame, optional): Already loaded data, as returned
+                by load_all.
+
+            summary (pd.DataFrame, optional): Already calculated summary, as
+                returned by summarise, used for the markers. If not passed, the
+                last call to summarise is used (if the settings haven't changed
+                since) or summarise is called.
+
+            markers (bool, optional): Whether to mark each specimen's strength
+                and (if expect_yield) yield strength on its curve.
+                Defaults to False.
+
+        Returns:
+            Union[alt.Chart, alt.LayerChart]: Stress strain plot, layered
+                with the markers if 'markers'.
+        """
+
+        import altair as alt
+        import altair_data_server  # noqa: F401
+        from altair_saver import save
+
+        # Altair will warn if over 5,000 rows in a notebook. This is cleanest solution.
+        alt.data_transformers.enable("data_server")
+
+        if data is not None:
+            df = data
+        else:
+            cached = self._cached("load_all")
+            df = cached if cached is not None else self.load_all()
+
+        x_col, y_col, default_x_label, default_y_label, default_title = self._axes()
+
+        chart = (
+            alt.Chart(data=df)
             .mark_line(size=1)
             .encode(
-                x=alt.X(f"{self.strain_col}:Q", title=x_label),
-                y=alt.Y(f"{self.stress_col}:Q", title=y_label),
+                x=alt.X(f"{x_col}:Q", title=x_label or default_x_label),
+                y=alt.Y(f"{y_col}:Q", title=y_label or default_y_label),
                 color=alt.Color("Specimen ID:N", title="Specimen ID"),
             )
-            .properties(title=title, height=height, width=width)
+            .properties(title=title or default_title, height=height, width=width)
         )
 
+        if markers:
+            if summary is None:
+                cached = self._cached("summarise")
+                summary = cached if cached is not None else self.summarise()
+
+            chart = alt.layer(
+                chart,
+                alt.Chart(data=self._markers(df, summary))
+                .mark_point(size=60, filled=True)
+                .encode(
+                    x=f"{self.strain_col}:Q",
+                    y=f"{self.stress_col}:Q",
+                    color=alt.Color("Specimen ID:N", title="Specimen ID"),
+                    shape=alt.Shape("Marker:N", title="Marker"),
+                    tooltip=["Specimen ID:N", "Marker:N", f"{self.stress_col}:Q"],
+                ),
+            )
+
         if save_method not in set(["selenium", "node"]):
             raise ValueError(
                 f"Save method must be one of 'selenium' or 'node'. Got: {save_method}"
@@ -474,3 +2681,73 @@ class BaseMechanicalTest:
             )
 
         return chart
+
+    def view(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        title: Optional[str] = None,
+        x_label: Optional[str] = None,
+        y_label: Optional[str] = None,
+        height: int = 500,
+        width: int = 750,
+        data: Optional[pd.DataFrame] = None,
+        quiet: bool = True,
+    ) -> viewer.ViewerServer:
+        """
+        Starts an interactive viewer of the stress strain curves for large
+        numbers of specimens or very long curves, see pymechtest.viewer.
+
+        Unlike plot_curves, the browser is never sent the raw data. The curves are
+        held here and each zoom or pan of the chart fetches just the visible
+        strain range, decimated to at most viewer.MAX_POINTS points per specimen.
+
+        The viewer runs in a background thread until closed with its close method.
+
+        Args:
+            host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+
+            port (int, optional): Port to listen on, 0 picks a free one.
+                Defaults to 0.
+
+            title (str, optional): Title for the plot.
+                Defaults to "{class_name} Stress-Strain Curves".
+
+            x_label (str, optional): Label for x-axis.
+                Defaults to "{class name}Strain (%)".
+
+            y_label (str, optional): Label for y-axis.
+                Defaults to "{class name}Stress (MPa)".
+
+            height (int, optional): Height of the plot.
+                Defaults to 500.
+
+            width (int, optional): Width of the plot.
+                Defaults to 750.
+
+            data (pd.DataFrame, optional): Already loaded data, as returned
+                by load_all. If not passed, the last call to load_all is used
+                (if the settings haven't changed since) or load_all is called.
+
+            quiet (bool, optional): Don't log every request. Defaults to True.
+
+        Returns:
+            viewer.ViewerServer: The running viewer, open its url in a browser.
+        """
+
+        if data is None:
+            cached = self._cached("load_all")
+            data = cached if cached is not None else self.load_all()
+
+        x_col, y_col, default_x_label, default_y_label, default_title = self._axes()
+
+        page = viewer.viewer_html(
+            title=title or default_title,
+            x_label=x_label or default_x_label,
+            y_label=y_label or default_y_label,
+            height=height,
+            width=width,
+        )
+        index = viewer.CurveIndex(data, x_col, y_col)
+
+        return viewer.ViewerServer((host, port), index, page, quiet=quiet).start()
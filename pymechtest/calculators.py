@@ -0,0 +1,317 @@
+"""
+Registry of modulus and yield strength calculation methods.
+
+Every calculator is a function of a Curve: a specimen's strain and stress
+arrays along with the quantities several methods share (the modulus window,
+its least squares line, the peak and the yield drop). These are each
+computed once per specimen, however many methods are evaluated.
+
+Stress and strain are in MPa and % (see units) so moduli come out in GPa
+and strengths in MPa.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import functools
+import re
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+# Points either side used for the local slope in the slope threshold method
+TANGENT_SPAN = 10
+
+# Fraction of the elastic slope the local slope must fall below for
+# the slope threshold yield
+SLOPE_THRESHOLD = 0.5
+
+# Relative fall in stress taken as the drop after an upper yield point
+YIELD_DROP = 0.005
+
+# Offset yield methods, e.g. "rp0.2", "rp1"
+OFFSET_PATTERN = re.compile(r"rp(\d+(?:\.\d+)?)")
+
+
+class Curve:
+    def __init__(
+        self,
+        strain: npt.NDArray[np.float64],
+        stress: npt.NDArray[np.float64],
+        labels: npt.NDArray[np.int64],
+        strain1: float,
+        strain2: float,
+        fit: Optional[Tuple[float, float]] = None,
+    ) -> None:
+        """
+        A single specimen's stress-strain curve and the quantities shared
+        between calculators, each computed the first time it's needed.
+
+        Args:
+            strain (np.ndarray): Strain (%).
+            stress (np.ndarray): Stress (MPa).
+            labels (np.ndarray): Index labels of the rows the data came from.
+            strain1 (float): Lower strain bound of the modulus window.
+            strain2 (float): Upper strain bound of the modulus window.
+            fit (Tuple[float, float], optional): Slope and intercept through
+                the window if they've already been calculated elsewhere.
+        """
+        self.strain = strain
+        self.stress = stress
+        self.labels = labels
+        self.strain1 = strain1
+        self.strain2 = strain2
+
+        self._window: Optional[npt.NDArray[np.bool_]] = None
+        self._fit: Optional[Tuple[float, float]] = fit
+        self._peak: Optional[int] = None
+        self._yield_drop: Optional[int] = None
+
+    @property
+    def window(self) -> npt.NDArray[np.bool_]:
+        """
+        Mask of the points between strain1 and strain2.
+        """
+        if self._window is None:
+            self._window = (self.strain >= self.strain1) & (self.strain <= self.strain2)
+        return self._window
+
+    @property
+    def fit(self) -> Tuple[float, float]:
+        """
+        Slope and intercept of the least squares line through the window.
+        """
+        if self._fit is None:
+            x = self.strain[self.window]
+            y = self.stress[self.window]
+            A = np.vstack([x, np.ones(len(x))]).T
+            slope, intercept = np.linalg.lstsq(A, y, rcond=None)[0]
+            self._fit = slope, intercept
+        return self._fit
+
+    @property
+    def peak(self) -> int:
+        """
+        Position of the maximum stress.
+        """
+        if self._peak is None:
+            self._peak = int(np.nanargmax(self.stress))
+        return self._peak
+
+    @property
+    def yield_drop(self) -> int:
+        """
+        Position of the first point past the modulus window where the stress
+        falls more than YIELD_DROP below the highest stress so far, -1 if
+        it never does before the peak (i.e. continuous yielding).
+        """
+        if self._yield_drop is None:
+            y = self.stress[: self.peak + 1]
+            running = np.fmax.accumulate(y)
+            drop = (y < running * (1 - YIELD_DROP)) & (
+                self.strain[: self.peak + 1] > self.strain2
+            )
+            self._yield_drop = int(np.argmax(drop)) if drop.any() else -1
+        return self._yield_drop
+
+
+class Calculator(NamedTuple):
+    """
+    A named calculation method.
+
+    Attributes:
+        name (str): Name the method is requested by.
+        column (str): Summary column the result goes in.
+        func (Callable[[Curve], float]): The calculation.
+        full_curve (bool): Whether the method needs the whole curve (True) or
+            only the points in the modulus window and the peak (False), which
+            lets files be streamed rather than loaded.
+    """
+
+    name: str
+    column: str
+    func: Callable[[Curve], float]
+    full_curve: bool
+
+
+CALCULATORS: Dict[str, Calculator] = {}
+
+
+def register(
+    name: str, column: str, full_curve: bool = False
+) -> Callable[[Callable[[Curve], float]], Callable[[Curve], float]]:
+    """
+    Decorator adding a calculation method to the registry.
+
+    Args:
+        name (str): Name the method is requested by (case insensitive).
+        column (str): Summary column the result goes in.
+        full_curve (bool, optional): Whether the method needs the whole curve.
+            Defaults to False.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable[[Curve], float]) -> Callable[[Curve], float]:
+        CALCULATORS[name.lower()] = Calculator(name.lower(), column, func, full_curve)
+        return func
+
+    return decorator
+
+
+def get_calculator(name: str) -> Calculator:
+    """
+    Looks up a calculation method by name.
+
+    Offset yield methods are created on demand from their name,
+    e.g. "rp0.5" is the 0.5% offset yield strength.
+
+    Args:
+        name (str): Method name.
+
+    Raises:
+        ValueError: If there is no method with that name.
+
+    Returns:
+        Calculator: The calculation method.
+    """
+
+    key = name.strip().lower()
+
+    if key in CALCULATORS:
+        return CALCULATORS[key]
+
+    match = OFFSET_PATTERN.fullmatch(key)
+    if match:
+        return Calculator(
+            key,
+            f"Rp{match.group(1)}",
+            functools.partial(offset_yield, offset=float(match.group(1))),
+            True,
+        )
+
+    raise ValueError(
+        f"Unknown method: {name!r}. Must be one of {list(CALCULATORS)} "
+        "or 'rp<offset %>' e.g. 'rp0.2'."
+    )
+
+
+@register("fit", "Fit Modulus")
+def modulus(curve: Curve) -> float:
+    """
+    Elastic modulus: slope of the least squares line through the window.
+    """
+    return 0.1 * curve.fit[0]
+
+
+@register("chord", "Chord Modulus")
+def chord_modulus(curve: Curve) -> float:
+    """
+    Chord modulus: slope between the first and last points of the window.
+    """
+    x, y = curve.strain[curve.window], curve.stress[curve.window]
+    if len(x) < 2:
+        return np.nan
+    return float(0.1 * (y[-1] - y[0]) / (x[-1] - x[0]))
+
+
+@register("secant", "Secant Modulus")
+def secant_modulus(curve: Curve) -> float:
+    """
+    Secant modulus: slope from the origin to the last point of the window.
+    """
+    x, y = curve.strain[curve.window], curve.stress[curve.window]
+    if len(x) == 0:
+        return np.nan
+    return float(0.1 * y[-1] / x[-1])
+
+
+@register("tangent", "Tangent Modulus")
+def tangent_modulus(curve: Curve) -> float:
+    """
+    Tangent modulus at the centre of the window: slope of the least squares
+    line through the middle third of its points.
+    """
+    x, y = curve.strain[curve.window], curve.stress[curve.window]
+    n = max(len(x) // 3, 2)
+    if len(x) < n:
+        return np.nan
+    start = (len(x) - n) // 2
+    return float(0.1 * np.polyfit(x[start : start + n], y[start : start + n], 1)[0])
+
+
+def offset_yield(curve: Curve, offset: float = 0.2) -> float:
+    """
+    Offset yield strength: where the line of the elastic slope, offset
+    by 'offset' % strain, meets the curve.
+    """
+    slope, intercept = curve.fit
+    delta = np.abs(slope * (curve.strain - offset) + intercept - curve.stress)
+    # The point is found by index label then read by position,
+    # as pymechtest always has, so labels (not positions) are needed here
+    return float(curve.stress[curve.labels[np.nanargmin(delta)]])
+
+
+@register("slope threshold", "Slope Threshold Yield", full_curve=True)
+def slope_threshold_yield(curve: Curve) -> float:
+    """
+    Slope threshold yield strength: the stress where the local slope past
+    the window first falls below SLOPE_THRESHOLD of the elastic slope.
+    """
+    x = curve.strain[: curve.peak + 1]
+    y = curve.stress[: curve.peak + 1]
+    if len(x) <= TANGENT_SPAN:
+        return np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        local = (y[TANGENT_SPAN:] - y[:-TANGENT_SPAN]) / (
+            x[TANGENT_SPAN:] - x[:-TANGENT_SPAN]
+        )
+
+    below = (x[:-TANGENT_SPAN] > curve.strain2) & (
+        local < SLOPE_THRESHOLD * curve.fit[0]
+    )
+    if not below.any():
+        return np.nan
+    return float(y[int(np.argmax(below))])
+
+
+@register("reh", "ReH", full_curve=True)
+def upper_yield(curve: Curve) -> float:
+    """
+    Upper yield strength (ReH): the highest stress before the first drop.
+    NaN if the specimen yields continuously.
+    """
+    if curve.yield_drop < 0:
+        return np.nan
+    return float(np.nanmax(curve.stress[: curve.yield_drop]))
+
+
+@register("rel", "ReL", full_curve=True)
+def lower_yield(curve: Curve) -> float:
+    """
+    Lower yield strength (ReL): the lowest stress after the first drop and before
+    the stress climbs back past ReH. NaN if the specimen yields continuously.
+    """
+    if curve.yield_drop < 0:
+        return np.nan
+    reh = upper_yield(curve)
+    after = curve.stress[curve.yield_drop : curve.peak + 1]
+    recovered = np.flatnonzero(after > reh)
+    end = recovered[0] if len(recovered) else len(after)
+    return float(np.nanmin(after[:end]))
+
+
+@register("break", "Strain at Break", full_curve=True)
+def strain_at_break(curve: Curve) -> float:
+    """
+    Strain at break: the strain of the curve's last point. Only the break
+    if the curve has been cut off at fracture (see detect_break), otherwise
+    it's just wherever the data ends.
+    """
+    strain = curve.strain[~np.isnan(curve.strain)]
+    if len(strain) == 0:
+        return np.nan
+    return float(strain[-1])
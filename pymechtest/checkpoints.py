@@ -0,0 +1,122 @@
+"""
+Checkpoint files for long summarise runs, so a run that's interrupted (killed
+by a scheduler, a crash, Ctrl+C) picks up where it left off rather than
+starting again.
+
+A checkpoint is a JSON lines file, each line one summarised specimen:
+
+    {"settings": "<settings hash>", "file": [path, mtime_ns, size], "row": {...}}
+
+Lines are only ever appended (and synced to disk) a batch at a time, so an
+interruption can at worst leave a partly written last line, which is ignored
+when the checkpoint is read back. The settings hash (see results.settings_hash)
+and the file's modification time and size are part of each line, so one
+checkpoint can be shared by runs with different settings and a changed file
+is always summarised again.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def _encode(value: Any) -> Any:
+    """
+    JSON serialisable version of a summary value.
+
+    Args:
+        value (Any): Summary value.
+
+    Returns:
+        Any: The value as a plain python type, None if it's missing.
+    """
+
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is pd.NA:
+        return None
+
+    return value
+
+
+def read(path: Union[Path, str], settings: str) -> Dict[Tuple[str, ...], pd.Series]:
+    """
+    Reads the specimens saved to a checkpoint with a set of settings.
+
+    Args:
+        path (Union[Path, str]): Checkpoint file, which needn't exist yet.
+        settings (str): Settings hash the specimens were summarised with.
+
+    Returns:
+        Dict[Tuple[str, ...], pd.Series]: Each file's summary values, keyed by
+            BaseMechanicalTest._file_key. If a file was saved more than once,
+            the last one.
+    """
+
+    fp = Path(path)
+    if not fp.exists():
+        return {}
+
+    saved = {}
+    with open(fp, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Written when the run was interrupted
+                continue
+            if record["settings"] == settings:
+                saved[tuple(record["file"])] = pd.Series(record["row"], dtype=object)
+
+    return saved
+
+
+def append(
+    path: Union[Path, str],
+    settings: str,
+    rows: Sequence[Tuple[Tuple[str, ...], pd.Series]],
+) -> None:
+    """
+    Saves summarised specimens to a checkpoint, created if it doesn't exist.
+
+    Args:
+        path (Union[Path, str]): Checkpoint file.
+        settings (str): Settings hash the specimens were summarised with.
+        rows (Sequence[Tuple[Tuple[str, ...], pd.Series]]): Each specimen's
+            file key (see BaseMechanicalTest._file_key) and summary values.
+    """
+
+    if not rows:
+        return
+
+    lines = "".join(
+        json.dumps(
+            {
+                "settings": settings,
+                "file": list(key),
+                "row": {str(k): _encode(v) for k, v in row.items()},
+            }
+        )
+        + "\n"
+        for key, row in rows
+    )
+
+    # Start on a new line if the last write was interrupted part way
+    fp = Path(path)
+    if fp.exists() and fp.stat().st_size:
+        with open(fp, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                lines = "\n" + lines
+
+    with open(fp, "a", encoding="utf-8") as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
@@ -0,0 +1,386 @@
+"""
+Command line interface.
+
+Usage:
+    pymechtest summarise <folders...> --type tensile --workers 4 --format csv
+    pymechtest serve --port 8000 --workers 4
+
+Every data file in every folder is summarised through a single process pool
+and each specimen's results are written out as soon as it finishes.
+
+serve runs the local HTTP analysis service, see pymechtest.server.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type
+
+import pandas as pd
+
+from pymechtest import Compression, Flexure, Shear, Tensile, __version__
+from pymechtest.base import BaseMechanicalTest
+
+TEST_TYPES: Dict[str, Type[BaseMechanicalTest]] = {
+    "tensile": Tensile,
+    "compression": Compression,
+    "flexure": Flexure,
+    "shear": Shear,
+}
+
+FORMATS = ("csv", "json", "parquet")
+
+# Errors caused by the data or arguments rather than a bug, reported without
+# a traceback
+USER_ERRORS = (ValueError, KeyError, OSError)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="pymechtest",
+        description="Quick, easy mechanical test data analysis.",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    summarise = commands.add_parser(
+        "summarise",
+        help="Summarise every specimen in one or more folders.",
+        description=(
+            "Summarise every specimen in one or more folders. Results are "
+            "written as each specimen finishes, so their order isn't fixed."
+        ),
+    )
+    summarise.add_argument(
+        "folders", nargs="+", type=Path, help="Folder(s) containing test data."
+    )
+    summarise.add_argument(
+        "--type",
+        dest="test_type",
+        choices=list(TEST_TYPES),
+        default="tensile",
+        help="Type of test. Defaults to tensile.",
+    )
+    summarise.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes. Defaults to 1 (no pool).",
+    )
+    summarise.add_argument(
+        "--format",
+        dest="output_format",
+        choices=FORMATS,
+        default="csv",
+        help=(
+            "Output format. json is one object per line. parquet is written once "
+            "every specimen has finished and requires pyarrow. Defaults to csv."
+        ),
+    )
+    summarise.add_argument(
+        "-o", "--output", type=Path, help="File to write to. Defaults to stdout."
+    )
+
+    options = summarise.add_argument_group("test options")
+    options.add_argument("--id-row", type=int, help="Row number of the specimen ID.")
+    options.add_argument(
+        "--header", type=int, default=0, help="Row number of the table header."
+    )
+    options.add_argument("--stress-col", help="Name of the stress column.")
+    options.add_argument("--strain-col", help="Name of the strain column.")
+    options.add_argument(
+        "--strain1", type=float, default=0.05, help="Lower modulus strain (%%)."
+    )
+    options.add_argument(
+        "--strain2", type=float, default=0.15, help="Upper modulus strain (%%)."
+    )
+    options.add_argument(
+        "--no-yield",
+        dest="expect_yield",
+        action="store_false",
+        help="Specimens are elastic to failure.",
+    )
+    options.add_argument(
+        "--auto-modulus", action="store_true", help="Find the modulus window."
+    )
+    options.add_argument("--stress-units", help="Units of the stress data.")
+    options.add_argument("--strain-units", help="Units of the strain data.")
+    options.add_argument(
+        "--method",
+        dest="methods",
+        action="append",
+        help="Additional calculation method, may be repeated.",
+    )
+
+    serve = commands.add_parser(
+        "serve",
+        help="Run the local HTTP analysis service.",
+        description=(
+            "Run the local HTTP analysis service. POST a specimen's csv file to "
+            "/summarise with the test settings in the query string "
+            "e.g. /summarise?type=tensile&header=8&id_row=3"
+        ),
+    )
+    serve.add_argument(
+        "--host", default="127.0.0.1", help="Host to listen on. Defaults to 127.0.0.1."
+    )
+    serve.add_argument(
+        "--port", type=int, default=8000, help="Port to listen on. Defaults to 8000."
+    )
+    serve.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes. Defaults to 1.",
+    )
+    serve.add_argument("--quiet", action="store_true", help="Don't log every request.")
+    serve.add_argument(
+        "--max-body",
+        type=int,
+        default=None,
+        help="Largest upload accepted in bytes, larger ones get a 413. "
+        "Defaults to 256 MiB.",
+    )
+
+    return parser
+
+
+def _test_kwargs(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Picks the test class arguments out of the parsed command line.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for the test class (bar folder).
+    """
+
+    return {
+        "id_row": args.id_row,
+        "header": args.header,
+        "stress_col": args.stress_col,
+        "strain_col": args.strain_col,
+        "strain1": args.strain1,
+        "strain2": args.strain2,
+        "expect_yield": args.expect_yield,
+        "auto_modulus": args.auto_modulus,
+        "stress_units": args.stress_units,
+        "strain_units": args.strain_units,
+        "methods": args.methods,
+    }
+
+
+def _summarise_file(
+    test_type: str, kwargs: Dict[str, Any], folder: Path, fp: Path
+) -> pd.Series:
+    """
+    Summarises a single file. Module level so it can be sent to worker processes.
+
+    Args:
+        test_type (str): One of TEST_TYPES.
+        kwargs (Dict[str, Any]): Test class keyword arguments.
+        folder (Path): Folder the file was found in.
+        fp (Path): File to summarise.
+
+    Returns:
+        pd.Series: The specimen's summary, with the folder.
+    """
+
+    try:
+        series = TEST_TYPES[test_type](folder=folder, **kwargs)._summarise_file(fp)
+    except USER_ERRORS as e:
+        raise ValueError(f"{fp}: {e}") from e
+
+    return pd.concat([series.iloc[:1], pd.Series({"Folder": str(folder)}), series[1:]])
+
+
+def _iter_results(
+    test_type: str,
+    kwargs: Dict[str, Any],
+    files: List[Tuple[Path, Path]],
+    workers: int,
+) -> Iterator[pd.Series]:
+    """
+    Summarises files, yielding each result as soon as it's ready.
+
+    Args:
+        test_type (str): One of TEST_TYPES.
+        kwargs (Dict[str, Any]): Test class keyword arguments.
+        files (List[Tuple[Path, Path]]): (folder, file) pairs.
+        workers (int): Number of worker processes, 1 runs in this process.
+
+    Yields:
+        pd.Series: Specimen summaries, in the order they finish.
+    """
+
+    if workers <= 1:
+        for folder, fp in files:
+            yield _summarise_file(test_type, kwargs, folder, fp)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_summarise_file, test_type, kwargs, folder, fp)
+            for folder, fp in files
+        ]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            # Don't wait for the rest if anything went wrong
+            for future in futures:
+                future.cancel()
+
+
+def _write(
+    results: Iterator[pd.Series], output_format: str, output: Optional[Path]
+) -> None:
+    """
+    Writes results out in the requested format.
+
+    csv and json (lines) are streamed, a row is written and flushed as each
+    result arrives. parquet isn't a streaming format so it's written at the end.
+
+    Args:
+        results (Iterator[pd.Series]): Specimen summaries.
+        output_format (str): One of FORMATS.
+        output (Optional[Path]): File to write to, stdout if None.
+    """
+
+    if output_format == "parquet":
+        df = pd.DataFrame(list(results)).convert_dtypes()
+        df.to_parquet(output if output else sys.stdout.buffer, index=False)
+        return
+
+    out: IO[str] = open(output, "w", newline="") if output else sys.stdout
+
+    try:
+        for i, series in enumerate(results):
+            if output_format == "csv":
+                series.to_frame().T.to_csv(out, header=i == 0, index=False)
+            else:
+                out.write(series.to_json() + "\n")
+            out.flush()
+    finally:
+        if output:
+            out.close()
+
+
+def _serve(args: argparse.Namespace) -> int:
+    """
+    Runs the serve command.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+
+    Returns:
+        int: Exit code.
+    """
+
+    # Imported here as it's not needed for anything else
+    from pymechtest import server
+
+    def ready(s: server.AnalysisServer) -> None:
+        print(
+            f"Serving on http://{args.host}:{s.server_port} (Ctrl+C to stop)",
+            flush=True,
+        )
+
+    server.serve(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        quiet=args.quiet,
+        ready=ready,
+        max_body=server.MAX_BODY_BYTES if args.max_body is None else args.max_body,
+    )
+
+    return 0
+
+
+def _summarise(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    """
+    Runs the summarise command.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser, for reporting errors.
+        args (argparse.Namespace): Parsed arguments.
+
+    Returns:
+        int: Exit code.
+    """
+
+    if args.output_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.exit(
+                1,
+                "pymechtest: error: parquet output requires pyarrow. "
+                "Install it with 'pip install pymechtest[parquet]'.\n",
+            )
+
+    kwargs = _test_kwargs(args)
+    cls = TEST_TYPES[args.test_type]
+
+    files = [
+        (folder, fp)
+        for folder in args.folders
+        for fp in cls(folder=folder, **kwargs)._find_files()
+    ]
+
+    if not files:
+        parser.exit(1, "pymechtest: error: no data files found.\n")
+
+    try:
+        _write(
+            _iter_results(args.test_type, kwargs, files, args.workers),
+            args.output_format,
+            args.output,
+        )
+    except BrokenPipeError:
+        # Whatever was reading stdout stopped (e.g. '| head'), python would
+        # complain again flushing stdout at exit so point it at devnull
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except USER_ERRORS as e:
+        parser.exit(1, f"pymechtest: error: {e}\n")
+
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Args:
+        argv (Sequence[str], optional): Command line arguments.
+            Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit code.
+    """
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return _serve(args)
+
+    return _summarise(parser, args)
@@ -0,0 +1,503 @@
+"""
+Creep class definition.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import collections
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from pymechtest.base import BaseMechanicalTest, _open_text
+
+# Moments of a group of (x, y) samples, see _moments
+N, MEAN_X, MEAN_Y, M2_X, C_XY = range(5)
+
+# Secondary creep starts at the first point within this factor of the minimum
+# positive rate
+STEADY_STATE_TOLERANCE = 1.1
+
+
+def _moments(
+    bins: npt.NDArray[np.int64], x: npt.NDArray[np.float64], y: npt.NDArray[np.float64]
+) -> Dict[int, npt.NDArray[np.float64]]:
+    """
+    Calculates the count, means and centred second moments of (x, y)
+    for each log time bin in a chunk.
+
+    Centred moments (rather than raw sums of squares) keep the later
+    least squares fits accurate even for months long tests.
+
+    Args:
+        bins (np.ndarray): Bin number of each sample.
+        x (np.ndarray): x values.
+        y (np.ndarray): y values.
+
+    Returns:
+        Dict[int, np.ndarray]: bin: [n, mean_x, mean_y, m2_x, c_xy]
+    """
+
+    if len(bins) == 0:
+        return {}
+
+    offset = bins.min()
+    idx = bins - offset
+
+    n = np.bincount(idx)
+    present = np.flatnonzero(n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_x = np.bincount(idx, weights=x) / n
+        mean_y = np.bincount(idx, weights=y) / n
+
+    dx = x - mean_x[idx]
+    dy = y - mean_y[idx]
+    m2_x = np.bincount(idx, weights=dx * dx)
+    c_xy = np.bincount(idx, weights=dx * dy)
+
+    return {
+        int(b + offset): np.array([n[b], mean_x[b], mean_y[b], m2_x[b], c_xy[b]])
+        for b in present
+    }
+
+
+def _merge(
+    a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Merges the moments of two groups of samples (Chan et al.).
+
+    Args:
+        a (np.ndarray): Moments of the first group.
+        b (np.ndarray): Moments of the second group.
+
+    Returns:
+        np.ndarray: Moments of the combined group.
+    """
+
+    n = a[N] + b[N]
+    if n == 0:
+        return a.copy()
+
+    dx = b[MEAN_X] - a[MEAN_X]
+    dy = b[MEAN_Y] - a[MEAN_Y]
+    weight = a[N] * b[N] / n
+
+    return np.array(
+        [
+            n,
+            a[MEAN_X] + dx * b[N] / n,
+            a[MEAN_Y] + dy * b[N] / n,
+            a[M2_X] + b[M2_X] + dx * dx * weight,
+            a[C_XY] + b[C_XY] + dx * dy * weight,
+        ]
+    )
+
+
+def _fit(moments: List[npt.NDArray[np.float64]]) -> Tuple[float, float]:
+    """
+    Least squares straight line through the samples of several groups.
+
+    Args:
+        moments (List[np.ndarray]): Moments of each group.
+
+    Returns:
+        Tuple[float, float]: slope, intercept. NaN if there aren't enough samples.
+    """
+
+    total = np.zeros(5)
+    for m in moments:
+        total = _merge(total, m)
+
+    if total[N] < 2 or total[M2_X] <= 0:
+        return np.nan, np.nan
+
+    slope = total[C_XY] / total[M2_X]
+
+    return float(slope), float(total[MEAN_Y] - slope * total[MEAN_X])
+
+
+class Creep(BaseMechanicalTest):
+    def __init__(
+        self,
+        folder: Union[Path, str],
+        id_row: Optional[int] = None,
+        strain_col: Optional[str] = None,
+        time_col: Optional[str] = None,
+        header: int = 0,
+        points_per_decade: int = 20,
+        transition_time: Optional[float] = None,
+        chunksize: int = 100_000,
+        strain_units: Optional[str] = None,
+    ) -> None:
+        """
+        Creep test class.
+
+        Each file is one specimen's strain against time log. Files are streamed
+        in chunks and decimated onto a logarithmic time scale as they go, so
+        the raw log is never held in memory.
+
+        The primary creep is fitted with a power law (strain = A * time^m) and
+        the secondary creep with a straight line whose slope is the secondary
+        (minimum) creep rate. Both fits are built up incrementally from
+        statistics accumulated per log time bin.
+
+        Args:
+            folder (Union[Path, str]): String or Path-like folder containing
+                test data.
+
+            id_row (int, optional): Row number of the specimen ID.
+                Most test machines export a headed csv file with some
+                metadata like date, test method name etc. Specimen ID
+                should be contained in this section. If not passed, pymechtest
+                will use the filename as the specimen ID.
+
+            strain_col (str, optional): Name of the column containing strain data.
+                If not passed, pymechtest will try to autodetect it from your data.
+
+            time_col (str, optional): Name of the column containing time data.
+                If not passed, pymechtest will try to autodetect it from your data.
+
+            header (int, optional): 0-indexed row number of the table header
+                (i.e. the row containing things like "Time", "Strain" etc.).
+                Defaults to 0.
+
+            points_per_decade (int, optional): Number of log time bins per decade
+                of time, each bin becomes one point of the decimated curve.
+                Defaults to 20.
+
+            transition_time (float, optional): Time at which primary creep ends and
+                secondary creep begins. If not passed, it is taken as the point the
+                creep rate first comes within 10% of its minimum.
+
+            chunksize (int, optional): Number of rows read from a file at a time.
+                Defaults to 100,000.
+
+            strain_units (str, optional): Units of the strain data e.g. "mm/mm",
+                "microstrain". If not passed, pymechtest reads them from the units
+                row under the table header, falling back to %. Strain is converted
+                to % as it's loaded.
+        """
+        super().__init__(
+            folder=folder,
+            id_row=id_row,
+            strain_col=strain_col,
+            header=header,
+            expect_yield=False,
+            strain_units=strain_units,
+        )
+        self.time_col = time_col
+        self.points_per_decade = points_per_decade
+        self.transition_time = transition_time
+        self.chunksize = chunksize
+
+    def __repr__(self) -> str:
+
+        return (
+            self.__class__.__qualname__ + f"(folder={self.folder!r}, "
+            f"id_row={self.id_row!r}, "
+            f"strain_col={self._strain_col!r}, "
+            f"time_col={self.time_col!r}, "
+            f"header={self.header!r}, "
+            f"points_per_decade={self.points_per_decade!r}, "
+            f"transition_time={self.transition_time!r}, "
+            f"chunksize={self.chunksize!r}, "
+            f"strain_units={self.strain_units!r})"
+        )
+
+    def _summary_cols(self, fp: Path) -> List[str]:
+        """
+        Returns the only columns a creep test needs: time and strain,
+        auto-detecting any that haven't been passed from the header row.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Raises:
+            ValueError: If no match for "time" or "strain" found.
+
+        Returns:
+            List[str]: [time_col, strain_col]
+        """
+
+        if not self.time_col or not self.strain_col:
+            with _open_text(fp) as f:
+                cols = pd.read_csv(f, header=self.header, nrows=0).columns.tolist()
+
+            for col in cols:
+                if not self.time_col and "time" in col.strip().lower():
+                    self.time_col = col
+                if not self.strain_col and "strain" in col.strip().lower():
+                    self.strain_col = col
+
+        if self.time_col is None:
+            raise ValueError("Could not detect time_col.")
+        elif self.strain_col is None:
+            raise ValueError("Could not detect strain_col.")
+
+        return [self.time_col, self.strain_col]
+
+    def _iter_chunks(
+        self, fp: Path
+    ) -> Iterator[Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+        """
+        Streams the time and strain columns of a file in chunks.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: time, strain for each chunk.
+        """
+
+        usecols = self._summary_cols(fp)
+        factors = self._unit_factors(fp)
+
+        with _open_text(fp) as f:
+            for chunk in pd.read_csv(
+                f,
+                header=self.header,
+                usecols=usecols,
+                chunksize=self.chunksize,
+                thousands=",",
+            ):
+                chunk = self._convert_units(self._clean(chunk).dropna(), factors)
+                yield (
+                    chunk[self.time_col].to_numpy(dtype=float),
+                    chunk[self.strain_col].to_numpy(dtype=float),
+                )
+
+    def _accumulate(
+        self, fp: Path
+    ) -> Tuple[Dict[int, npt.NDArray[np.float64]], Dict[int, npt.NDArray[np.float64]]]:
+        """
+        Streams a file into per log time bin statistics.
+
+        Memory use depends only on the number of bins
+        (i.e. decades of time * points_per_decade), not the length of the log.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Returns:
+            Tuple[Dict[int, np.ndarray], Dict[int, np.ndarray]]: Moments of
+                (time, strain) and of (log time, log strain) for each bin.
+        """
+
+        linear: Dict[int, npt.NDArray[np.float64]] = {}
+        log: Dict[int, npt.NDArray[np.float64]] = {}
+
+        for time, strain in self._iter_chunks(fp):
+            # Log time axis is only defined after loading starts
+            positive = time > 0
+            time, strain = time[positive], strain[positive]
+
+            bins = np.floor(self.points_per_decade * np.log10(time)).astype(np.int64)
+
+            for b, m in _moments(bins, time, strain).items():
+                linear[b] = _merge(linear[b], m) if b in linear else m
+
+            creeping = strain > 0
+            for b, m in _moments(
+                bins[creeping], np.log(time[creeping]), np.log(strain[creeping])
+            ).items():
+                log[b] = _merge(log[b], m) if b in log else m
+
+        return linear, log
+
+    def _decimate(self, linear: Dict[int, npt.NDArray[np.float64]]) -> pd.DataFrame:
+        """
+        Turns the per bin statistics into the decimated creep curve, one point
+        (the mean time and strain) per log time bin.
+
+        Args:
+            linear (Dict[int, np.ndarray]): Moments of (time, strain) per bin.
+
+        Returns:
+            pd.DataFrame: Decimated time and strain.
+        """
+
+        moments = np.array([linear[b] for b in sorted(linear)]).reshape(-1, 5)
+
+        return pd.DataFrame(
+            {self.time_col: moments[:, MEAN_X], self.strain_col: moments[:, MEAN_Y]}
+        )
+
+    def _transition_bin(self, linear: Dict[int, npt.NDArray[np.float64]]) -> int:
+        """
+        Finds the log time bin at which secondary creep starts.
+
+        Either the bin containing 'transition_time' or, if not passed, the first
+        bin along the decimated curve whose creep rate is within
+        STEADY_STATE_TOLERANCE of the smallest positive rate. Falls back to the
+        first bin if the strain never increases.
+
+        Args:
+            linear (Dict[int, np.ndarray]): Moments of (time, strain) per bin.
+
+        Raises:
+            ValueError: If there are no samples after loading starts (time > 0).
+
+        Returns:
+            int: Bin number.
+        """
+
+        bins = sorted(linear)
+
+        if self.transition_time is not None:
+            return int(
+                np.floor(self.points_per_decade * np.log10(self.transition_time))
+            )
+
+        if not bins:
+            raise ValueError(
+                f"No samples with a positive {self.time_col!r}, "
+                "could not find secondary creep."
+            )
+
+        if len(bins) < 2:
+            return bins[0]
+
+        curve = self._decimate(linear).to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rate = np.diff(curve[:, 1]) / np.diff(curve[:, 0])
+
+        # A falling strain (e.g. noise or unloading) is never secondary creep
+        creeping = rate > 0
+        if not creeping.any():
+            return bins[0]
+
+        steady = creeping & (rate <= STEADY_STATE_TOLERANCE * np.min(rate[creeping]))
+
+        return bins[int(np.argmax(steady))]
+
+    def _summarise_file(self, fp: Path) -> pd.Series:
+        """
+        Extracts the key creep values from a specimen's data file
+        in a single streamed pass.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Returns:
+            pd.Series: Series of key test values.
+        """
+
+        linear, log = self._accumulate(fp)
+
+        transition = self._transition_bin(linear)
+
+        exponent, log_coefficient = _fit([m for b, m in log.items() if b < transition])
+        rate, _ = _fit([m for b, m in linear.items() if b >= transition])
+
+        curve = self._decimate(linear)
+
+        data: Dict[str, object] = {
+            "Specimen ID": self._get_specimen_id(fp),
+            "Duration": curve[self.time_col].iloc[-1],
+            "Final Strain": curve[self.strain_col].iloc[-1],
+            "Transition Time": 10 ** (transition / self.points_per_decade),
+            "Primary Coefficient": np.exp(log_coefficient),
+            "Primary Exponent": exponent,
+            "Secondary Creep Rate": rate,
+        }
+
+        return pd.Series(data=collections.OrderedDict(data))
+
+    def load_all(self) -> pd.DataFrame:
+        """
+        Loads the log time decimated creep curves of all the found
+        files in 'folder' into a dataframe.
+
+        Unlike the static tests, the raw logs are never loaded. Each point is the
+        mean time and strain of one log time bin.
+
+        Returns:
+            pd.DataFrame: Decimated creep curves with specimen identifier.
+        """
+
+        frames = []
+        for fp in self._find_files():
+            linear, _ = self._accumulate(fp)
+            frames.append(
+                self._decimate(linear).assign(
+                    **{"Specimen ID": self._get_specimen_id(fp)}
+                )
+            )
+
+        df = pd.concat(frames, ignore_index=True)
+        df["Specimen ID"] = pd.Categorical(df["Specimen ID"])
+
+        return df[["Specimen ID", self.time_col, self.strain_col]]
+
+    def _axes(self) -> Tuple[str, str, str, str, str]:
+        """
+        Creep curves are strain against time, see BaseMechanicalTest._axes.
+
+        Returns:
+            Tuple[str, str, str, str, str]: x column, y column, x label,
+                y label and title.
+        """
+
+        return (
+            str(self.time_col),
+            str(self.strain_col),
+            str(self.time_col),
+            "Creep Strain (%)",
+            "Creep Curves",
+        )
+
+    def _markers(self, data: pd.DataFrame, summary: pd.DataFrame) -> pd.DataFrame:
+        """
+        Creep tests have no strength or yield strength to mark.
+
+        Raises:
+            TypeError: Always.
+        """
+
+        raise self._unsupported("plot_curves with markers")
+
+    def sweep(self, strain_windows: Sequence[Tuple[float, float]]) -> pd.DataFrame:
+        """
+        Modulus sweeps don't apply to creep tests.
+
+        Raises:
+            TypeError: Always.
+        """
+
+        raise self._unsupported("sweep")
+
+    def export(
+        self, path: Union[Path, str], format: str = "parquet", errors: str = "raise"
+    ) -> Tuple[Path, Path]:
+        """
+        Exporting isn't supported for creep tests, use load_all and summarise.
+
+        Raises:
+            TypeError: Always.
+        """
+
+        raise self._unsupported("export")
+
+    def report(
+        self,
+        path: Union[Path, str],
+        format: str = "html",
+        charts: str = "vega",
+        basis: Optional[str] = None,
+        markers: bool = True,
+        save_method: str = "selenium",
+    ) -> Path:
+        """
+        Reports aren't supported for creep tests, use plot_curves, summarise
+        and stats.
+
+        Raises:
+            TypeError: Always.
+        """
+
+        raise self._unsupported("report")
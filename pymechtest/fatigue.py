@@ -0,0 +1,465 @@
+"""
+Fatigue class definition.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import collections
+from pathlib import Path
+from typing import DefaultDict, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from pymechtest import kernels, viewer
+from pymechtest.base import BaseMechanicalTest, _open_text
+
+# Type alias for a block of reversals: strain, stress, cumulative energy, is peak
+Reversals = Tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.bool_],
+]
+
+CYCLE_COLS = [
+    "Cycle",
+    "Max Stress",
+    "Min Stress",
+    "Max Strain",
+    "Min Strain",
+    "Stiffness",
+    "Hysteresis Energy",
+]
+
+
+class Fatigue(BaseMechanicalTest):
+    def __init__(
+        self,
+        folder: Union[Path, str],
+        id_row: Optional[int] = None,
+        stress_col: Optional[str] = None,
+        strain_col: Optional[str] = None,
+        header: int = 0,
+        chunksize: int = 100_000,
+        cycle_interval: int = 1,
+        stress_units: Optional[str] = None,
+        strain_units: Optional[str] = None,
+    ) -> None:
+        """
+        Fatigue (cyclic) test class.
+
+        Each file is one specimen's cyclic stress-strain recording. Files are
+        streamed in chunks so even very long recordings are processed in
+        bounded memory.
+
+        Cycles are extracted peak to peak from the stress signal. For each cycle
+        the secant stiffness between the peak and valley (GPa) and the
+        hysteresis energy density of the loop (MJ/m^3) are calculated.
+
+        Args:
+            folder (Union[Path, str]): String or Path-like folder containing
+                test data.
+
+            id_row (int, optional): Row number of the specimen ID.
+                Most test machines export a headed csv file with some
+                metadata like date, test method name etc. Specimen ID
+                should be contained in this section. If not passed, pymechtest
+                will use the filename as the specimen ID.
+
+            stress_col (str, optional): Name of the column containing stress data.
+                If not passed, pymechtest will try to autodetect it from your data.
+
+            strain_col (str, optional): Name of the column containing strain data.
+                If not passed, pymechtest will try to autodetect it from your data.
+
+            header (int, optional): 0-indexed row number of the table header
+                (i.e. the row containing things like "Stress", "Strain", "Load" etc.).
+                Defaults to 0.
+
+            chunksize (int, optional): Number of rows read from a file at a time.
+                Defaults to 100,000.
+
+            cycle_interval (int, optional): Only every nth cycle is kept in the
+                output of cycles(), to keep it small for very long tests.
+                summarise() always uses every cycle. Defaults to 1.
+
+            stress_units (str, optional): Units of the stress data e.g. "kPa", "psi".
+                If not passed, pymechtest reads them from the units row under the
+                table header, falling back to MPa. Stress is converted to MPa
+                as it's loaded.
+
+            strain_units (str, optional): Units of the strain data e.g. "mm/mm",
+                "microstrain". If not passed, pymechtest reads them from the units
+                row under the table header, falling back to %. Strain is converted
+                to % as it's loaded.
+        """
+        super().__init__(
+            folder=folder,
+            id_row=id_row,
+            stress_col=stress_col,
+            strain_col=strain_col,
+            header=header,
+            expect_yield=False,
+            stress_units=stress_units,
+            strain_units=strain_units,
+        )
+        self.chunksize = chunksize
+        self.cycle_interval = cycle_interval
+
+    def __repr__(self) -> str:
+
+        return (
+            self.__class__.__qualname__ + f"(folder={self.folder!r}, "
+            f"id_row={self.id_row!r}, "
+            f"stress_col={self._stress_col!r}, "
+            f"strain_col={self._strain_col!r}, "
+            f"header={self.header!r}, "
+            f"chunksize={self.chunksize!r}, "
+            f"cycle_interval={self.cycle_interval!r}, "
+            f"stress_units={self.stress_units!r}, "
+            f"strain_units={self.strain_units!r})"
+        )
+
+    def _iter_chunks(
+        self, fp: Path
+    ) -> Iterator[Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+        """
+        Streams the strain and stress columns of a file in chunks.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: strain, stress for each chunk.
+        """
+
+        usecols = self._summary_cols(fp)
+        factors = self._unit_factors(fp)
+
+        with _open_text(fp) as f:
+            # thousands means all but the first chunk (with any units row)
+            # are parsed straight to floats by pandas
+            for chunk in pd.read_csv(
+                f,
+                header=self.header,
+                usecols=usecols,
+                chunksize=self.chunksize,
+                thousands=",",
+            ):
+                chunk = self._convert_units(self._clean(chunk).dropna(), factors)
+                yield (
+                    chunk[self.strain_col].to_numpy(dtype=float),
+                    chunk[self.stress_col].to_numpy(dtype=float),
+                )
+
+    def _iter_reversals(self, fp: Path) -> Iterator[Reversals]:
+        """
+        Streams the peaks and valleys (reversals) of a file's stress signal.
+
+        Each chunk is processed with vectorised numpy operations, the only state
+        carried between chunks is the last sample, the current loading direction
+        and the running integral of stress with respect to strain.
+
+        Flat sections are treated as a continuation of the current direction so
+        peaks and valleys always alternate.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Yields:
+            Reversals: strain, stress, cumulative energy and whether each
+                reversal is a peak (True) or a valley (False).
+        """
+
+        last_strain: Optional[float] = None
+        last_stress: Optional[float] = None
+        last_sign = 0.0
+        energy = 0.0
+
+        for strain, stress in self._iter_chunks(fp):
+            if last_strain is not None:
+                # Last sample of the previous chunk couldn't be classified
+                # until now as we didn't know which way the signal went next
+                strain = np.concatenate([[last_strain], strain])
+                stress = np.concatenate([[last_stress], stress])
+
+            if len(stress) < 2:
+                continue
+
+            # Running trapezoidal integral of stress d(strain)
+            cumulative = energy + np.concatenate(
+                [[0.0], np.cumsum(0.5 * (stress[1:] + stress[:-1]) * np.diff(strain))]
+            )
+
+            # Direction of travel, flat sections carry on in the last direction
+            sign = np.sign(np.diff(stress))
+            if sign[0] == 0:
+                sign[0] = last_sign
+            nonzero = np.where(sign != 0, np.arange(len(sign)), 0)
+            np.maximum.accumulate(nonzero, out=nonzero)
+            sign = sign[nonzero]
+
+            previous = np.concatenate([[last_sign], sign[:-1]])
+            is_reversal = (previous != sign) & (previous != 0) & (sign != 0)
+            idx = np.flatnonzero(is_reversal)
+
+            yield strain[idx], stress[idx], cumulative[idx], previous[idx] > 0
+
+            last_strain, last_stress = float(strain[-1]), float(stress[-1])
+            last_sign = float(sign[-1])
+            energy = float(cumulative[-1])
+
+    def _iter_cycles(self, fp: Path) -> Iterator[pd.DataFrame]:
+        """
+        Streams a file's cycles, measured from peak to peak.
+
+        Only the reversals since the last complete cycle are carried between
+        chunks so memory use doesn't depend on the length of the test.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Yields:
+            pd.DataFrame: Cycles completed in each chunk.
+        """
+
+        carry: Optional[Reversals] = None
+        cycle = 0
+
+        for reversals in self._iter_reversals(fp):
+            if carry is not None:
+                reversals = tuple(
+                    np.concatenate([c, r]) for c, r in zip(carry, reversals)
+                )
+
+            strain, stress, cumulative, is_peak = reversals
+            peaks = np.flatnonzero(is_peak)
+
+            if len(peaks) == 0:
+                carry = reversals
+                continue
+
+            carry = tuple(r[peaks[-1] :] for r in reversals)  # type: ignore[assignment]
+
+            if len(peaks) < 2:
+                continue
+
+            # Peaks and valleys alternate so each cycle's valley
+            # is the reversal straight after its first peak
+            start, end = peaks[:-1], peaks[1:]
+            valley = start + 1
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # Same unit conversion as the modulus:
+                # MPa / % -> GPa and MPa * % -> MJ/m^3
+                stiffness = (
+                    0.1
+                    * (stress[start] - stress[valley])
+                    / (strain[start] - strain[valley])
+                )
+
+            n_cycles = len(start)
+
+            yield pd.DataFrame(
+                {
+                    "Cycle": np.arange(cycle + 1, cycle + n_cycles + 1),
+                    "Max Stress": stress[start],
+                    "Min Stress": stress[valley],
+                    "Max Strain": strain[start],
+                    "Min Strain": strain[valley],
+                    "Stiffness": stiffness,
+                    "Hysteresis Energy": 0.01
+                    * np.abs(cumulative[end] - cumulative[start]),
+                },
+                columns=CYCLE_COLS,
+            )
+
+            cycle += n_cycles
+
+    def _rainflow(
+        self, fp: Path, decimals: int = 1
+    ) -> DefaultDict[Tuple[float, float], float]:
+        """
+        Rainflow counts a file's stress reversals (ASTM E1049 three point method).
+
+        Reversals are streamed in a chunk at a time through
+        kernels.rainflow_cycles (compiled with numba if it's installed) so
+        only the rainflow stack of unmatched reversals is held in memory.
+        Cycles are binned by rounding their range and mean to 'decimals'
+        places, a chunk at a time, which keeps the result bounded too.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+            decimals (int, optional): Decimal places to round the range and mean
+                of each cycle to. Defaults to 1.
+
+        Returns:
+            DefaultDict[Tuple[float, float], float]: (range, mean): number
+                of cycles.
+        """
+
+        counts: DefaultDict[Tuple[float, float], float] = collections.defaultdict(float)
+        stack = np.empty(0)
+
+        def count(
+            starts: npt.NDArray[np.float64],
+            ends: npt.NDArray[np.float64],
+            n: npt.NDArray[np.float64],
+        ) -> None:
+            if not len(n):
+                return
+            # Bin the block's cycles first so the dict sees each bin once
+            bins = np.column_stack(
+                [
+                    np.round(np.abs(starts - ends), decimals),
+                    np.round((starts + ends) / 2, decimals),
+                ]
+            )
+            unique, inverse = np.unique(bins, axis=0, return_inverse=True)
+            totals = np.bincount(inverse.ravel(), weights=n)
+            for (r, m), total in zip(unique.tolist(), totals.tolist()):
+                counts[(r, m)] += total
+
+        for _, stress, _, _ in self._iter_reversals(fp):
+            starts, ends, n, stack = kernels.rainflow_cycles(stress, stack)
+            count(starts, ends, n)
+
+        # Whatever is left are half cycles
+        count(stack[:-1], stack[1:], np.full(max(len(stack) - 1, 0), 0.5))
+
+        return counts
+
+    def cycles(self) -> pd.DataFrame:
+        """
+        Per cycle results for every specimen in 'folder': peak and valley stress
+        and strain, secant stiffness (GPa) and hysteresis energy (MJ/m^3).
+
+        Only every 'cycle_interval'th cycle is included.
+
+        Returns:
+            pd.DataFrame: Per cycle results with Specimen ID.
+        """
+
+        frames = []
+        for fp in self._find_files():
+            spec_id = self._get_specimen_id(fp)
+            for df in self._iter_cycles(fp):
+                df = df[(df["Cycle"] - 1) % self.cycle_interval == 0]
+                frames.append(df.assign(**{"Specimen ID": spec_id}))
+
+        df = pd.concat(frames, ignore_index=True)
+        df["Specimen ID"] = pd.Categorical(df["Specimen ID"])
+
+        return df[["Specimen ID"] + CYCLE_COLS]
+
+    def rainflow(self, decimals: int = 1) -> pd.DataFrame:
+        """
+        Rainflow cycle counts of the stress signal for every specimen in 'folder'.
+
+        Args:
+            decimals (int, optional): Decimal places the range and mean of
+                each cycle are rounded to before counting. Defaults to 1.
+
+        Returns:
+            pd.DataFrame: Specimen ID, Range, Mean and Count (half cycles
+                count as 0.5).
+        """
+
+        frames = []
+        for fp in self._find_files():
+            counts = self._rainflow(fp, decimals=decimals)
+            frames.append(
+                pd.DataFrame(
+                    [(r, m, n) for (r, m), n in sorted(counts.items())],
+                    columns=["Range", "Mean", "Count"],
+                ).assign(**{"Specimen ID": self._get_specimen_id(fp)})
+            )
+
+        return pd.concat(frames, ignore_index=True)[
+            ["Specimen ID", "Range", "Mean", "Count"]
+        ]
+
+    def _summarise_file(self, fp: Path) -> pd.Series:
+        """
+        Reduces a specimen's cycles to its key fatigue values as they
+        are streamed.
+
+        Args:
+            fp (Path): Specimen's data file.
+
+        Returns:
+            pd.Series: Series of key test values.
+        """
+
+        n_cycles = 0
+        energy = 0.0
+        initial_stiffness = np.nan
+        final_stiffness = np.nan
+
+        for df in self._iter_cycles(fp):
+            if n_cycles == 0:
+                initial_stiffness = df["Stiffness"].iloc[0]
+            final_stiffness = df["Stiffness"].iloc[-1]
+            n_cycles += len(df)
+            energy += df["Hysteresis Energy"].sum()
+
+        data: Dict[str, object] = {
+            "Specimen ID": self._get_specimen_id(fp),
+            "Cycles": n_cycles,
+            "Initial Stiffness": initial_stiffness,
+            "Final Stiffness": final_stiffness,
+            "Stiffness Retention": final_stiffness / initial_stiffness * 100,
+            "Hysteresis Energy": energy,
+        }
+
+        return pd.Series(data=collections.OrderedDict(data))
+
+    def sweep(self, strain_windows: Sequence[Tuple[float, float]]) -> pd.DataFrame:
+        """
+        Modulus sweeps don't apply to fatigue tests, see cycles for the
+        stiffness of every cycle.
+
+        Raises:
+            TypeError: Always.
+        """
+
+        raise self._unsupported("sweep")
+
+    def export(
+        self, path: Union[Path, str], format: str = "parquet", errors: str = "raise"
+    ) -> Tuple[Path, Path]:
+        """
+        Exporting isn't supported for fatigue tests, use cycles, rainflow
+        and summarise.
+
+        Raises:
+            TypeError: Always.
+        """
+
+        raise self._unsupported("export")
+
+    def view(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        title: Optional[str] = None,
+        x_label: Optional[str] = None,
+        y_label: Optional[str] = None,
+        height: int = 500,
+        width: int = 750,
+        data: Optional[pd.DataFrame] = None,
+        quiet: bool = True,
+    ) -> viewer.ViewerServer:
+        """
+        The viewer's strain range queries don't apply to cyclic curves,
+        see cycles for the per cycle values.
+
+        Raises:
+            TypeError: Always.
+        """
+
+        raise self._unsupported("view")
@@ -6,7 +6,7 @@ Created: 31/12/20
 """
 
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 from pymechtest.base import BaseMechanicalTest
 
@@ -22,6 +22,15 @@ class Flexure(BaseMechanicalTest):
         strain1: float = 0.05,
         strain2: float = 0.15,
         expect_yield: bool = True,
+        auto_modulus: bool = False,
+        stress_units: Optional[str] = None,
+        strain_units: Optional[str] = None,
+        methods: Optional[List[str]] = None,
+        backend: str = "pandas",
+        jit: bool = False,
+        screen: Optional[str] = None,
+        detect_break: bool = False,
+        dedupe: Optional[str] = None,
     ) -> None:
         """
         Tensile test class.
@@ -55,6 +64,61 @@ class Flexure(BaseMechanicalTest):
             expect_yield (bool, optional): Whether the specimens are expected to be
                 elastic to failure (False) or they are expected to have a
                 yield strength (True). Defaults to True.
+
+            auto_modulus (bool, optional): Whether to search each specimen's curve
+                for its most linear section and calculate the modulus from that
+                (True) or to use strain1 and strain2 (False). The automatic window
+                spans as many points as lie between strain1 and strain2 and the
+                chosen bounds are reported in the summary. Defaults to False.
+
+            stress_units (str, optional): Units of the stress data e.g. "kPa", "psi".
+                If not passed, pymechtest reads them from the units row under the
+                table header, falling back to MPa. Stress is converted to MPa
+                as it's loaded.
+
+            strain_units (str, optional): Units of the strain data e.g. "mm/mm",
+                "microstrain". If not passed, pymechtest reads them from the units
+                row under the table header, falling back to %. Strain is converted
+                to % as it's loaded.
+
+            methods (List[str], optional): Additional modulus and yield strength
+                calculation methods to include in the summary, e.g.
+                ["chord", "secant", "rp0.5", "reh"]. See the calculators module
+                for what's available. If not passed, only the elastic modulus
+                and 0.2% offset yield are calculated.
+
+            backend (str, optional): Dataframe library used to parse, clean and
+                aggregate the data in load_all and summarise. "pandas" or "polars"
+                (multi-threaded, requires polars). Results are always returned
+                as pandas dataframes. Defaults to "pandas".
+
+            jit (bool, optional): Whether to calculate the strength, modulus and
+                yield strength with the fused kernel in pymechtest.kernels
+                (compiled with numba if it's installed, numpy otherwise) rather
+                than the calculators. The results are the same to within floating
+                point rounding. Defaults to False.
+
+            screen (str, optional): Data quality screening of each specimen as it's
+                summarised, see pymechtest.screening. "flag" adds the diagnostics
+                and a "Flags" column with the reasons a specimen failed (empty if
+                it passed) to the summary, "exclude" leaves the failed specimens
+                out of the summary (and so stats) altogether. If not passed,
+                specimens aren't screened.
+
+            detect_break (bool, optional): Whether to find each specimen's fracture
+                and cut its data off there as it's loaded, dropping anything logged
+                after the break. Fracture is the last point before the stress first
+                falls below BREAK_FRACTION of the peak stress. Adds a "Strain at
+                Break" column to the summary. Defaults to False.
+
+            dedupe (str, optional): What to do with specimens whose data table is
+                identical to another's, e.g. a file copied between lot folders,
+                see pymechtest.hashing. Each distinct table is only analysed once.
+                "flag" adds a "Duplicate Of" column with the Specimen ID of the
+                first copy (missing for the first copy itself) to the summary and
+                counts each specimen once in stats, "exclude" leaves the
+                duplicates out of the summary altogether. If not passed, files
+                aren't checked for duplicates.
         """
         super().__init__(
             folder=folder,
@@ -65,4 +129,13 @@ class Flexure(BaseMechanicalTest):
             strain1=strain1,
             strain2=strain2,
             expect_yield=expect_yield,
+            auto_modulus=auto_modulus,
+            stress_units=stress_units,
+            strain_units=strain_units,
+            methods=methods,
+            backend=backend,
+            jit=jit,
+            screen=screen,
+            detect_break=detect_break,
+            dedupe=dedupe,
         )
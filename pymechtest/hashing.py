@@ -0,0 +1,104 @@
+"""
+Content hashing of specimens' data tables, so the same specimen copied
+between folders or re-exported under a new name is recognised, used when
+dedupe is set.
+
+Only the table (the header row onwards) is hashed, as decompressed text with
+universal newlines, so copies that differ only in file name, the metadata above
+the header, compression or line endings are still identical.
+
+If xxhash is installed its xxh3_64 hash is used, otherwise the standard
+library's blake2b (with an 8 byte digest). Either way the file is hashed in
+blocks as it's read so it's never held in memory whole.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import functools
+import hashlib
+from typing import IO, Any, Dict, List, Optional, Sequence
+
+MODES = ("flag", "exclude")
+
+# Characters of text hashed at a time
+BLOCK_SIZE = 1 << 20
+
+
+def check_mode(mode: str) -> None:
+    """
+    Validates a dedupe mode.
+
+    Args:
+        mode (str): Dedupe mode.
+
+    Raises:
+        ValueError: If mode isn't one of MODES.
+    """
+
+    if mode not in MODES:
+        raise ValueError(f"dedupe must be one of {list(MODES)}. Got: {mode!r}")
+
+
+def _hasher() -> Any:
+    """
+    A new hash object, xxh3_64 if xxhash is installed, blake2b otherwise.
+
+    Returns:
+        Any: Hash object with update and hexdigest methods.
+    """
+
+    try:
+        import xxhash
+    except ImportError:
+        return hashlib.blake2b(digest_size=8)
+
+    return xxhash.xxh3_64()
+
+
+def table_hash(f: IO[str], header: int) -> str:
+    """
+    Hashes a csv file's table, everything from the header row on.
+
+    Args:
+        f (IO[str]): csv file open for reading as text.
+        header (int): 0-indexed row number of the table header, not counting
+            blank lines (like pandas).
+
+    Returns:
+        str: Hex digest of the table.
+    """
+
+    # Skip to the header row itself, including any blank lines just above it
+    rows = 0
+    line = f.readline()
+    while line and (rows < header or not line.strip()):
+        rows += bool(line.strip())
+        line = f.readline()
+
+    h = _hasher()
+    h.update(line.encode())
+    for block in iter(functools.partial(f.read, BLOCK_SIZE), ""):
+        h.update(block.encode())
+
+    digest: str = h.hexdigest()
+
+    return digest
+
+
+def first_copies(hashes: Sequence[Optional[str]]) -> List[int]:
+    """
+    Finds the first file with the same hash as each file.
+
+    Args:
+        hashes (Sequence[Optional[str]]): Every file's table hash, None for
+            a file that couldn't be hashed, which is never a copy.
+
+    Returns:
+        List[int]: Position of the first file with each file's hash,
+            its own position if it's the first.
+    """
+
+    first: Dict[str, int] = {}
+
+    return [i if h is None else first.setdefault(h, i) for i, h in enumerate(hashes)]
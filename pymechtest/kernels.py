@@ -0,0 +1,412 @@
+"""
+Fused kernel calculating a specimen's strength, elastic fit and offset
+yield strength straight from its strain and stress arrays, used when jit=True.
+
+The strength and the fit through the modulus window are accumulated together
+in one pass (the fit with Welford's online covariance, so no sums of squares
+are built up) and the offset yield is found in a second, no intermediate
+arrays are allocated in either. The offset line isn't known until the fit
+is finished so the yield can't be folded into the first pass.
+
+If numba is installed the kernel is compiled with njit on first use,
+otherwise an equivalent vectorised numpy version is used.
+
+Missing (NaN) values are skipped.
+
+window_slopes fits many modulus windows of one curve in a single vectorised
+pass, for BaseMechanicalTest.sweep.
+
+rainflow_cycles runs the rainflow counting stack over a block of reversals
+for Fatigue.rainflow, compiled with numba the same way if it's installed.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import functools
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+# strength, slope, intercept, offset yield strength
+Metrics = Tuple[float, float, float, float]
+
+# Most elements of the window mask built at once by window_slopes
+WINDOW_BLOCK = 1 << 22
+
+# Start point, end point and count (0.5 or 1) of each counted cycle,
+# then the reversals left on the stack
+Cycles = Tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+]
+
+
+def _fused_metrics(
+    strain: npt.NDArray[np.float64],
+    stress: npt.NDArray[np.float64],
+    labels: npt.NDArray[np.int64],
+    strain1: float,
+    strain2: float,
+    offset: float,
+) -> Metrics:
+    """
+    Loop version of the kernel, compiled by numba.
+
+    Args:
+        strain (np.ndarray): Strain (%).
+        stress (np.ndarray): Stress (MPa).
+        labels (np.ndarray): Index labels of the rows the data came from.
+        strain1 (float): Lower strain bound of the modulus window.
+        strain2 (float): Upper strain bound of the modulus window.
+        offset (float): Offset yield strain (%), NaN skips the yield strength.
+
+    Raises:
+        IndexError: If the offset yield's index label is past the end of
+            the data, as the Curve calculation would.
+
+    Returns:
+        Metrics: Strength, slope, intercept and offset yield strength.
+    """
+
+    n = strain.shape[0]
+
+    strength = np.nan
+    count = 0
+    mean_x = 0.0
+    mean_y = 0.0
+    m2_x = 0.0
+    c_xy = 0.0
+
+    for i in range(n):
+        x = strain[i]
+        y = stress[i]
+        if np.isnan(y):
+            continue
+        if np.isnan(strength) or y > strength:
+            strength = y
+        if x >= strain1 and x <= strain2:
+            count += 1
+            dx = x - mean_x
+            mean_x += dx / count
+            mean_y += (y - mean_y) / count
+            m2_x += dx * (x - mean_x)
+            c_xy += dx * (y - mean_y)
+
+    if count < 2 or m2_x == 0.0:
+        return strength, np.nan, np.nan, np.nan
+
+    slope = c_xy / m2_x
+    intercept = mean_y - slope * mean_x
+
+    if np.isnan(offset):
+        return strength, slope, intercept, np.nan
+
+    # First point closest to the offset line, NaNs never compare less
+    best = -1
+    best_delta = np.inf
+    for i in range(n):
+        delta = abs(slope * (strain[i] - offset) + intercept - stress[i])
+        if delta < best_delta:
+            best_delta = delta
+            best = i
+
+    if best < 0:
+        return strength, slope, intercept, np.nan
+
+    # Found by position then read by index label, like offset_yield
+    label = labels[best]
+    if label >= n:
+        raise IndexError("Offset yield index label is past the end of the data")
+
+    return strength, slope, intercept, stress[label]
+
+
+def _numpy_metrics(
+    strain: npt.NDArray[np.float64],
+    stress: npt.NDArray[np.float64],
+    labels: npt.NDArray[np.int64],
+    strain1: float,
+    strain2: float,
+    offset: float,
+) -> Metrics:
+    """
+    Vectorised numpy version of the kernel, used when numba isn't installed.
+    Same arguments and results as _fused_metrics.
+    """
+
+    valid = ~np.isnan(stress)
+    strength = float(np.max(stress[valid])) if valid.any() else np.nan
+
+    # NaN strain never compares True so is left out of the window too
+    window = valid & (strain >= strain1) & (strain <= strain2)
+    x, y = strain[window], stress[window]
+
+    if len(x) < 2 or np.all(x == x[0]):
+        return strength, np.nan, np.nan, np.nan
+
+    dx = x - x.mean()
+    slope = float(np.dot(dx, y - y.mean()) / np.dot(dx, dx))
+    intercept = float(y.mean() - slope * x.mean())
+
+    if np.isnan(offset):
+        return strength, slope, intercept, np.nan
+
+    delta = np.abs(slope * (strain - offset) + intercept - stress)
+    if np.all(np.isnan(delta)):
+        return strength, slope, intercept, np.nan
+
+    label = labels[np.nanargmin(delta)]
+    if label >= len(stress):
+        raise IndexError("Offset yield index label is past the end of the data")
+
+    return strength, slope, intercept, float(stress[label])
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled() -> Optional[Callable[..., Metrics]]:
+    """
+    Compiles the loop kernel with numba, if it's installed.
+
+    Returns:
+        Optional[Callable[..., Metrics]]: Compiled kernel, None without numba.
+    """
+
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    kernel: Callable[..., Metrics] = numba.njit(cache=True, nogil=True)(_fused_metrics)
+
+    return kernel
+
+
+def curve_metrics(
+    strain: npt.NDArray[np.float64],
+    stress: npt.NDArray[np.float64],
+    labels: npt.NDArray[np.int64],
+    strain1: float,
+    strain2: float,
+    offset: Optional[float] = 0.2,
+) -> Metrics:
+    """
+    Calculates a specimen's strength, the least squares fit through its
+    modulus window and its offset yield strength.
+
+    Args:
+        strain (np.ndarray): Strain (%).
+        stress (np.ndarray): Stress (MPa).
+        labels (np.ndarray): Index labels of the rows the data came from.
+        strain1 (float): Lower strain bound of the modulus window.
+        strain2 (float): Upper strain bound of the modulus window.
+        offset (float, optional): Offset yield strain (%). If None, the yield
+            strength isn't calculated (it's NaN). Defaults to 0.2.
+
+    Raises:
+        IndexError: If the offset yield's index label is past the end
+            of the data.
+
+    Returns:
+        Metrics: Strength, slope, intercept and offset yield strength.
+    """
+
+    strain = np.ascontiguousarray(strain, dtype=np.float64)
+    stress = np.ascontiguousarray(stress, dtype=np.float64)
+    labels = np.ascontiguousarray(labels, dtype=np.int64)
+
+    kernel = _compiled() or _numpy_metrics
+
+    strength, slope, intercept, yield_strength = kernel(
+        strain,
+        stress,
+        labels,
+        float(strain1),
+        float(strain2),
+        np.nan if offset is None else float(offset),
+    )
+
+    return float(strength), float(slope), float(intercept), float(yield_strength)
+
+
+def window_slopes(
+    strain: npt.NDArray[np.float64],
+    stress: npt.NDArray[np.float64],
+    strain1: npt.NDArray[np.float64],
+    strain2: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Slopes of the least squares lines through many strain windows of one
+    curve at once, used by sweep.
+
+    Each window's sums are picked out of the curve with a mask matrix
+    product, WINDOW_BLOCK elements of the mask at a time. The data is centred
+    first so the sums don't cancel.
+
+    Args:
+        strain (np.ndarray): Strain (%).
+        stress (np.ndarray): Stress (MPa).
+        strain1 (np.ndarray): Lower strain bound of each window.
+        strain2 (np.ndarray): Upper strain bound of each window.
+
+    Returns:
+        np.ndarray: Slope through each window, NaN if it has fewer than two
+            distinct strains or any missing stress.
+    """
+
+    strain = np.asarray(strain, dtype=np.float64)
+    stress = np.asarray(stress, dtype=np.float64)
+    strain1 = np.asarray(strain1, dtype=np.float64)
+    strain2 = np.asarray(strain2, dtype=np.float64)
+
+    # NaN strain never compares True so is never in a window
+    missing = np.isnan(stress).astype(np.float64)
+    x = np.where(np.isnan(strain), 0.0, strain)
+    y = np.where(np.isnan(stress), 0.0, stress)
+    x = x - x.mean() if len(x) else x
+    y = y - y.mean() if len(y) else y
+    columns = np.column_stack([np.ones_like(x), x, y, x * x, x * y, missing])
+
+    sums = np.empty((len(strain1), columns.shape[1]))
+    step = max(1, WINDOW_BLOCK // max(len(strain), 1))
+    for start in range(0, len(strain1), step):
+        lower = strain1[start : start + step, np.newaxis]
+        upper = strain2[start : start + step, np.newaxis]
+        mask = (strain >= lower) & (strain <= upper)
+        sums[start : start + step] = mask.astype(np.float64) @ columns
+
+    n, sx, sy, sxx, sxy, n_missing = sums.T
+    denominator = n * sxx - sx * sx
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = (n * sxy - sx * sy) / denominator
+
+    invalid = (n < 2) | (n_missing > 0) | ~(denominator > 0)
+
+    return np.where(invalid, np.nan, slopes)
+
+
+def _rainflow_stack(
+    points: Sequence[float],
+    stack: Any,
+    depth: int,
+    starts: Any,
+    ends: Any,
+    counts: Any,
+) -> Tuple[int, int]:
+    """
+    Loop version of the rainflow counting stack (ASTM E1049 three point
+    method), compiled by numba.
+
+    Works on preallocated arrays (or lists) so it compiles, 'stack' and the
+    outputs must all have room for depth + len(points), as every cycle counted
+    takes at least one reversal off the stack.
+
+    Args:
+        points (Sequence[float]): Reversals to push.
+        stack (Any): Unmatched reversals, the first 'depth' are in use.
+        depth (int): Number of reversals on the stack.
+        starts (Any): Filled with each cycle's start point.
+        ends (Any): Filled with each cycle's end point.
+        counts (Any): Filled with each cycle's count, 0.5 for a half cycle.
+
+    Returns:
+        Tuple[int, int]: Reversals left on the stack, number of cycles counted.
+    """
+
+    n = 0
+
+    for point in points:
+        stack[depth] = point
+        depth += 1
+        while depth >= 3:
+            x = abs(stack[depth - 1] - stack[depth - 2])
+            y = abs(stack[depth - 2] - stack[depth - 3])
+            if x < y:
+                break
+            if depth == 3:
+                # Range contains the starting point, half cycle
+                starts[n] = stack[0]
+                ends[n] = stack[1]
+                counts[n] = 0.5
+                stack[0] = stack[1]
+                stack[1] = stack[2]
+                depth = 2
+            else:
+                starts[n] = stack[depth - 3]
+                ends[n] = stack[depth - 2]
+                counts[n] = 1.0
+                stack[depth - 3] = stack[depth - 1]
+                depth -= 2
+            n += 1
+
+    return depth, n
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_rainflow() -> Optional[Callable[..., Tuple[int, int]]]:
+    """
+    Compiles the rainflow stack with numba, if it's installed.
+
+    Returns:
+        Optional[Callable[..., Tuple[int, int]]]: Compiled loop, None
+            without numba.
+    """
+
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    kernel: Callable[..., Tuple[int, int]] = numba.njit(cache=True, nogil=True)(
+        _rainflow_stack
+    )
+
+    return kernel
+
+
+def rainflow_cycles(
+    points: npt.NDArray[np.float64], stack: npt.NDArray[np.float64]
+) -> Cycles:
+    """
+    Rainflow counts a block of reversals, carrying on from the reversals
+    left unmatched by the previous block.
+
+    Without numba, the same loop runs over python lists, which is much
+    slower than compiled but faster than indexing numpy arrays element
+    by element.
+
+    Args:
+        points (np.ndarray): Reversals, alternating peaks and valleys.
+        stack (np.ndarray): Reversals left by the previous block,
+            empty for the first.
+
+    Returns:
+        Cycles: Start point, end point and count of each cycle counted,
+            then the reversals left on the stack for the next block.
+    """
+
+    points = np.ascontiguousarray(points, dtype=np.float64)
+    size = len(stack) + len(points)
+    kernel = _compiled_rainflow()
+
+    if kernel is not None:
+        work = np.empty(size)
+        work[: len(stack)] = stack
+        starts, ends, counts = (np.empty(size) for _ in range(3))
+        depth, n = kernel(points, work, len(stack), starts, ends, counts)
+        return starts[:n], ends[:n], counts[:n], work[:depth].copy()
+
+    work_list: List[float] = list(stack) + [0.0] * len(points)
+    outputs: List[List[float]] = [[0.0] * size for _ in range(3)]
+    depth, n = _rainflow_stack(points.tolist(), work_list, len(stack), *outputs)
+
+    return (
+        np.array(outputs[0][:n]),
+        np.array(outputs[1][:n]),
+        np.array(outputs[2][:n]),
+        np.array(work_list[:depth], dtype=np.float64),
+    )
@@ -0,0 +1,378 @@
+"""
+Static HTML and PDF reports of a folder (e.g. a lot) of specimens: the
+analysis settings, stats, summary and stress strain curves on one page.
+
+Each report only parses the data once. The curves from load_all are plotted
+and the summary is calculated from those same curves (load_all keeps them in
+the parse cache, see BaseMechanicalTest._parse), then shared by the table,
+the chart markers and the stats (which reuses it, see
+BaseMechanicalTest._analyse).
+
+Charts are embedded either as Vega-Lite specs with their data inlined, drawn
+by vega-embed when the page is opened ("vega"), or as PNG images rendered
+with altair_saver ("png", which needs selenium and a browser driver or node,
+like plot_curves' save_path). The vega scripts are inlined too, from the
+copies bundled with altair_viewer (an altair_saver dependency), so "vega"
+reports don't need network access to render. PDF reports always use PNG
+charts and are written with WeasyPrint.
+
+build_reports renders the reports for many folders in parallel worker
+processes, chart rendering being the slow part.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import base64
+import concurrent.futures
+import datetime
+import functools
+import html
+import json
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import altair as alt
+
+    from pymechtest.base import BaseMechanicalTest
+
+FORMATS = ("html", "pdf")
+CHARTS = ("vega", "png")
+
+# Packages and major versions matching the Vega-Lite schema altair 4 writes
+VEGA_PACKAGES = (("vega", "5"), ("vega-lite", "4"), ("vega-embed", "6"))
+
+VEGA_SCRIPTS = tuple(
+    f"https://cdn.jsdelivr.net/npm/{package}@{version}"
+    for package, version in VEGA_PACKAGES
+)
+
+STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #222; }
+h1 { font-size: 1.6em; }
+h2 { font-size: 1.2em; margin-top: 2em; }
+table { border-collapse: collapse; font-size: 0.85em; }
+th, td { border: 1px solid #ccc; padding: 0.3em 0.6em; text-align: right; }
+th { background: #f3f3f3; }
+img { max-width: 100%; }
+.meta { color: #666; font-size: 0.85em; }
+"""
+
+
+def check_options(format: str, charts: str) -> None:
+    """
+    Validates a report's format and chart type.
+
+    Args:
+        format (str): Report format.
+        charts (str): How charts are embedded.
+
+    Raises:
+        ValueError: If format isn't one of FORMATS or charts isn't one of CHARTS.
+    """
+
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {list(FORMATS)}. Got: {format!r}")
+    if charts not in CHARTS:
+        raise ValueError(f"charts must be one of {list(CHARTS)}. Got: {charts!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def vega_scripts() -> str:
+    """
+    The vega, vega-lite and vega-embed scripts inlined in script tags, so
+    a report renders offline. Read once per process.
+
+    Returns:
+        str: HTML script tags.
+    """
+
+    from altair_viewer import get_bundled_script
+
+    tags = []
+    for package, version in VEGA_PACKAGES:
+        # Stop anything in the script closing the tag early
+        script = re.sub(
+            "</(script)",
+            r"<\\/\1",
+            get_bundled_script(package, version),
+            flags=re.IGNORECASE,
+        )
+        tags.append(f"<script>\n{script}\n</script>\n")
+
+    return "".join(tags)
+
+
+def _inline(chart: Union["alt.Chart", "alt.LayerChart"]) -> Dict[str, Any]:
+    """
+    The chart's Vega-Lite spec with all its data inlined, whichever
+    data transformer (e.g. plot_curves' data server) is enabled.
+
+    Args:
+        chart (Union[alt.Chart, alt.LayerChart]): Chart.
+
+    Returns:
+        Dict[str, Any]: Vega-Lite spec.
+    """
+
+    import altair as alt
+
+    with alt.data_transformers.enable("default", max_rows=None):
+        spec: Dict[str, Any] = chart.to_dict()
+
+    return spec
+
+
+def render_png(
+    chart: Union["alt.Chart", "alt.LayerChart"], save_method: str = "selenium"
+) -> bytes:
+    """
+    Renders a chart to a PNG image.
+
+    Args:
+        chart (Union[alt.Chart, alt.LayerChart]): Chart.
+        save_method (str, optional): altair_saver method, 'selenium' or 'node'.
+            Defaults to 'selenium'.
+
+    Returns:
+        bytes: The PNG image.
+    """
+
+    from altair_saver import save
+
+    png: bytes = save(_inline(chart), fmt="png", method=save_method, scale_factor=2.0)
+
+    return png
+
+
+def chart_html(
+    chart: Union["alt.Chart", "alt.LayerChart"],
+    charts: str = "vega",
+    save_method: str = "selenium",
+) -> str:
+    """
+    HTML embedding a chart in a report.
+
+    Args:
+        chart (Union[alt.Chart, alt.LayerChart]): Chart.
+        charts (str, optional): "vega" for the spec drawn by vega-embed or
+            "png" for an image. Defaults to "vega".
+        save_method (str, optional): altair_saver method for "png" charts.
+            Defaults to 'selenium'.
+
+    Returns:
+        str: HTML fragment.
+    """
+
+    if charts == "png":
+        data = base64.b64encode(render_png(chart, save_method)).decode()
+        return f'<img alt="Stress strain curves" src="data:image/png;base64,{data}">'
+
+    # Stop anything in the data closing the script tag early
+    spec = json.dumps(_inline(chart)).replace("</", "<\\/")
+
+    return (
+        '<div id="curves"></div>\n'
+        f'<script>vegaEmbed("#curves", {spec}, {{"actions": false}});</script>'
+    )
+
+
+def _table(df: pd.DataFrame, index: bool = False) -> str:
+    """
+    HTML table of a dataframe.
+
+    Args:
+        df (pd.DataFrame): Table.
+        index (bool, optional): Whether to include the index. Defaults to False.
+
+    Returns:
+        str: HTML table.
+    """
+
+    return str(df.to_html(index=index, na_rep="", float_format="{:.4g}".format))
+
+
+def report_html(
+    test: "BaseMechanicalTest",
+    charts: str = "vega",
+    basis: Optional[str] = None,
+    markers: bool = True,
+    save_method: str = "selenium",
+) -> str:
+    """
+    Builds a folder's report.
+
+    Args:
+        test (BaseMechanicalTest): Test object pointing at the folder.
+        charts (str, optional): How the chart is embedded, one of CHARTS.
+            Defaults to "vega".
+        basis (str, optional): 'A' or 'B' to include basis values in the stats.
+            Defaults to None.
+        markers (bool, optional): Whether to mark the strength and yield
+            strength on the curves. Defaults to True.
+        save_method (str, optional): altair_saver method for "png" charts.
+            Defaults to 'selenium'.
+
+    Returns:
+        str: The report as a complete HTML page.
+    """
+
+    from pymechtest import __version__
+
+    name = test.__class__.__qualname__
+    folder = Path(test.folder)
+
+    data = test.load_all()
+    summary = test.summarise()
+    stats = test.stats(basis=basis)
+    chart = test.plot_curves(data=data, summary=summary, markers=markers)
+
+    settings = pd.DataFrame(
+        {"Value": [repr(v) for v in test._settings().values()]},
+        index=pd.Index(list(test._settings()), name="Setting"),
+    )
+
+    title = html.escape(f"{name} Report: {folder.name}")
+    scripts = vega_scripts() if charts == "vega" else ""
+    generated = datetime.datetime.now().isoformat(timespec="seconds")
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>{STYLE}</style>
+{scripts}</head>
+<body>
+<h1>{title}</h1>
+<p class="meta">{html.escape(str(folder.resolve()))}<br>
+{len(summary)} specimens, generated {generated} by pymechtest {__version__}</p>
+<h2>Stress Strain Curves</h2>
+{chart_html(chart, charts=charts, save_method=save_method)}
+<h2>Statistics</h2>
+{_table(stats, index=True)}
+<h2>Summary</h2>
+{_table(summary)}
+<h2>Settings</h2>
+{_table(settings, index=True)}
+</body>
+</html>
+"""
+
+
+def write_report(
+    test: "BaseMechanicalTest",
+    path: Union[Path, str],
+    format: str = "html",
+    charts: str = "vega",
+    basis: Optional[str] = None,
+    markers: bool = True,
+    save_method: str = "selenium",
+) -> Path:
+    """
+    Writes a folder's report, see BaseMechanicalTest.report.
+
+    Args:
+        test (BaseMechanicalTest): Test object pointing at the folder.
+        path (Union[Path, str]): Report file to write.
+        format (str, optional): "html" or "pdf". Defaults to "html".
+        charts (str, optional): How the chart is embedded in an HTML report,
+            one of CHARTS. Defaults to "vega".
+        basis (str, optional): 'A' or 'B' to include basis values in the stats.
+            Defaults to None.
+        markers (bool, optional): Whether to mark the strength and yield
+            strength on the curves. Defaults to True.
+        save_method (str, optional): altair_saver method for PNG charts.
+            Defaults to 'selenium'.
+
+    Raises:
+        ValueError: If format or charts aren't recognised.
+        ImportError: If format is "pdf" and WeasyPrint isn't installed.
+
+    Returns:
+        Path: The report file.
+    """
+
+    check_options(format, charts)
+
+    fp = Path(path).resolve()
+
+    if format == "pdf":
+        try:
+            import weasyprint
+        except ImportError as e:
+            raise ImportError(
+                "PDF reports require WeasyPrint. "
+                "Install it with 'pip install pymechtest[pdf]'."
+            ) from e
+
+        page = report_html(
+            test, charts="png", basis=basis, markers=markers, save_method=save_method
+        )
+        weasyprint.HTML(string=page).write_pdf(str(fp))
+    else:
+        page = report_html(
+            test, charts=charts, basis=basis, markers=markers, save_method=save_method
+        )
+        fp.write_text(page, encoding="utf-8")
+
+    return fp
+
+
+def build_reports(
+    tests: Sequence["BaseMechanicalTest"],
+    path: Union[Path, str],
+    format: str = "html",
+    workers: int = 1,
+    **kwargs: Any,
+) -> List[Path]:
+    """
+    Writes a report for each of many folders (e.g. one per lot), each named
+    after its folder, in parallel worker processes.
+
+    Args:
+        tests (Sequence[BaseMechanicalTest]): Test objects pointing at
+            each folder.
+        path (Union[Path, str]): Directory to write the reports to,
+            created if it doesn't exist.
+        format (str, optional): "html" or "pdf". Defaults to "html".
+        workers (int, optional): Number of worker processes, 1 renders them
+            all in this process. Defaults to 1.
+        **kwargs (Any): charts, basis, markers and save_method,
+            see BaseMechanicalTest.report.
+
+    Raises:
+        ValueError: If two folders have the same name, so their reports
+            would overwrite each other.
+
+    Returns:
+        List[Path]: The report files, in the same order as tests.
+    """
+
+    check_options(format, kwargs.get("charts", "vega"))
+
+    names = [Path(test.folder).resolve().name for test in tests]
+    repeated = sorted({name for name in names if names.count(name) > 1})
+    if repeated:
+        raise ValueError(f"Folder names must be unique to name the reports: {repeated}")
+
+    out = Path(path).resolve()
+    out.mkdir(parents=True, exist_ok=True)
+    files = [out.joinpath(f"{name}.{format}") for name in names]
+
+    if workers <= 1:
+        return [
+            write_report(test, fp, format=format, **kwargs)
+            for test, fp in zip(tests, files)
+        ]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(write_report, test, fp, format=format, **kwargs)
+            for test, fp in zip(tests, files)
+        ]
+        return [future.result() for future in futures]
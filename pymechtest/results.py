@@ -0,0 +1,337 @@
+"""
+Persistent store of summarise results, so historical results can be looked
+up without re-processing the raw data, e.g. every Tensile modulus for one
+material since 2024.
+
+Results live in a single SQLite file (sqlite3 is in the standard library so
+there's nothing extra to install) with one row per specimen per analysis
+settings:
+
+    settings: Each distinct type of test and set of analysis settings, keyed
+        by settings_hash.
+
+    specimens: Specimen ID, file and the time it was stored. A specimen is
+        identified by its file and the settings hash, so summarising the same
+        file with the same settings again replaces its results.
+
+    metadata: The rows above each file's table header (e.g. Material, Width)
+        and any text columns of the summary (grouping keys, Flags).
+
+    metrics: Every numeric column of the summary (Strength, Modulus etc.).
+
+Metadata, metric names, settings hashes and the stored time are all indexed
+so lookups don't have to scan the whole store.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import datetime
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+import pandas as pd
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    hash TEXT PRIMARY KEY,
+    test TEXT NOT NULL,
+    settings TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS specimens (
+    id INTEGER PRIMARY KEY,
+    settings_hash TEXT NOT NULL REFERENCES settings (hash),
+    file TEXT NOT NULL,
+    specimen_id TEXT,
+    stored TEXT NOT NULL,
+    UNIQUE (settings_hash, file)
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    specimen INTEGER NOT NULL REFERENCES specimens (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (specimen, name)
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    specimen INTEGER NOT NULL REFERENCES specimens (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (specimen, name)
+);
+CREATE INDEX IF NOT EXISTS settings_test ON settings (test);
+CREATE INDEX IF NOT EXISTS specimens_stored ON specimens (stored);
+CREATE INDEX IF NOT EXISTS specimens_specimen_id ON specimens (specimen_id);
+CREATE INDEX IF NOT EXISTS metadata_name_value ON metadata (name, value);
+CREATE INDEX IF NOT EXISTS metrics_name ON metrics (name, specimen);
+"""
+
+# Identifying columns at the front of every query result
+ID_COLUMNS = ["Test", "Settings Hash", "Stored", "Specimen ID", "File"]
+
+
+def settings_hash(settings: Dict[str, Any], test: str) -> str:
+    """
+    Hashes a set of analysis settings and the type of test they're for, so
+    results calculated the same way can be found together. Different types of
+    test never share a hash, even with identical settings.
+
+    Args:
+        settings (Dict[str, Any]): JSON serialisable settings.
+        test (str): Type of test e.g. "Tensile".
+
+    Returns:
+        str: 16 character hex digest.
+    """
+
+    text = json.dumps({"test": test, "settings": settings}, sort_keys=True, default=str)
+
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+class ResultsStore:
+    def __init__(self, path: Union[Path, str]) -> None:
+        """
+        A SQLite results store, created if it doesn't exist.
+
+        Can be used as a context manager to close it when done.
+
+        Args:
+            path (Union[Path, str]): Store file e.g. "results.db".
+        """
+        self.path = path
+
+        self._connection = sqlite3.connect(str(path))
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+
+    def __repr__(self) -> str:
+
+        return self.__class__.__qualname__ + f"(path={self.path!r})"
+
+    def __enter__(self) -> "ResultsStore":
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the store.
+        """
+
+        self._connection.close()
+
+    def add(
+        self,
+        summary: pd.DataFrame,
+        test: str,
+        settings: Dict[str, Any],
+        files: Sequence[Path],
+        metadata: Optional[Sequence[Dict[str, str]]] = None,
+    ) -> str:
+        """
+        Stores a summary, replacing any results for the same files
+        calculated with the same settings.
+
+        Args:
+            summary (pd.DataFrame): Output of summarise, one row per file.
+            test (str): Type of test e.g. "Tensile".
+            settings (Dict[str, Any]): Analysis settings the summary was
+                calculated with.
+            files (Sequence[Path]): Each row's data file.
+            metadata (Sequence[Dict[str, str]], optional): Each row's file
+                metadata. If not passed, only the summary's text columns
+                are stored as metadata.
+
+        Raises:
+            ValueError: If there isn't a file for every row.
+
+        Returns:
+            str: The settings hash the results are stored under.
+        """
+
+        if len(files) != len(summary):
+            raise ValueError(
+                f"Got {len(files)} files for a summary of {len(summary)} specimens"
+            )
+
+        key = settings_hash(settings, test)
+        stored = datetime.datetime.now(datetime.timezone.utc).isoformat(
+            timespec="seconds"
+        )
+
+        columns = [c for c in summary.columns if c != "Specimen ID"]
+        numeric = [c for c in columns if pd.api.types.is_numeric_dtype(summary[c])]
+        text = [c for c in columns if c not in numeric]
+
+        values = summary[numeric].to_numpy(dtype=float, na_value=float("nan"))
+        labels = summary[text].astype("string").astype(object)
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO settings VALUES (?, ?, ?)",
+                (key, test, json.dumps(settings, sort_keys=True, default=str)),
+            )
+            for i, fp in enumerate(files):
+                self._connection.execute(
+                    "DELETE FROM specimens WHERE settings_hash = ? AND file = ?",
+                    (key, str(fp)),
+                )
+                specimen = self._connection.execute(
+                    "INSERT INTO specimens (settings_hash, file, specimen_id, stored) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, str(fp), str(summary["Specimen ID"].iloc[i]), stored),
+                ).lastrowid
+
+                rows = dict(metadata[i]) if metadata else {}
+                rows.update(
+                    {c: None if pd.isna(v) else v for c, v in zip(text, labels.iloc[i])}
+                )
+                self._connection.executemany(
+                    "INSERT INTO metadata VALUES (?, ?, ?)",
+                    [(specimen, name, value) for name, value in rows.items()],
+                )
+                self._connection.executemany(
+                    "INSERT INTO metrics VALUES (?, ?, ?)",
+                    [
+                        (specimen, name, None if value != value else float(value))
+                        for name, value in zip(numeric, values[i])
+                    ],
+                )
+
+        return key
+
+    def query(
+        self,
+        metrics: Optional[Union[str, List[str]]] = None,
+        test: Optional[str] = None,
+        where: Optional[Dict[str, str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        settings_hash: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Looks up stored results.
+
+        Args:
+            metrics (Union[str, List[str]], optional): Metric(s) to return
+                e.g. "Modulus". If not passed, every metric is returned.
+            test (str, optional): Only results for this type of test
+                e.g. "Tensile".
+            where (Dict[str, str], optional): Only specimens with these metadata
+                values e.g. {"Material": "X"}.
+            since (str, optional): Only results stored at or after this ISO 8601
+                date or time e.g. "2024-01-01".
+            until (str, optional): Only results stored before this ISO 8601
+                date or time.
+            settings_hash (str, optional): Only results calculated with these
+                settings.
+
+        Returns:
+            pd.DataFrame: One row per specimen, ID_COLUMNS then a column for
+                each metric.
+        """
+
+        metrics = [metrics] if isinstance(metrics, str) else metrics
+
+        clauses = []
+        params: List[Any] = []
+
+        if metrics:
+            clauses.append(f"m.name IN ({', '.join('?' * len(metrics))})")
+            params.extend(metrics)
+        if test:
+            clauses.append("t.test = ?")
+            params.append(test)
+        for name, value in (where or {}).items():
+            clauses.append(
+                "s.id IN (SELECT specimen FROM metadata WHERE name = ? AND value = ?)"
+            )
+            params.extend([name, str(value)])
+        if since:
+            clauses.append("s.stored >= ?")
+            params.append(since)
+        if until:
+            clauses.append("s.stored < ?")
+            params.append(until)
+        if settings_hash:
+            clauses.append("s.settings_hash = ?")
+            params.append(settings_hash)
+
+        sql = (
+            "SELECT s.id, t.test, s.settings_hash, s.stored, s.specimen_id, s.file, "
+            "m.name, m.value FROM metrics m "
+            "JOIN specimens s ON m.specimen = s.id "
+            "JOIN settings t ON s.settings_hash = t.hash"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY s.id, m.rowid"
+
+        long = pd.DataFrame(
+            self._connection.execute(sql, params).fetchall(),
+            columns=["id"] + ID_COLUMNS + ["name", "value"],
+        )
+
+        wide = long.pivot(index="id", columns="name", values="value")
+        names = metrics or list(dict.fromkeys(long["name"]))
+        ids = long.drop_duplicates("id").set_index("id")[ID_COLUMNS]
+
+        return (
+            ids.join(wide.reindex(columns=names).astype(float))
+            .reset_index(drop=True)
+            .rename_axis(columns=None)
+        )
+
+    def metadata(self, specimen_ids: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Stored metadata, one row per stored specimen and a column per
+        metadata name.
+
+        Args:
+            specimen_ids (Sequence[str], optional): Only these Specimen IDs.
+                If not passed, every specimen's metadata is returned.
+
+        Returns:
+            pd.DataFrame: "Settings Hash", "Specimen ID", "File" and
+                the metadata.
+        """
+
+        sql = (
+            "SELECT s.id, s.settings_hash, s.specimen_id, s.file, d.name, d.value "
+            "FROM specimens s LEFT JOIN metadata d ON d.specimen = s.id"
+        )
+        params: List[Any] = []
+        if specimen_ids is not None:
+            sql += f" WHERE s.specimen_id IN ({', '.join('?' * len(specimen_ids))})"
+            params.extend(specimen_ids)
+        sql += " ORDER BY s.id, d.rowid"
+
+        columns = ["Settings Hash", "Specimen ID", "File"]
+        long = pd.DataFrame(
+            self._connection.execute(sql, params).fetchall(),
+            columns=["id"] + columns + ["name", "value"],
+        )
+
+        wide = long.dropna(subset=["name"]).pivot(
+            index="id", columns="name", values="value"
+        )
+        ids = long.drop_duplicates("id").set_index("id")[columns]
+
+        # e.g. a "Specimen ID" metadata row is already an identifying column
+        return (
+            ids.join(wide.drop(columns=columns, errors="ignore"))
+            .reset_index(drop=True)
+            .rename_axis(columns=None)
+        )
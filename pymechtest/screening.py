@@ -0,0 +1,153 @@
+"""
+Data quality screening of specimens as they're summarised.
+
+Each specimen's curve gets a few cheap diagnostics, calculated from the data
+already loaded for the summary so nothing is read twice:
+
+    R2: Coefficient of determination of the modulus fit, a slipping grip
+        or a badly seated extensometer makes the elastic region non linear.
+
+    Strain Reversals: Strain travelled backwards up to the peak as a fraction
+        of the strain travelled forwards, e.g. a slipping extensometer.
+
+    Max Gap: Largest strain step up to the peak as a multiple of the average
+        step, e.g. an extensometer dropping out or being reset.
+
+    Zero Offset: Strain where the modulus fit crosses zero stress (%), a large
+        one points to a strain offset or slack in the load train.
+
+Then, across the whole batch, the Strength and Modulus of every specimen are
+checked against Tukey's fences (IQR_FENCE interquartile ranges outside the
+quartiles). A Grubbs test would need the t distribution so isn't used.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from pymechtest import calculators
+
+MODES = ("flag", "exclude")
+
+# Below this the modulus fit is flagged as non linear
+MIN_R_SQUARED = 0.98
+
+# Above this fraction of the strain travelled backwards it's flagged as slipping
+MAX_REVERSALS = 0.05
+
+# A strain step more than this many average steps is flagged as a gap
+MAX_GAP = 20.0
+
+# Fitted line crossing zero stress further than this from zero strain (%)
+MAX_ZERO_OFFSET = 0.05
+
+# Tukey's fences for the batch outlier test
+IQR_FENCE = 1.5
+
+# Summary columns tested for batch outliers
+OUTLIER_COLUMNS = ("Strength", "Modulus")
+
+DIAGNOSTIC_COLUMNS = ("R2", "Strain Reversals", "Max Gap", "Zero Offset")
+
+
+def check_mode(mode: str) -> None:
+    """
+    Validates a screening mode.
+
+    Args:
+        mode (str): Screening mode.
+
+    Raises:
+        ValueError: If mode isn't one of MODES.
+    """
+
+    if mode not in MODES:
+        raise ValueError(f"screen must be one of {list(MODES)}. Got: {mode!r}")
+
+
+def diagnostics(curve: calculators.Curve) -> Dict[str, float]:
+    """
+    Calculates a specimen's diagnostics.
+
+    Args:
+        curve (calculators.Curve): The specimen's curve.
+
+    Returns:
+        Dict[str, float]: Diagnostic: value, NaN where there isn't
+            enough data to tell.
+    """
+
+    slope, intercept = curve.fit
+    x, y = curve.strain[curve.window], curve.stress[curve.window]
+
+    ss_tot = np.sum((y - y.mean()) ** 2) if len(y) else 0.0
+    r_squared = (
+        1 - np.sum((y - (slope * x + intercept)) ** 2) / ss_tot if ss_tot else np.nan
+    )
+
+    steps = np.diff(curve.strain[: curve.peak + 1])
+    steps = steps[~np.isnan(steps)]
+    forward = steps[steps > 0].sum()
+
+    return {
+        "R2": float(r_squared),
+        "Strain Reversals": (
+            float(np.abs(steps[steps < 0]).sum() / forward) if forward else np.nan
+        ),
+        "Max Gap": float(steps.max() * len(steps) / forward) if forward else np.nan,
+        "Zero Offset": float(-intercept / slope) if slope else np.nan,
+    }
+
+
+def _outliers(values: pd.Series) -> pd.Series:
+    """
+    Tukey's fences outlier test.
+
+    Args:
+        values (pd.Series): Values for every specimen in the batch.
+
+    Returns:
+        pd.Series: Boolean mask of the outliers.
+    """
+
+    values = values.astype(float)
+    q1, q3 = values.quantile(0.25), values.quantile(0.75)
+    fence = IQR_FENCE * (q3 - q1)
+
+    return (values < q1 - fence) | (values > q3 + fence)
+
+
+def flags(summary: pd.DataFrame, columns: Sequence[str] = OUTLIER_COLUMNS) -> pd.Series:
+    """
+    Gives the reasons each specimen in a summary (with its diagnostic
+    columns) is flagged.
+
+    Args:
+        summary (pd.DataFrame): Summary including the diagnostic columns.
+        columns (Sequence[str], optional): Columns to test for batch outliers.
+            Defaults to OUTLIER_COLUMNS.
+
+    Returns:
+        pd.Series: Semicolon separated reasons, empty for specimens that pass.
+    """
+
+    checks = {
+        "Non linear modulus": summary["R2"].astype(float) < MIN_R_SQUARED,
+        "Strain reversals": summary["Strain Reversals"].astype(float) > MAX_REVERSALS,
+        "Strain gap": summary["Max Gap"].astype(float) > MAX_GAP,
+        "Zero offset": summary["Zero Offset"].astype(float).abs() > MAX_ZERO_OFFSET,
+    }
+
+    for col in columns:
+        if col in summary:
+            checks[f"{col} outlier"] = _outliers(summary[col])
+
+    reasons = pd.Series("", index=summary.index, dtype="string")
+    for reason, mask in checks.items():
+        reasons = reasons.mask(mask.to_numpy(dtype=bool), reasons + reason + "; ")
+
+    return reasons.str.rstrip("; ")
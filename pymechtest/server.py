@@ -0,0 +1,346 @@
+"""
+Local HTTP analysis service.
+
+Keeps pymechtest (and pandas etc.) imported and a pool of worker processes
+warm so each analysis only costs the analysis, not python's startup.
+
+Endpoints:
+    GET /health: {"status": "ok"}
+
+    POST /summarise?type=tensile&header=8&id_row=3&filename=spec_1.csv:
+        The body is a single specimen's (possibly compressed) csv file, the
+        query string holds the test settings. Returns the specimen's summary
+        as a JSON object, exactly as a row of summarise(). Uploads larger than
+        the server's max_body (MAX_BODY_BYTES by default) get a 413.
+
+Only the standard library is used. There's no authentication so only serve
+on a trusted network (the default host is localhost).
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import concurrent.futures
+import json
+import multiprocessing
+import tempfile
+import traceback
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from pymechtest.cli import TEST_TYPES
+
+# Query parameter: converter for the test class keyword arguments
+SETTINGS: Dict[str, Callable[[str], Any]] = {
+    "id_row": int,
+    "header": int,
+    "stress_col": str,
+    "strain_col": str,
+    "strain1": float,
+    "strain2": float,
+    "expect_yield": lambda v: v.lower() in ("1", "true", "yes"),
+    "auto_modulus": lambda v: v.lower() in ("1", "true", "yes"),
+    "stress_units": str,
+    "strain_units": str,
+}
+
+# Errors caused by the uploaded data or settings, rather than a bug
+USER_ERRORS = (ValueError, KeyError, OSError)
+
+# Largest upload accepted by default (bytes), bigger ones get a 413
+MAX_BODY_BYTES = 256 * 1024**2
+
+# Longest make_server waits for every worker to start (seconds)
+WARM_UP_TIMEOUT = 120.0
+
+# Set in each worker process by _init_worker
+_started: Optional[Any] = None
+
+
+def _parse_query(query: str) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Parses a /summarise query string.
+
+    Args:
+        query (str): URL query string.
+
+    Raises:
+        ValueError: If there are unknown or invalid parameters.
+
+    Returns:
+        Tuple[str, str, Dict[str, Any]]: Test type, filename and
+            test class keyword arguments.
+    """
+
+    params = parse_qs(query, keep_blank_values=True)
+
+    test_type = params.pop("type", ["tensile"])[-1]
+    if test_type not in TEST_TYPES:
+        raise ValueError(f"type must be one of {list(TEST_TYPES)}. Got: {test_type!r}")
+
+    # Only ever a name, never somewhere else on the server's disk
+    filename = Path(params.pop("filename", ["specimen.csv"])[-1]).name
+
+    kwargs: Dict[str, Any] = {}
+    methods = params.pop("method", [])
+    if methods:
+        kwargs["methods"] = methods
+
+    for key, values in params.items():
+        if key not in SETTINGS:
+            raise ValueError(f"Unknown parameter: {key!r}")
+        kwargs[key] = SETTINGS[key](values[-1])
+
+    return test_type, filename, kwargs
+
+
+def _analyse(test_type: str, kwargs: Dict[str, Any], filename: str, data: bytes) -> str:
+    """
+    Summarises a single uploaded specimen file. Runs in a worker process.
+
+    The upload is written to a temporary folder so it goes through exactly
+    the same loading (decompression, units etc.) as files on disk.
+
+    Args:
+        test_type (str): One of TEST_TYPES.
+        kwargs (Dict[str, Any]): Test class keyword arguments.
+        filename (str): Name of the uploaded file, used for the specimen ID
+            if no id_row.
+        data (bytes): Contents of the file.
+
+    Returns:
+        str: The specimen's summary as JSON.
+    """
+
+    with tempfile.TemporaryDirectory() as folder:
+        fp = Path(folder).joinpath(filename)
+        fp.write_bytes(data)
+        obj = TEST_TYPES[test_type](folder=folder, **kwargs)
+        result: str = obj._summarise_file(fp).to_json()
+
+    return result
+
+
+def _init_worker(started: Any) -> None:
+    """
+    Worker process initialiser, keeps the barrier _warm_up waits on.
+
+    Args:
+        started (multiprocessing.Barrier): Barrier with a party per worker.
+    """
+
+    global _started
+    _started = started
+
+
+def _warm_up() -> None:
+    """
+    Warm up task, does the expensive imports up front rather than on a
+    worker's first request.
+
+    Then waits for a warm up task to be running in every worker, so no
+    worker can take two of them and every worker is started and warm.
+    """
+
+    import pymechtest.base  # noqa: F401
+
+    if _started is not None:
+        _started.wait(timeout=WARM_UP_TIMEOUT)
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Request handler, the pool is set on the server by make_server.
+    """
+
+    server: "AnalysisServer"
+
+    def _send(self, status: HTTPStatus, body: str) -> None:
+        encoded = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send(status, json.dumps({"error": message}))
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path == "/health":
+            self._send(HTTPStatus.OK, json.dumps({"status": "ok"}))
+        else:
+            self._error(HTTPStatus.NOT_FOUND, f"Not found: {self.path}")
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+
+        if url.path != "/summarise":
+            self._error(HTTPStatus.NOT_FOUND, f"Not found: {self.path}")
+            return
+
+        try:
+            test_type, filename, kwargs = _parse_query(url.query)
+        except USER_ERRORS as e:
+            self._error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+
+        header = self.headers.get("Content-Length", "0")
+        try:
+            length = int(header)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            # Where the body ends is unknown so the connection can't be reused
+            self.close_connection = True
+            self._error(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {header!r}")
+            return
+
+        if not length:
+            self._error(HTTPStatus.BAD_REQUEST, "No file uploaded.")
+            return
+
+        if length > self.server.max_body:
+            # The body is never read, so the connection can't be reused
+            self.close_connection = True
+            self._error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"File too large: {length} bytes. "
+                f"The limit is {self.server.max_body} bytes.",
+            )
+            return
+
+        data = self.rfile.read(length)
+
+        try:
+            result = self.server.pool.submit(
+                _analyse, test_type, kwargs, filename, data
+            ).result()
+        except USER_ERRORS as e:
+            self._error(HTTPStatus.UNPROCESSABLE_ENTITY, str(e))
+            return
+        except Exception as e:
+            # A bug rather than bad data, the client still gets an answer
+            self.log_error("Analysis failed:\n%s", traceback.format_exc())
+            self._error(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                f"Internal error: {type(e).__name__}: {e}",
+            )
+            return
+
+        self._send(HTTPStatus.OK, result)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def log_error(self, format: str, *args: Any) -> None:
+        # Errors are logged even when quiet
+        super().log_message(format, *args)
+
+
+class AnalysisServer(ThreadingHTTPServer):
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        pool: concurrent.futures.Executor,
+        quiet: bool = False,
+        max_body: int = MAX_BODY_BYTES,
+    ) -> None:
+        """
+        Threaded HTTP server handing the analysis off to a pool.
+
+        Args:
+            address (Tuple[str, int]): (host, port) to listen on.
+            pool (concurrent.futures.Executor): Pool to run analyses in.
+            quiet (bool, optional): Don't log every request. Defaults to False.
+            max_body (int, optional): Largest upload accepted (bytes).
+                Defaults to MAX_BODY_BYTES.
+        """
+        super().__init__(address, Handler)
+        self.pool = pool
+        self.quiet = quiet
+        self.max_body = max_body
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    quiet: bool = False,
+    max_body: int = MAX_BODY_BYTES,
+) -> AnalysisServer:
+    """
+    Creates the analysis server and its warm process pool.
+
+    Call serve_forever() on the result to start serving and server_close()
+    and pool.shutdown() when done.
+
+    Args:
+        host (str, optional): Host to listen on. Defaults to "127.0.0.1".
+        port (int, optional): Port to listen on, 0 picks a free one.
+            Defaults to 8000.
+        workers (int, optional): Number of worker processes. Defaults to 1.
+        quiet (bool, optional): Don't log every request. Defaults to False.
+        max_body (int, optional): Largest upload accepted (bytes).
+            Defaults to MAX_BODY_BYTES.
+
+    Returns:
+        AnalysisServer: The server.
+    """
+
+    context = multiprocessing.get_context()
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(context.Barrier(workers),),
+    )
+
+    # Start and warm up every worker now rather than on the first requests
+    warm_ups = [pool.submit(_warm_up) for _ in range(workers)]
+    for future in warm_ups:
+        future.result()
+
+    return AnalysisServer((host, port), pool, quiet=quiet, max_body=max_body)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    quiet: bool = False,
+    ready: Optional[Callable[[AnalysisServer], None]] = None,
+    max_body: int = MAX_BODY_BYTES,
+) -> None:
+    """
+    Serves analyses until interrupted.
+
+    Args:
+        host (str, optional): Host to listen on. Defaults to "127.0.0.1".
+        port (int, optional): Port to listen on. Defaults to 8000.
+        workers (int, optional): Number of worker processes. Defaults to 1.
+        quiet (bool, optional): Don't log every request. Defaults to False.
+        ready (Callable[[AnalysisServer], None], optional): Called with the
+            server once it's listening.
+        max_body (int, optional): Largest upload accepted (bytes).
+            Defaults to MAX_BODY_BYTES.
+    """
+
+    server = make_server(
+        host=host, port=port, workers=workers, quiet=quiet, max_body=max_body
+    )
+
+    if ready:
+        ready(server)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.pool.shutdown()
@@ -0,0 +1,341 @@
+"""
+Statistical extensions: basis values (allowables) and bootstrap
+confidence intervals.
+
+Basis values follow the CMH-17 approach for normal, lognormal and two
+parameter Weibull populations. The one-sided tolerance factors are the
+CMH-17 closed form approximations, so no statistical tables or scipy
+are needed.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+# Population proportion that must lie above the basis value
+BASIS_PROPORTIONS = {"A": 0.99, "B": 0.90}
+
+DISTRIBUTIONS = ("normal", "lognormal", "weibull")
+
+STATISTICS = ("mean", "median", "std", "cov%")
+
+# Most resampled values drawn at once by bootstrap_ci
+RESAMPLE_BLOCK = 1 << 22
+
+
+def _check_basis(basis: str) -> str:
+    """
+    Validates and normalises a basis argument.
+
+    Args:
+        basis (str): 'A' or 'B' (case insensitive).
+
+    Raises:
+        ValueError: If basis is not 'A' or 'B'.
+
+    Returns:
+        str: Upper case basis.
+    """
+
+    if basis.upper() not in BASIS_PROPORTIONS:
+        raise ValueError(f"Basis must be one of 'A' or 'B'. Got: {basis!r}")
+
+    return basis.upper()
+
+
+def _normal_k(n: int, basis: str) -> float:
+    """
+    One-sided tolerance factor for a normal population, 95% confidence.
+
+    Args:
+        n (int): Number of specimens.
+        basis (str): 'A' or 'B'.
+
+    Returns:
+        float: Tolerance factor k such that basis = mean - k * std.
+    """
+
+    if basis == "A":
+        return float(2.326 + np.exp(1.34 - 0.522 * np.log(n) + 3.87 / n))
+
+    return float(1.282 + np.exp(0.958 - 0.520 * np.log(n) + 3.19 / n))
+
+
+def _weibull_v(n: int, basis: str) -> float:
+    """
+    Tolerance factor V for a two parameter Weibull population, 95% confidence.
+
+    Args:
+        n (int): Number of specimens.
+        basis (str): 'A' or 'B'.
+
+    Returns:
+        float: Tolerance factor V.
+    """
+
+    if basis == "A":
+        return float(6.649 + np.exp(2.55 - 0.526 * np.log(n) + 4.76 / n))
+
+    return float(3.803 + np.exp(1.79 - 0.516 * np.log(n) + 5.1 / (n - 1)))
+
+
+def weibull_fit(
+    data: npt.NDArray[np.float64], tol: float = 1e-10
+) -> Tuple[float, float]:
+    """
+    Maximum likelihood estimates of the two parameter Weibull
+    shape and scale.
+
+    The shape equation is solved with Newton's method, every iteration is a
+    handful of vectorised reductions over the data.
+
+    Args:
+        data (np.ndarray): 1D array of strictly positive values.
+
+        tol (float, optional): Convergence tolerance on the shape.
+            Defaults to 1e-10.
+
+    Raises:
+        ValueError: If any of the values are not strictly positive.
+
+    Returns:
+        Tuple[float, float]: shape, scale.
+    """
+
+    x = np.asarray(data, dtype=float)
+
+    if np.any(x <= 0):
+        raise ValueError("Weibull fit requires strictly positive data.")
+
+    # Normalise by the max so x ** shape can't overflow
+    x_max = x.max()
+    log_x = np.log(x / x_max)
+    mean_log_x = log_x.mean()
+
+    # Starting guess from the spread of the log data
+    shape = 1.2 / max(float(log_x.std()), 1e-12)
+
+    for _ in range(100):
+        w = np.exp(shape * log_x)
+        s0 = w.sum()
+        s1 = (w * log_x).sum()
+        s2 = (w * log_x**2).sum()
+
+        g = s1 / s0 - 1 / shape - mean_log_x
+        dg = (s2 * s0 - s1**2) / s0**2 + 1 / shape**2
+
+        step = g / dg
+        # Shape must stay positive
+        shape = shape - step if shape - step > 0 else shape / 2
+
+        if abs(step) < tol * shape:
+            break
+
+    scale = x_max * float(np.mean(np.exp(shape * log_x))) ** (1 / shape)
+
+    return float(shape), float(scale)
+
+
+def basis_value(
+    data: npt.NDArray[np.float64], basis: str = "B", distribution: str = "normal"
+) -> float:
+    """
+    Calculates the A or B basis value of a sample.
+
+    The B-basis value is the value above which at least 90% of the population
+    is expected to fall with 95% confidence, the A-basis is the same but for
+    99% of the population.
+
+    Args:
+        data (np.ndarray): 1D array of e.g. strengths, NaNs are ignored.
+
+        basis (str, optional): 'A' or 'B'. Defaults to 'B'.
+
+        distribution (str, optional): Assumed population distribution, one of
+            'normal', 'lognormal' or 'weibull'. Defaults to 'normal'.
+
+    Raises:
+        ValueError: If basis or distribution are invalid, or there are
+            fewer than 2 values.
+
+    Returns:
+        float: Basis value.
+    """
+
+    basis = _check_basis(basis)
+
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(
+            f"Distribution must be one of {DISTRIBUTIONS}. Got: {distribution!r}"
+        )
+
+    x = np.asarray(data, dtype=float)
+    x = x[~np.isnan(x)]
+    n = len(x)
+
+    if n < 2:
+        raise ValueError(f"At least 2 values needed for a basis value. Got: {n}")
+
+    if distribution == "weibull":
+        shape, scale = weibull_fit(x)
+        p = -np.log(BASIS_PROPORTIONS[basis])
+        q = scale * p ** (1 / shape)
+        return float(q * np.exp(-_weibull_v(n, basis) / (shape * np.sqrt(n))))
+
+    if distribution == "lognormal":
+        log_x = np.log(x)
+        return float(np.exp(log_x.mean() - _normal_k(n, basis) * log_x.std(ddof=1)))
+
+    return float(x.mean() - _normal_k(n, basis) * x.std(ddof=1))
+
+
+def basis_values(
+    data: npt.NDArray[np.float64], basis: str = "B", distribution: str = "normal"
+) -> npt.NDArray[np.float64]:
+    """
+    Calculates the A or B basis value of each column of a 2D array, see
+    basis_value.
+
+    Unlike basis_value, a column the basis value can't be calculated for
+    (fewer than 2 values, or values that aren't strictly positive for the
+    'lognormal' and 'weibull' distributions) gets NaN rather than raising.
+
+    Args:
+        data (np.ndarray): 2D (n, n_columns) array, NaNs are ignored.
+
+        basis (str, optional): 'A' or 'B'. Defaults to 'B'.
+
+        distribution (str, optional): Assumed population distribution, one of
+            'normal', 'lognormal' or 'weibull'. Defaults to 'normal'.
+
+    Raises:
+        ValueError: If basis or distribution are invalid.
+
+    Returns:
+        np.ndarray: Basis value of each column.
+    """
+
+    basis = _check_basis(basis)
+
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(
+            f"Distribution must be one of {DISTRIBUTIONS}. Got: {distribution!r}"
+        )
+
+    x = np.asarray(data, dtype=float)
+    values = np.full(x.shape[1], np.nan)
+
+    for j, column in enumerate(x.T):
+        column = column[~np.isnan(column)]
+        if len(column) < 2:
+            continue
+        if distribution != "normal" and (column <= 0).any():
+            continue
+        values[j] = basis_value(column, basis=basis, distribution=distribution)
+
+    return values
+
+
+def _statistic(
+    samples: npt.NDArray[np.float64], statistic: str
+) -> npt.NDArray[np.float64]:
+    """
+    Evaluates a statistic along axis 1 of a batch of resamples.
+
+    Args:
+        samples (np.ndarray): Resamples with shape (n_resamples, n, ...).
+        statistic (str): One of STATISTICS.
+
+    Returns:
+        np.ndarray: Statistic of each resample.
+    """
+
+    if statistic == "mean":
+        return np.asarray(samples.mean(axis=1))
+    elif statistic == "median":
+        return np.asarray(np.median(samples, axis=1))
+    elif statistic == "std":
+        return np.asarray(samples.std(axis=1, ddof=1))
+    else:
+        return np.asarray(samples.std(axis=1, ddof=1) / samples.mean(axis=1) * 100)
+
+
+def bootstrap_ci(
+    data: npt.NDArray[np.float64],
+    statistic: str = "mean",
+    n_resamples: int = 10_000,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Percentile bootstrap confidence interval for a statistic.
+
+    The resamples are drawn and evaluated as (block, n) NumPy batches rather
+    than looping in python, each batch at most RESAMPLE_BLOCK values so memory
+    use doesn't grow with n_resamples.
+
+    Missing (NaN) values are dropped from each column before it's resampled,
+    so a missing value never turns a whole resample into NaN. A column with
+    too few values for the statistic gets a NaN interval.
+
+    Args:
+        data (np.ndarray): 1D array of values or a 2D (n, n_columns) array,
+            each column is resampled separately.
+
+        statistic (str, optional): One of 'mean', 'median', 'std' or 'cov%'.
+            Defaults to 'mean'.
+
+        n_resamples (int, optional): Number of bootstrap resamples.
+            Defaults to 10,000.
+
+        confidence (float, optional): Confidence level of the interval.
+            Defaults to 0.95.
+
+        seed (int, optional): Seed for the random number generator,
+            pass for reproducible intervals.
+
+    Raises:
+        ValueError: If statistic or confidence are invalid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Lower and upper bounds, one per column
+            (0-d for 1D data).
+    """
+
+    if statistic not in STATISTICS:
+        raise ValueError(f"Statistic must be one of {STATISTICS}. Got: {statistic!r}")
+
+    if not 0 < confidence < 1:
+        raise ValueError(f"Confidence must be between 0 and 1. Got: {confidence}")
+
+    x = np.asarray(data, dtype=float)
+    columns = x.reshape(x.shape[0], -1)
+
+    rng = np.random.default_rng(seed)
+    alpha = (1 - confidence) / 2
+    # std and cov% need at least two values
+    min_values = 1 if statistic in ("mean", "median") else 2
+
+    lower = np.full(columns.shape[1], np.nan)
+    upper = np.full(columns.shape[1], np.nan)
+
+    for j, column in enumerate(columns.T):
+        values = column[~np.isnan(column)]
+        n = len(values)
+        if n < min_values:
+            continue
+
+        resampled = np.empty(n_resamples)
+        block = max(1, RESAMPLE_BLOCK // n)
+        for start in range(0, n_resamples, block):
+            size = min(block, n_resamples - start)
+            idx = rng.integers(0, n, size=(size, n))
+            resampled[start : start + size] = _statistic(values[idx], statistic)
+
+        lower[j], upper[j] = np.percentile(resampled, [100 * alpha, 100 * (1 - alpha)])
+
+    return lower.reshape(x.shape[1:]), upper.reshape(x.shape[1:])
@@ -0,0 +1,197 @@
+"""
+Unit conversion to pymechtest's canonical units: stress in MPa and strain in %.
+
+All the calculations (e.g. modulus in GPa = 0.1 * MPa/%) assume these units so
+data in anything else is converted once, as it's loaded.
+
+Stress and strain derived from load and extension are calculated in N and mm
+so they come out in MPa (N/mm^2) and mm/mm.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+from typing import Dict, Optional
+
+# Multiply by these to get MPa
+STRESS_UNITS: Dict[str, float] = {
+    "mpa": 1.0,
+    "n/mm^2": 1.0,
+    "n/mm2": 1.0,
+    "pa": 1e-6,
+    "kpa": 1e-3,
+    "gpa": 1e3,
+    "psi": 6.894757293168361e-3,
+    "ksi": 6.894757293168361,
+}
+
+# Multiply by these to get %
+STRAIN_UNITS: Dict[str, float] = {
+    "%": 1.0,
+    "mm/mm": 100.0,
+    "m/m": 100.0,
+    "in/in": 100.0,
+    "microstrain": 1e-4,
+    "µε": 1e-4,
+    "με": 1e-4,
+    "ue": 1e-4,
+}
+
+# Multiply by these to get N
+LOAD_UNITS: Dict[str, float] = {
+    "n": 1.0,
+    "kn": 1e3,
+    "lbf": 4.4482216152605,
+    "kip": 4448.2216152605,
+    "kgf": 9.80665,
+}
+
+# Load units only told apart by case, looked up exactly as written
+CASED_LOAD_UNITS: Dict[str, float] = {"MN": 1e6, "mN": 1e-3}
+
+# Multiply by these to get mm
+LENGTH_UNITS: Dict[str, float] = {
+    "mm": 1.0,
+    "µm": 1e-3,
+    "um": 1e-3,
+    "cm": 10.0,
+    "m": 1e3,
+    "in": 25.4,
+}
+
+
+def _normalise(unit: str, lower: bool = True) -> str:
+    """
+    Normalises a unit string for lookup, e.g. " (MPa) " -> "mpa".
+
+    Args:
+        unit (str): Unit as passed or as written in a file's units row.
+        lower (bool, optional): Whether to lower case it. Defaults to True.
+
+    Returns:
+        str: Unit without whitespace or enclosing brackets.
+    """
+
+    unit = unit.strip().strip("()[]").strip().replace(" ", "")
+
+    return unit.lower() if lower else unit
+
+
+def stress_factor(unit: Optional[str]) -> float:
+    """
+    Factor to convert stress in 'unit' to MPa.
+
+    Args:
+        unit (Optional[str]): Stress unit e.g. "kPa", "psi". None means MPa.
+
+    Raises:
+        ValueError: If the unit isn't recognised.
+
+    Returns:
+        float: Conversion factor.
+    """
+
+    if unit is None:
+        return 1.0
+
+    try:
+        return STRESS_UNITS[_normalise(unit)]
+    except KeyError:
+        raise ValueError(
+            f"Unrecognised stress units: {unit!r}. "
+            f"Must be one of {list(STRESS_UNITS)}."
+        ) from None
+
+
+def strain_factor(unit: Optional[str]) -> float:
+    """
+    Factor to convert strain in 'unit' to %.
+
+    Args:
+        unit (Optional[str]): Strain unit e.g. "mm/mm", "microstrain".
+            None means %.
+
+    Raises:
+        ValueError: If the unit isn't recognised.
+
+    Returns:
+        float: Conversion factor.
+    """
+
+    if unit is None:
+        return 1.0
+
+    try:
+        return STRAIN_UNITS[_normalise(unit)]
+    except KeyError:
+        raise ValueError(
+            f"Unrecognised strain units: {unit!r}. "
+            f"Must be one of {list(STRAIN_UNITS)}."
+        ) from None
+
+
+def load_factor(unit: Optional[str]) -> float:
+    """
+    Factor to convert load in 'unit' to N.
+
+    Units are case insensitive except for CASED_LOAD_UNITS, where "MN"
+    (meganewton) and "mN" (millinewton) differ by a factor of 10^9.
+
+    Args:
+        unit (Optional[str]): Load unit e.g. "kN", "lbf". None means N.
+
+    Raises:
+        ValueError: If the unit isn't recognised.
+
+    Returns:
+        float: Conversion factor.
+    """
+
+    if unit is None:
+        return 1.0
+
+    cased = _normalise(unit, lower=False)
+    if cased in CASED_LOAD_UNITS:
+        return CASED_LOAD_UNITS[cased]
+
+    try:
+        return LOAD_UNITS[cased.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unrecognised load units: {unit!r}. "
+            f"Must be one of {list(LOAD_UNITS) + list(CASED_LOAD_UNITS)}."
+        ) from None
+
+
+def length_factor(unit: Optional[str], power: int = 1) -> float:
+    """
+    Factor to convert a length (or area, with power=2) in 'unit' to mm.
+
+    Args:
+        unit (Optional[str]): Length unit e.g. "in", or area unit
+            e.g. "mm^2", "in2" if power=2. None means mm.
+        power (int, optional): 1 for lengths, 2 for areas. Defaults to 1.
+
+    Raises:
+        ValueError: If the unit isn't recognised.
+
+    Returns:
+        float: Conversion factor.
+    """
+
+    if unit is None:
+        return 1.0
+
+    key = _normalise(unit)
+    if power > 1:
+        key = key.replace("^", "").replace("²", "")
+        if key.endswith(str(power)):
+            key = key[:-1]
+
+    try:
+        return LENGTH_UNITS[key] ** power
+    except KeyError:
+        raise ValueError(
+            f"Unrecognised length units: {unit!r}. "
+            f"Must be one of {list(LENGTH_UNITS)}."
+        ) from None
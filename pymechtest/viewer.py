@@ -0,0 +1,388 @@
+"""
+Interactive viewer for large sets of stress strain curves.
+
+Rather than shipping every point to the browser (as plot_curves does
+through altair_data_server), the loaded curves are kept in an in-memory
+CurveIndex and the browser asks a local server for just the x (strain)
+range it's showing. Each specimen's points in that range are decimated to at
+most MAX_POINTS, so zooming in brings back the detail without the browser ever
+holding more than MAX_POINTS points per specimen.
+
+Decimation is M4 style: the points are split into buckets in the order they
+were logged and the first, last, lowest and highest stress points of each are
+kept, so peaks, drops and the shape of the line all survive.
+
+Endpoints:
+    GET /: The viewer page.
+
+    GET /curves?x_min=0.1&x_max=0.5&max_points=1000: The decimated curves as
+        JSON records of "Specimen ID", "Strain" and "Stress". Without x_min
+        and x_max, the whole of every curve.
+
+Only the standard library is used on the server, the page needs the vega
+scripts (see report.VEGA_SCRIPTS).
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import html
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from pymechtest import report
+
+# Most points per specimen ever sent to the browser
+MAX_POINTS = 2000
+
+# Wait for zooming or panning to stop for this long (ms) before fetching
+DEBOUNCE_MS = 150
+
+
+def decimate(y: npt.NDArray[np.float64], max_points: int) -> npt.NDArray[np.int64]:
+    """
+    Picks at most 'max_points' points of a curve that keep its shape: the
+    first, last, lowest and highest of each of max_points // 4 buckets.
+
+    Args:
+        y (np.ndarray): Stress, in the order the points were logged. Must
+            not contain NaN.
+        max_points (int): Most points to keep, at least 4.
+
+    Returns:
+        np.ndarray: Sorted positions of the points to keep.
+    """
+
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    buckets = max(1, max_points // 4)
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    bucket = np.repeat(np.arange(buckets), np.diff(edges))
+
+    # Sorted by bucket then stress, so each bucket's min and max are its ends
+    order = np.lexsort((y, bucket))
+    lowest = order[edges[:-1]]
+    highest = order[edges[1:] - 1]
+
+    keep: npt.NDArray[np.int64] = np.unique(
+        np.concatenate([edges[:-1], edges[1:] - 1, lowest, highest])
+    )
+
+    return keep
+
+
+class CurveIndex:
+    def __init__(self, data: pd.DataFrame, strain_col: str, stress_col: str) -> None:
+        """
+        In-memory index of every specimen's curve for level of detail queries.
+
+        Each curve's points are also sorted by strain so the points in any
+        strain range are found by binary search rather than a scan.
+
+        Args:
+            data (pd.DataFrame): Curves as returned by load_all.
+            strain_col (str): Strain column.
+            stress_col (str): Stress column.
+        """
+        self.curves: Dict[str, Tuple[npt.NDArray[Any], ...]] = {}
+        self._overviews: Dict[Tuple[str, int], npt.NDArray[np.int64]] = {}
+
+        for spec_id, group in data.groupby("Specimen ID", sort=False, observed=True):
+            strain = group[strain_col].to_numpy(dtype=float)
+            stress = group[stress_col].to_numpy(dtype=float)
+            valid = ~(np.isnan(strain) | np.isnan(stress))
+            strain, stress = strain[valid], stress[valid]
+            order = np.argsort(strain, kind="stable")
+            self.curves[str(spec_id)] = (strain, stress, order, strain[order])
+
+    def __len__(self) -> int:
+
+        return len(self.curves)
+
+    def _positions(
+        self,
+        spec_id: str,
+        x_min: Optional[float],
+        x_max: Optional[float],
+        max_points: int,
+    ) -> npt.NDArray[np.int64]:
+        """
+        Positions of a specimen's decimated points in a strain range.
+
+        Args:
+            spec_id (str): Specimen ID.
+            x_min (Optional[float]): Lower strain bound, None for no bound.
+            x_max (Optional[float]): Upper strain bound, None for no bound.
+            max_points (int): Most points to return.
+
+        Returns:
+            np.ndarray: Sorted positions in the curve.
+        """
+
+        strain, stress, order, sorted_strain = self.curves[spec_id]
+
+        if x_min is None and x_max is None:
+            key = (spec_id, max_points)
+            if key not in self._overviews:
+                self._overviews[key] = decimate(stress, max_points)
+            return self._overviews[key]
+
+        lower = 0 if x_min is None else np.searchsorted(sorted_strain, x_min, "left")
+        upper = (
+            len(strain)
+            if x_max is None
+            else np.searchsorted(sorted_strain, x_max, "right")
+        )
+        positions = np.sort(order[lower:upper])
+
+        return positions[decimate(stress[positions], max_points)]
+
+    def query(
+        self,
+        x_min: Optional[float] = None,
+        x_max: Optional[float] = None,
+        max_points: int = MAX_POINTS,
+    ) -> pd.DataFrame:
+        """
+        Every specimen's curve in a strain range, decimated.
+
+        Args:
+            x_min (float, optional): Lower strain bound. If not passed,
+                the curves start at the beginning.
+            x_max (float, optional): Upper strain bound. If not passed,
+                the curves run to the end.
+            max_points (int, optional): Most points per specimen, capped at
+                MAX_POINTS. Defaults to MAX_POINTS.
+
+        Raises:
+            ValueError: If max_points is less than 4.
+
+        Returns:
+            pd.DataFrame: "Specimen ID", "Strain" and "Stress".
+        """
+
+        if max_points < 4:
+            raise ValueError(f"max_points must be at least 4. Got: {max_points}")
+
+        max_points = min(max_points, MAX_POINTS)
+
+        frames = []
+        for spec_id, (strain, stress, _, _) in self.curves.items():
+            positions = self._positions(spec_id, x_min, x_max, max_points)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "Specimen ID": spec_id,
+                        "Strain": strain[positions],
+                        "Stress": stress[positions],
+                    }
+                )
+            )
+
+        if not frames:
+            return pd.DataFrame(columns=["Specimen ID", "Strain", "Stress"])
+
+        return pd.concat(frames, ignore_index=True)
+
+
+def _parse_query(query: str) -> Dict[str, Any]:
+    """
+    Parses a /curves query string.
+
+    Args:
+        query (str): URL query string.
+
+    Raises:
+        ValueError: If there are unknown or invalid parameters.
+
+    Returns:
+        Dict[str, Any]: CurveIndex.query keyword arguments.
+    """
+
+    converters = {"x_min": float, "x_max": float, "max_points": int}
+
+    kwargs: Dict[str, Any] = {}
+    for key, values in parse_qs(query).items():
+        if key not in converters:
+            raise ValueError(f"Unknown parameter: {key!r}")
+        kwargs[key] = converters[key](values[-1])
+
+    return kwargs
+
+
+def viewer_html(
+    title: str, x_label: str, y_label: str, height: int = 500, width: int = 750
+) -> str:
+    """
+    The viewer page. Zooming or panning the chart fetches the curves for the
+    new strain range from /curves and swaps them into the chart's data.
+
+    Args:
+        title (str): Chart title.
+        x_label (str): x axis label.
+        y_label (str): y axis label.
+        height (int, optional): Chart height. Defaults to 500.
+        width (int, optional): Chart width. Defaults to 750.
+
+    Returns:
+        str: Complete HTML page.
+    """
+
+    spec = {
+        "$schema": "https://vega.github.io/schema/vega-lite/v4.json",
+        "title": title,
+        "height": height,
+        "width": width,
+        "data": {"name": "curves"},
+        "mark": {"type": "line", "size": 1},
+        "selection": {"zoom": {"type": "interval", "bind": "scales"}},
+        "encoding": {
+            "x": {"field": "Strain", "type": "quantitative", "title": x_label},
+            "y": {"field": "Stress", "type": "quantitative", "title": y_label},
+            "color": {"field": "Specimen ID", "type": "nominal"},
+        },
+    }
+    scripts = "".join(f'<script src="{src}"></script>\n' for src in report.VEGA_SCRIPTS)
+    # Stop anything in the labels closing the script tag early
+    embedded = json.dumps(spec).replace("</", "<\\/")
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+{scripts}</head>
+<body>
+<div id="curves"></div>
+<script>
+vegaEmbed("#curves", {embedded}, {{"actions": false}}).then(function (result) {{
+  var view = result.view;
+  var timer = null;
+  function load(range) {{
+    var query = range ? "?x_min=" + range[0] + "&x_max=" + range[1] : "";
+    fetch("/curves" + query)
+      .then(function (response) {{ return response.json(); }})
+      .then(function (rows) {{
+        view.change("curves", vega.changeset().remove(vega.truthy).insert(rows)).run();
+      }});
+  }}
+  view.addSignalListener("zoom", function (name, value) {{
+    clearTimeout(timer);
+    timer = setTimeout(function () {{ load(value && value.Strain); }}, {DEBOUNCE_MS});
+  }});
+  load(null);
+}});
+</script>
+</body>
+</html>
+"""
+
+
+class ViewerHandler(BaseHTTPRequestHandler):
+    """
+    Request handler, the index and page are set on the server.
+    """
+
+    server: "ViewerServer"
+
+    def _send(self, status: HTTPStatus, body: str, content_type: str) -> None:
+        encoded = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send(status, json.dumps({"error": message}), "application/json")
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+
+        if url.path == "/":
+            self._send(HTTPStatus.OK, self.server.page, "text/html; charset=utf-8")
+            return
+
+        if url.path != "/curves":
+            self._error(HTTPStatus.NOT_FOUND, f"Not found: {self.path}")
+            return
+
+        try:
+            curves = self.server.index.query(**_parse_query(url.query))
+        except ValueError as e:
+            self._error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+
+        self._send(HTTPStatus.OK, curves.to_json(orient="records"), "application/json")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class ViewerServer(ThreadingHTTPServer):
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        index: CurveIndex,
+        page: str,
+        quiet: bool = True,
+    ) -> None:
+        """
+        Threaded HTTP server for the viewer page and its curves.
+
+        Args:
+            address (Tuple[str, int]): (host, port) to listen on.
+            index (CurveIndex): Curves to serve.
+            page (str): Viewer page, from viewer_html.
+            quiet (bool, optional): Don't log every request. Defaults to True.
+        """
+        super().__init__(address, ViewerHandler)
+        self.index = index
+        self.page = page
+        self.quiet = quiet
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """
+        The viewer's address, to open in a browser.
+        """
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "ViewerServer":
+        """
+        Starts serving in a background thread.
+
+        Returns:
+            ViewerServer: The server, to chain with the constructor.
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def close(self) -> None:
+        """
+        Stops serving and closes the socket.
+        """
+
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
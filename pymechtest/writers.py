@@ -0,0 +1,169 @@
+"""
+Chunked file writers used by BaseMechanicalTest.export.
+
+Each writer is handed one dataframe at a time (a specimen's curve, or a batch
+of summary rows) so an export never holds more than one specimen in memory.
+
+Parquet and Arrow (IPC/Feather v2) need pyarrow, HDF5 needs PyTables.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import abc
+import warnings
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+
+# Export format: file suffix
+FORMATS: Dict[str, str] = {"parquet": ".parquet", "arrow": ".arrow", "hdf5": ".h5"}
+
+
+class Writer(abc.ABC):
+    def __init__(self, path: Path) -> None:
+        """
+        Base chunked writer, appends dataframes to a single file.
+
+        Every dataframe written must have the same columns and dtypes
+        as the first.
+
+        Args:
+            path (Path): File to write.
+        """
+        self.path = path
+
+    @abc.abstractmethod
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        Appends a chunk.
+
+        Args:
+            df (pd.DataFrame): Chunk to append.
+        """
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """
+        Finishes the file.
+        """
+
+
+class ArrowWriter(Writer):
+    def __init__(self, path: Path, file_format: str) -> None:
+        """
+        Writes Parquet (one row group per chunk) or Arrow IPC files.
+
+        Args:
+            path (Path): File to write.
+            file_format (str): "parquet" or "arrow".
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        super().__init__(path)
+
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError(
+                f"Exporting to {file_format} requires pyarrow. "
+                "Install it with 'pip install pymechtest[parquet]'."
+            ) from e
+
+        self.pa = pyarrow
+        self.file_format = file_format
+        self.schema: Any = None
+        self.writer: Any = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.writer is None:
+            table = self.pa.Table.from_pandas(df, preserve_index=False)
+            self.schema = table.schema
+            if self.file_format == "parquet":
+                import pyarrow.parquet as pq
+
+                self.writer = pq.ParquetWriter(str(self.path), self.schema)
+            else:
+                self.writer = self.pa.ipc.new_file(str(self.path), self.schema)
+        else:
+            try:
+                table = self.pa.Table.from_pandas(
+                    df, schema=self.schema, preserve_index=False
+                )
+            except (KeyError, self.pa.ArrowException) as e:
+                raise ValueError(
+                    f"Columns {df.columns.tolist()} don't match the first chunk "
+                    f"written to {str(self.path)}: {self.schema.names}"
+                ) from e
+
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+
+
+class HDFWriter(Writer):
+    def __init__(self, path: Path) -> None:
+        """
+        Writes a queryable HDF5 table (key "data") appending each chunk.
+
+        Args:
+            path (Path): File to write.
+
+        Raises:
+            ImportError: If PyTables is not installed.
+        """
+        super().__init__(path)
+
+        try:
+            from tables import NaturalNameWarning
+        except ImportError as e:
+            raise ImportError(
+                "Exporting to hdf5 requires PyTables. "
+                "Install it with 'pip install pymechtest[hdf5]'."
+            ) from e
+
+        self.natural_name_warning = NaturalNameWarning
+        self.store = pd.HDFStore(str(path), mode="w")
+
+    def write(self, df: pd.DataFrame) -> None:
+        try:
+            with warnings.catch_warnings():
+                # PyTables warns about "Specimen ID" not being a python identifier
+                warnings.simplefilter("ignore", self.natural_name_warning)
+                self.store.append(
+                    "data",
+                    df,
+                    format="table",
+                    data_columns=["Specimen ID"],
+                    index=False,
+                )
+        except ValueError as e:
+            raise ValueError(
+                f"Columns {df.columns.tolist()} don't match the first chunk "
+                f"written to {str(self.path)}"
+            ) from e
+
+    def close(self) -> None:
+        self.store.close()
+
+
+def make_writer(path: Path, file_format: str) -> Writer:
+    """
+    Creates a writer for an export format.
+
+    Args:
+        path (Path): File to write.
+        file_format (str): One of FORMATS.
+
+    Returns:
+        Writer: The writer.
+    """
+
+    if file_format == "hdf5":
+        return HDFWriter(path)
+
+    return ArrowWriter(path, file_format)
@@ -5,8 +5,13 @@ Author: Tom Fleet
 Created: 31/12/2020
 """
 
+import csv
+import gzip
+import lzma
+import shutil
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -74,6 +79,252 @@ def base_yield():
     )
 
 
+@pytest.fixture
+def compressed_yield_folder(tmp_path):
+    """
+    A copy of the yield test data with the files spread across
+    gzip, xz and (if zstandard is available) zstandard compression.
+    """
+
+    openers = [gzip.open, lzma.open]
+    suffixes = [".gz", ".xz"]
+
+    try:
+        import zstandard
+
+        openers.append(zstandard.open)
+        suffixes.append(".zst")
+    except ImportError:
+        pass
+
+    source = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+    for i, f in enumerate(sorted(source.glob("*.csv"))):
+        opener = openers[i % len(openers)]
+        suffix = suffixes[i % len(suffixes)]
+        with opener(tmp_path.joinpath(f.name + suffix), "wb") as out:
+            out.write(f.read_bytes())
+
+    return tmp_path
+
+
+@pytest.fixture
+def converted_yield_folder(tmp_path):
+    """
+    A copy of the yield test data with stress in kPa and strain
+    in mm/mm, as written in each file's units row.
+    """
+
+    source = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+    for f in sorted(source.glob("*.csv")):
+        with open(f) as src:
+            rows = list(csv.reader(src))
+
+        # Units row is straight after the header, then the data
+        units = next(i for i, row in enumerate(rows) if row[:1] == ["Time"]) + 1
+        rows[units][3], rows[units][4] = "(mm/mm)", "(kPa)"
+        for row in rows[units + 1 :]:
+            row[3] = repr(float(row[3]) / 100)
+            row[4] = repr(float(row[4].replace(",", "")) * 1000)
+
+        with open(tmp_path.joinpath(f.name), "w", newline="") as out:
+            csv.writer(out).writerows(rows)
+
+    return tmp_path
+
+
+@pytest.fixture
+def fractured_yield_folder(tmp_path):
+    """
+    A copy of the yield test data with 1,000 rows of noise logged after
+    fracture, with the extensometer strain falling back to about 0.01 %
+    (inside base_yield's modulus window) and the stress around zero.
+    """
+
+    source = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+    rng = np.random.default_rng(42)
+
+    for f in sorted(source.glob("*.csv")):
+        with open(f) as src:
+            rows = list(csv.reader(src))
+
+        last = float(rows[-1][0])
+        for i in range(1, 1001):
+            rows.append(
+                [
+                    f"{last + 0.1 * i:.5f}",
+                    rows[-1][1],
+                    f"{rng.normal(0, 5):.5f}",
+                    f"{0.01 + rng.normal(0, 0.001):.5f}",
+                    f"{rng.normal(0, 0.5):.5f}",
+                ]
+            )
+
+        with open(tmp_path.joinpath(f.name), "w", newline="") as out:
+            csv.writer(out).writerows(rows)
+
+    return tmp_path
+
+
+@pytest.fixture
+def lots_yield_folder(tmp_path):
+    """
+    The yield test data split across two lot subfolders.
+    """
+
+    source = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+    for i, f in enumerate(sorted(source.glob("*.csv"))):
+        lot = tmp_path.joinpath("lot_a" if i < 5 else "lot_b")
+        lot.mkdir(exist_ok=True)
+        shutil.copy(f, lot.joinpath(f.name))
+
+    return tmp_path
+
+
+@pytest.fixture
+def duplicated_yield_folder(tmp_path):
+    """
+    The yield test data plus a "copies" subfolder with two duplicates:
+    Specimen_RawData_1.csv copied as is and Specimen_RawData_2.csv re-exported
+    gzipped under a new name, with unix line endings and a new Specimen ID.
+    """
+
+    source = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+    for f in source.glob("*.csv"):
+        shutil.copy(f, tmp_path.joinpath(f.name))
+
+    copies = tmp_path.joinpath("copies")
+    copies.mkdir()
+    shutil.copy(source.joinpath("Specimen_RawData_1.csv"), copies)
+
+    text = source.joinpath("Specimen_RawData_2.csv").read_text()
+    with gzip.open(copies.joinpath("Reexport.csv.gz"), "wt", newline="\n") as out:
+        out.write(text.replace('Specimen ID,"008"', 'Specimen ID,"108"'))
+
+    return tmp_path
+
+
+@pytest.fixture
+def malformed_yield_folder(tmp_path):
+    """
+    The yield test data plus two files that can't be summarised:
+    Specimen_RawData_11.csv cut off before its table header and
+    Specimen_RawData_12.csv.gz which isn't really gzipped.
+    """
+
+    source = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+    for f in source.glob("*.csv"):
+        shutil.copy(f, tmp_path.joinpath(f.name))
+
+    lines = source.joinpath("Specimen_RawData_1.csv").read_text().splitlines()
+    tmp_path.joinpath("Specimen_RawData_11.csv").write_text("\n".join(lines[:5]))
+    tmp_path.joinpath("Specimen_RawData_12.csv.gz").write_bytes(b"not gzip")
+
+    return tmp_path
+
+
+@pytest.fixture
+def truncated_gzip_yield_folder(duplicated_yield_folder):
+    """
+    The duplicated yield test data plus Truncated.csv.gz, a gzipped copy of
+    Specimen_RawData_3.csv cut off part way through.
+    """
+
+    source = duplicated_yield_folder.joinpath("Specimen_RawData_3.csv")
+    data = gzip.compress(source.read_bytes())
+    duplicated_yield_folder.joinpath("Truncated.csv.gz").write_bytes(
+        data[: len(data) // 2]
+    )
+
+    return duplicated_yield_folder
+
+
+@pytest.fixture
+def load_extension_folder(tmp_path):
+    """
+    Copies of the Tens_Yield data with the stress and strain columns removed,
+    as if the machine only exported Time, Extension and Load.
+    """
+
+    source = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+    for f in source.glob("*.csv"):
+        with open(f, newline="") as src:
+            rows = [row[:3] if len(row) == 5 else row for row in csv.reader(src)]
+        with open(tmp_path.joinpath(f.name), "w", newline="") as dst:
+            csv.writer(dst, lineterminator="\r\n").writerows(rows)
+
+    return tmp_path
+
+
+@pytest.fixture
+def fatigue_folder(tmp_path):
+    """
+    A synthetic 200 cycle fatigue test with elliptical hysteresis loops.
+
+    strain = 0.5 sin(wt), stress = E(t) * strain + 20 cos(wt) so every loop has
+    an area of pi * 0.5 * 20 (MPa %) and the stiffness falls by 20% over the test.
+    """
+
+    t = np.arange(100 * 200 + 1) / 100
+    strain = 0.5 * np.sin(2 * np.pi * t)
+    modulus = 200 * (1 - 0.2 * t / t[-1])
+    stress = modulus * strain + 20 * np.cos(2 * np.pi * t)
+
+    pd.DataFrame({"Time": t, "Strain": strain, "Stress": stress}).to_csv(
+        tmp_path.joinpath("Fatigue_1.csv"), index=False
+    )
+
+    return tmp_path
+
+
+@pytest.fixture
+def rainflow_folder(tmp_path):
+    """
+    The ASTM E1049 rainflow counting example load history
+    (-2, 1, -3, 5, -1, 3, -4, 4, -2) sampled at 10 points per half cycle.
+    """
+
+    history = [0, -2, 1, -3, 5, -1, 3, -4, 4, -2, 0]
+    stress = np.concatenate(
+        [np.linspace(a, b, 10, endpoint=False) for a, b in zip(history, history[1:])]
+        + [[0.0]]
+    )
+
+    pd.DataFrame({"Strain": stress / 100, "Stress": stress}).to_csv(
+        tmp_path.joinpath("Rainflow.csv"), index=False
+    )
+
+    return tmp_path
+
+
+@pytest.fixture
+def creep_folder(tmp_path):
+    """
+    Two synthetic creep tests logged at 1 Hz for 10^5 s.
+
+    Primary creep follows strain = A * t^0.3 up to 1000 s, after which
+    the strain grows linearly at a secondary creep rate of 1e-5 %/s.
+    """
+
+    t = np.arange(100_000 + 1, dtype=float)
+
+    for i, coefficient in enumerate((0.2, 0.3), start=1):
+        primary = coefficient * t**0.3
+        secondary = coefficient * 1000**0.3 + 1e-5 * (t - 1000)
+        strain = np.where(t < 1000, primary, secondary)
+
+        pd.DataFrame({"Time (s)": t, "Strain (%)": strain}).to_csv(
+            tmp_path.joinpath(f"Creep_{i}.csv"), index=False
+        )
+
+    return tmp_path
+
+
 @pytest.fixture
 def base_no_yield_no_stress_strain_cols():
     """
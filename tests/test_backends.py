@@ -0,0 +1,195 @@
+"""
+Tests for the polars backend, which should give the same results
+as the default pandas one.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import gc
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+from pandas.testing import assert_frame_equal
+
+from pymechtest import Tensile, backends, base
+
+from .test_utils import TENS_NO_YIELD, TENS_YIELD
+
+pytest.importorskip("polars")
+
+
+def assert_summaries_match(left, right):
+
+    assert left.columns.tolist() == right.columns.tolist()
+    assert left["Specimen ID"].tolist() == right["Specimen ID"].tolist()
+    assert_allclose(
+        left.drop(columns="Specimen ID").to_numpy(dtype=float, na_value=np.nan),
+        right.drop(columns="Specimen ID").to_numpy(dtype=float, na_value=np.nan),
+    )
+
+
+@pytest.mark.parametrize(
+    "folder, kwargs",
+    [
+        (TENS_YIELD, {}),
+        (TENS_YIELD, {"auto_modulus": True}),
+        (TENS_YIELD, {"methods": ["chord", "rp0.5", "reh", "slope threshold"]}),
+        (TENS_NO_YIELD, {"expect_yield": False}),
+        (TENS_NO_YIELD, {"expect_yield": False, "methods": ["tangent"]}),
+    ],
+)
+def test_polars_summarise_matches_pandas(folder, kwargs):
+
+    pandas_obj = Tensile(folder, id_row=3, header=8, **kwargs)
+    polars_obj = Tensile(folder, id_row=3, header=8, backend="polars", **kwargs)
+
+    assert_summaries_match(polars_obj.summarise(), pandas_obj.summarise())
+
+
+def test_polars_load_all_matches_pandas():
+
+    pandas_obj = Tensile(TENS_YIELD, id_row=3, header=8)
+    polars_obj = Tensile(TENS_YIELD, id_row=3, header=8, backend="polars")
+
+    assert_frame_equal(polars_obj.load_all(), pandas_obj.load_all())
+
+
+def test_polars_summarise_by_folder(lots_yield_folder):
+
+    pandas_obj = Tensile(lots_yield_folder, id_row=3, header=8)
+    polars_obj = Tensile(lots_yield_folder, id_row=3, header=8, backend="polars")
+
+    assert_frame_equal(
+        polars_obj.summarise(by="Folder")[["Specimen ID", "Folder"]],
+        pandas_obj.summarise(by="Folder")[["Specimen ID", "Folder"]],
+    )
+
+
+def test_polars_compressed_matches_pandas(compressed_yield_folder):
+
+    pandas_obj = Tensile(compressed_yield_folder, id_row=3, header=8)
+    polars_obj = Tensile(compressed_yield_folder, id_row=3, header=8, backend="polars")
+
+    assert_summaries_match(polars_obj.summarise(), pandas_obj.summarise())
+
+
+def test_polars_streams_decompression(compressed_yield_folder, monkeypatch):
+
+    reads = []
+    original = base._open_text
+
+    class Recorder:
+        def __init__(self, f):
+            self.f = f
+
+        def read(self, size=-1):
+            reads.append(size)
+            return self.f.read(size)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self.f.close()
+
+    monkeypatch.setattr(base, "DECOMPRESS_CHUNK", 4096)
+    monkeypatch.setattr(base, "_open_text", lambda fp: Recorder(original(fp)))
+
+    obj = Tensile(compressed_yield_folder, id_row=3, header=8, backend="polars")
+    obj._decompressed(next(compressed_yield_folder.glob("*.gz")))
+
+    # Read a chunk at a time, never the whole file in one go
+    assert len(reads) > 2
+    assert set(reads) == {4096}
+
+
+def test_polars_decompressed_copies_reused_and_deleted(compressed_yield_folder):
+
+    obj = Tensile(compressed_yield_folder, id_row=3, header=8, backend="polars")
+    fp = next(compressed_yield_folder.glob("*.gz"))
+
+    copy = obj._decompressed(fp)
+    mtime = copy.stat().st_mtime_ns
+
+    assert obj._decompressed(fp) == copy
+    assert copy.stat().st_mtime_ns == mtime
+
+    del obj
+    gc.collect()
+
+    assert not copy.parent.exists()
+
+
+def test_polars_converts_units(converted_yield_folder):
+
+    pandas_obj = Tensile(TENS_YIELD, id_row=3, header=8)
+    polars_obj = Tensile(converted_yield_folder, id_row=3, header=8, backend="polars")
+
+    assert_summaries_match(polars_obj.summarise(), pandas_obj.summarise())
+
+
+def test_header_line_counts_blank_lines():
+
+    obj = Tensile(TENS_YIELD, header=8)
+
+    # There's a blank line between the metadata and the header
+    assert obj._header_line(TENS_YIELD.joinpath("Specimen_RawData_1.csv")) == 9
+
+
+def test_header_line_raises_past_end_of_file():
+
+    obj = Tensile(TENS_YIELD, header=100_000)
+
+    with pytest.raises(ValueError):
+        obj._header_line(TENS_YIELD.joinpath("Specimen_RawData_1.csv"))
+
+
+def test_to_numeric_matches_clean():
+
+    import polars as pl
+
+    raw = {
+        backends.ROW_COL: [0, 1, 2, 3],
+        "Load": ["(N)", " 1,000.5 ", "", "3"],
+        "Stress": ["(MPa)", "2", "", "x"],
+    }
+
+    cleaned = backends.to_numeric(pl.LazyFrame(raw)).collect().to_pandas()
+    expected = Tensile._clean(pd.DataFrame(raw).set_index(backends.ROW_COL))
+
+    assert cleaned[backends.ROW_COL].tolist() == expected.index.tolist()
+    assert_allclose(cleaned[["Load", "Stress"]].to_numpy(), expected.to_numpy())
+    assert np.isnan(cleaned["Stress"].iloc[-1])
+
+
+def test_invalid_backend_raises():
+
+    obj = Tensile(TENS_YIELD, id_row=3, header=8, backend="spark")
+
+    with pytest.raises(ValueError):
+        obj.summarise()
+
+
+def test_polars_missing_raises_helpful_import_error(monkeypatch):
+
+    monkeypatch.setitem(sys.modules, "polars", None)
+
+    obj = Tensile(TENS_YIELD, id_row=3, header=8, backend="polars")
+
+    with pytest.raises(ImportError, match="pymechtest\\[polars\\]"):
+        obj.load_all()
+
+
+def test_polars_detect_break_matches_pandas(fractured_yield_folder):
+
+    kwargs = dict(id_row=3, header=8, strain1=0.005, strain2=0.015, detect_break=True)
+
+    pandas_obj = Tensile(fractured_yield_folder, **kwargs)
+    polars_obj = Tensile(fractured_yield_folder, backend="polars", **kwargs)
+
+    assert_frame_equal(polars_obj.load_all(), pandas_obj.load_all())
+    assert_summaries_match(polars_obj.summarise(), pandas_obj.summarise())
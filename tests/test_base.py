@@ -6,17 +6,26 @@ Created: 28/11/2020
 """
 
 import collections
+import copy
+import functools
+import gzip
 import json
+import os
+import shutil
+import warnings
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 from pandas.testing import assert_frame_equal, assert_series_equal
 
+from pymechtest import base, results, writers
 from pymechtest.base import BaseMechanicalTest
 
 from .test_utils import (
+    TENS_YIELD,
     paths,
     paths_and_df_shapes_no_yield,
     paths_and_df_shapes_yield,
@@ -52,6 +61,15 @@ def test_base_init():
     assert obj.strain1 == 0.05
     assert obj.strain2 == 0.15
     assert obj.expect_yield is False
+    assert obj.auto_modulus is False
+    assert obj.stress_units is None
+    assert obj.strain_units is None
+    assert obj.methods is None
+    assert obj.backend == "pandas"
+    assert obj.jit is False
+    assert obj.screen is None
+    assert obj.detect_break is False
+    assert obj.dedupe is None
 
 
 def test_base_repr():
@@ -73,7 +91,16 @@ def test_base_repr():
         "stress_col='BaseMechanicalTest stress', "
         "strain_col='BaseMechanicalTest strain (Strain 1)', "
         "header=8, "
-        "strain1=0.05, strain2=0.15, expect_yield=False)"
+        "strain1=0.05, strain2=0.15, expect_yield=False, "
+        "auto_modulus=False, "
+        "stress_units=None, "
+        "strain_units=None, "
+        "methods=None, "
+        "backend='pandas', "
+        "jit=False, "
+        "screen=None, "
+        "detect_break=False, "
+        "dedupe=None)"
     )
 
 
@@ -206,6 +233,66 @@ def test_load_yield(base_yield, filepath, df_shape):
     assert trans_obj._load(filepath).shape == df_shape
 
 
+def test_clean_whitespace_and_thousands_separators():
+
+    raw = pd.DataFrame(
+        {
+            "Strain": [" 1.5 ", "\t7\t", "1,234", " 2,345.5 ", "1e3 "],
+            "Stress": ["3", " 4", "1,000,000", "5 ", "8"],
+        }
+    )
+
+    df = BaseMechanicalTest._clean(raw)
+
+    assert_frame_equal(
+        df,
+        pd.DataFrame(
+            {
+                "Strain": [1.5, 7.0, 1234.0, 2345.5, 1000.0],
+                "Stress": [3.0, 4.0, 1_000_000.0, 5.0, 8.0],
+            }
+        ),
+    )
+
+
+def test_clean_drops_non_numeric_rows():
+
+    raw = pd.DataFrame(
+        {
+            "Strain": ["(%)", "1.0", "", None, "2.0"],
+            "Stress": ["(MPa)", "x", "", None, 3],
+        }
+    )
+
+    df = BaseMechanicalTest._clean(raw)
+
+    assert df.index.tolist() == [1, 4]
+    assert_allclose(df["Strain"], [1.0, 2.0])
+    assert_allclose(df["Stress"], [np.nan, 3.0])
+
+
+def test_clean_matches_element_wise_cleaning():
+
+    # The original per element clean up, which _clean must still agree with
+    def reference(df):
+        return (
+            df.applymap(
+                lambda x: x.strip().replace(",", "") if isinstance(x, str) else x
+            )
+            .apply(pd.to_numeric, errors="coerce")
+            .dropna(how="all")
+        )
+
+    raw = pd.DataFrame(
+        {
+            "Strain": [" 1.5 ", "1,234", "(mm)", "", None, "abc", 4, 5.5],
+            "Stress": ["3", " 2,345.5 ", "(kN)", "", None, "1,2,3", "-7 ", "1e-3"],
+        }
+    )
+
+    assert_frame_equal(BaseMechanicalTest._clean(raw), reference(raw))
+
+
 def test_load_all_no_yield(base_no_yield):
 
     obj = base_no_yield
@@ -240,6 +327,56 @@ def test_load_all_yield(base_yield):
     ]
 
 
+def test_find_files_discovers_compressed(compressed_yield_folder):
+
+    obj = BaseMechanicalTest(folder=compressed_yield_folder)
+
+    files = obj._find_files()
+
+    assert len(files) == 10
+    assert all(f.name.endswith((".csv.gz", ".csv.xz", ".csv.zst")) for f in files)
+
+
+def test_load_all_compressed_matches_uncompressed(base_yield, compressed_yield_folder):
+
+    obj = base_yield
+
+    truth_df = obj.load_all()
+
+    obj.folder = compressed_yield_folder
+
+    test_df = obj.load_all()
+
+    assert test_df.shape == truth_df.shape == (2965, 6)
+    assert sorted(test_df["Specimen ID"].unique()) == sorted(
+        truth_df["Specimen ID"].unique()
+    )
+
+
+def test_summarise_compressed_matches_uncompressed(base_yield, compressed_yield_folder):
+
+    obj = base_yield
+
+    truth_df = obj.summarise().sort_values("Specimen ID").reset_index(drop=True)
+
+    obj.folder = compressed_yield_folder
+
+    test_df = obj.summarise().sort_values("Specimen ID").reset_index(drop=True)
+
+    assert_frame_equal(test_df, truth_df)
+
+
+def test_get_specimen_id_default_strips_compression_suffix(
+    base_no_yield_no_id, compressed_yield_folder
+):
+
+    obj = base_no_yield_no_id
+
+    fp = sorted(compressed_yield_folder.glob("*.csv.gz"))[0]
+
+    assert obj._get_specimen_id(fp) == fp.name[: -len(".gz")]
+
+
 def test_specimen_id_column_no_yield(base_no_yield):
 
     obj = base_no_yield
@@ -327,6 +464,113 @@ def test_extract_values_yield(base_yield, filepath, extracted_series):
     )
 
 
+@pytest.mark.parametrize("filepath, df_shape", paths_and_df_shapes_yield)
+def test_load_usecols(base_yield, filepath, df_shape):
+
+    obj = base_yield
+
+    df = obj._load(filepath, usecols=obj._summary_cols(filepath))
+
+    # Strain, stress and Specimen ID
+    assert df.shape == (df_shape[0], 3)
+
+
+def test_summary_cols_autodetects_from_header(base_yield_no_stress_strain_cols):
+
+    obj = base_yield_no_stress_strain_cols
+
+    filepath = sorted(obj._find_files())[0]
+
+    assert obj._summary_cols(filepath) == [
+        "Tensile strain (Strain 1)",
+        "Tensile stress",
+    ]
+
+
+@pytest.mark.parametrize(
+    "filepath, extracted_series", paths_and_extract_values_series_no_yield
+)
+def test_summarise_file_no_yield(base_no_yield, filepath, extracted_series):
+
+    obj = base_no_yield
+
+    assert_series_equal(obj._summarise_file(filepath), extracted_series, atol=0.01)
+
+
+@pytest.mark.parametrize(
+    "filepath, extracted_series", paths_and_extract_values_series_yield
+)
+def test_summarise_file_yield(base_yield, filepath, extracted_series):
+
+    obj = base_yield
+
+    assert_series_equal(obj._summarise_file(filepath), extracted_series, atol=0.01)
+
+
+@pytest.mark.parametrize(
+    "filepath, extracted_series", paths_and_extract_values_series_no_yield
+)
+def test_reduce_small_chunks(base_no_yield, filepath, extracted_series, monkeypatch):
+
+    # Force lots of chunks so the running max is carried between them
+    monkeypatch.setattr(base, "CHUNKSIZE", 50)
+
+    obj = base_no_yield
+
+    reduced = obj._reduce(filepath)
+
+    assert len(reduced) < len(obj._load(filepath))
+    assert_series_equal(obj._extract_values(reduced), extracted_series, atol=0.01)
+
+
+def test_find_modulus_window_bilinear(base_no_yield):
+
+    obj = base_no_yield
+    obj.strain1, obj.strain2 = 0.1, 0.3
+
+    # Elastic to 1% strain then a (more linear) low slope plastic region
+    strain = np.linspace(0, 5, 100_000)
+    noise = np.random.default_rng(0).normal(0, 0.5, strain.size)
+    stress = np.where(strain < 1, 200 * strain, 200 + 20 * (strain - 1)) + noise
+
+    df = pd.DataFrame({obj.strain_col: strain, obj.stress_col: stress})
+
+    lower, upper = obj._find_modulus_window(df)
+
+    assert 0 <= lower < upper <= 1
+    assert_almost_equal(upper - lower, 0.2, decimal=3)
+
+    obj.auto_modulus = True
+    assert_almost_equal(obj._calc_slope(df)[0], 200, decimal=0)
+
+
+def test_find_modulus_window_short_curve_falls_back(base_no_yield):
+
+    obj = base_no_yield
+
+    df = pd.DataFrame({obj.strain_col: [0.0, 0.1, 0.2], obj.stress_col: [0, 1, 2]})
+
+    assert obj._find_modulus_window(df) == (obj.strain1, obj.strain2)
+
+
+def test_summarise_auto_modulus(base_yield):
+
+    obj = base_yield
+    obj.auto_modulus = True
+
+    df = obj.summarise()
+
+    assert df.columns.to_list() == [
+        "Specimen ID",
+        "Strength",
+        "Modulus",
+        "Modulus Strain1",
+        "Modulus Strain2",
+        "Yield Strength",
+    ]
+    assert (df["Modulus Strain1"] < df["Modulus Strain2"]).all()
+
+
 def test_summarise_no_yield(base_no_yield):
 
     obj = base_no_yield
@@ -548,6 +792,141 @@ def test_stats_yield(base_yield):
     assert_frame_equal(test_df, truth_df, atol=0.01)
 
 
+def test_stats_basis_and_bootstrap_rows(base_yield):
+
+    obj = base_yield
+
+    df = obj.stats(basis="b", n_resamples=2000, seed=1)
+
+    assert list(df.index[-3:]) == ["B-basis", "mean 95% CI lower", "mean 95% CI upper"]
+    assert (df.loc["B-basis"] < df.loc["min"]).all()
+    assert (df.loc["mean 95% CI lower"] < df.loc["mean"]).all()
+    assert (df.loc["mean 95% CI upper"] > df.loc["mean"]).all()
+
+
+def test_stats_basis_only_for_strength_and_modulus(base_yield):
+
+    obj = base_yield
+    obj.screen = "flag"
+    obj.auto_modulus = True
+
+    df = obj.stats(basis="B", distribution="weibull")
+
+    # Zero Offset has non-positive values and neither it nor the strains are
+    # strength or modulus values, but they don't stop the rest being calculated
+    assert df.loc["B-basis"].notna().to_dict() == {
+        col: col in ("Strength", "Modulus", "Yield Strength") for col in df.columns
+    }
+
+
+def test_stats_basis_all_missing_column(base_yield):
+
+    obj = base_yield
+    obj.methods = ["reh", "rel"]
+    # No yield drop past this window so no upper or lower yield strengths
+    obj.strain1, obj.strain2 = 0.05, 0.15
+
+    df = obj.stats(basis="B")
+
+    assert df.loc["B-basis", ["ReH", "ReL"]].isna().all()
+    assert df.loc["B-basis", ["Strength", "Modulus"]].notna().all()
+
+
+def test_stats_basis_single_specimen_group(base_yield, lots_yield_folder):
+
+    obj = base_yield
+    obj.folder = lots_yield_folder
+    lot_b = lots_yield_folder.joinpath("lot_b")
+    for fp in sorted(lot_b.iterdir())[1:]:
+        fp.unlink()
+
+    df = obj.stats(by="Folder", basis="B")
+
+    assert df.loc[("lot_b", "B-basis")].isna().all()
+    assert df.loc[("lot_a", "B-basis")].notna().all()
+
+
+def test_stats_default_has_no_extra_rows(base_no_yield):
+
+    obj = base_no_yield
+
+    assert list(obj.stats().index) == [
+        "count",
+        "mean",
+        "std",
+        "cov%",
+        "min",
+        "25%",
+        "50%",
+        "75%",
+        "max",
+    ]
+
+
+def test_get_metadata(base_yield):
+
+    obj = base_yield
+
+    metadata = obj._get_metadata(TENS_YIELD.joinpath("Specimen_RawData_1.csv"))
+
+    assert metadata["Specimen ID"] == "009"
+    assert metadata["Length"] == "26.00000"
+    assert metadata["Width"] == "10.14400"
+    assert "Time" not in metadata
+
+
+def test_get_group_keys_raises_on_missing_key(base_yield):
+
+    obj = base_yield
+
+    with pytest.raises(ValueError):
+        obj._get_group_keys(
+            TENS_YIELD.joinpath("Specimen_RawData_1.csv"), ["Temperature"]
+        )
+
+
+def test_summarise_by_folder(base_yield, lots_yield_folder):
+
+    obj = base_yield
+    obj.folder = lots_yield_folder
+
+    df = obj.summarise(by="Folder")
+
+    assert df.columns.to_list() == [
+        "Specimen ID",
+        "Folder",
+        "Strength",
+        "Modulus",
+        "Yield Strength",
+    ]
+    assert df["Folder"].value_counts().to_dict() == {"lot_a": 5, "lot_b": 5}
+
+
+def test_stats_by_folder_matches_per_folder_stats(base_yield, lots_yield_folder):
+
+    obj = base_yield
+    obj.folder = lots_yield_folder
+
+    grouped = obj.stats(by="Folder", basis="B")
+
+    assert grouped.index.names == ["Folder", None]
+
+    for lot in ["lot_a", "lot_b"]:
+        obj.folder = lots_yield_folder.joinpath(lot)
+        assert_frame_equal(grouped.loc[lot], obj.stats(basis="B"))
+
+
+def test_stats_by_metadata_and_folder(base_yield, lots_yield_folder):
+
+    obj = base_yield
+    obj.folder = lots_yield_folder
+
+    grouped = obj.stats(by=["Length", "Folder"])
+
+    assert grouped.index.names == ["Length", "Folder", None]
+    assert grouped.loc[("26.00000", "lot_a", "count"), "Strength"] == 5
+
+
 def test_base_plot_curves_no_yield(base_no_yield):
 
     obj = base_no_yield
@@ -627,3 +1006,1076 @@ def test_plot_curves_raises_on_invalid_save_method(base_no_yield):
     with pytest.raises(ValueError):
         # Attempt to save a graph with an invalid save method
         obj.plot_curves(save_method="silly_method")
+
+
+def test_get_units(base_yield):
+
+    fp = base_yield._find_files()[0]
+
+    assert base_yield._get_units(fp) == {
+        "Time": "(s)",
+        "Extension": "(mm)",
+        "Load": "(N)",
+        "Tensile strain (Strain 1)": "(%)",
+        "Tensile stress": "(MPa)",
+    }
+
+
+def test_get_units_no_units_row(fatigue_folder):
+
+    obj = BaseMechanicalTest(folder=fatigue_folder)
+
+    assert obj._get_units(obj._find_files()[0]) == {}
+
+
+def test_unit_factors_detected(base_yield, converted_yield_folder):
+
+    obj = base_yield
+    obj.folder = converted_yield_folder
+
+    assert obj._unit_factors(obj._find_files()[0]) == (100.0, 1e-3)
+
+
+def test_unit_factors_passed_take_precedence(base_yield):
+
+    obj = base_yield
+    obj.stress_units = "psi"
+    obj.strain_units = "microstrain"
+
+    assert obj._unit_factors(obj._find_files()[0]) == pytest.approx((1e-4, 6.894757e-3))
+
+
+def test_unit_factors_unrecognised(base_yield):
+
+    obj = base_yield
+    obj.stress_units = "furlongs"
+
+    with pytest.raises(ValueError, match="Unrecognised stress units"):
+        obj._unit_factors(obj._find_files()[0])
+
+
+@pytest.mark.parametrize("expect_yield", [True, False])
+def test_summarise_converted_units_matches(
+    base_yield, converted_yield_folder, expect_yield
+):
+
+    obj = base_yield
+    obj.expect_yield = expect_yield
+
+    truth_df = obj.summarise()
+
+    obj.folder = converted_yield_folder
+
+    test_df = obj.summarise()
+
+    assert_frame_equal(test_df, truth_df, check_dtype=False)
+
+
+def test_load_all_converted_units_matches(base_yield, converted_yield_folder):
+
+    obj = base_yield
+
+    truth_df = obj.load_all()
+
+    obj.folder = converted_yield_folder
+
+    test_df = obj.load_all()
+
+    assert_frame_equal(
+        test_df[[obj.strain_col, obj.stress_col]],
+        truth_df[[obj.strain_col, obj.stress_col]],
+    )
+
+
+def test_get_stress_strain_cols_load_extension():
+
+    obj = BaseMechanicalTest(folder="made/up/folder")
+    df = pd.DataFrame(columns=["Time", "Extension", "Load"])
+
+    obj._get_stress_strain_cols(df)
+
+    assert obj.stress_col == base.DERIVED_STRESS
+    assert obj.strain_col == base.DERIVED_STRAIN
+    assert obj._load_col == "Load"
+    assert obj._extension_col == "Extension"
+    assert obj._source_cols() == ["Extension", "Load"]
+
+
+def test_get_stress_strain_cols_prefers_stress_over_load(base_yield):
+
+    obj = BaseMechanicalTest(folder="made/up/folder")
+
+    obj._get_stress_strain_cols(base_yield._load(base_yield._find_files()[0]))
+
+    assert obj.stress_col == "Tensile stress"
+    assert obj._load_col is None
+
+
+def test_get_geometry(base_yield):
+
+    fp = base_yield._find_files()[0]
+
+    assert base_yield._get_geometry(fp) == pytest.approx(
+        {"length": 26.0, "thickness": 1.989, "width": 10.144}
+    )
+
+
+def test_load_all_derives_stress_and_strain(base_yield, load_extension_folder):
+
+    truth_df = base_yield.load_all()
+
+    obj = BaseMechanicalTest(folder=load_extension_folder, header=8, id_row=3)
+    df = obj.load_all()
+
+    assert obj.stress_col == "Stress"
+    assert obj.strain_col == "Strain"
+    # Load / (width * thickness) is how the machine calculated its stress column
+    assert_allclose(
+        df["Stress"].sort_index(), truth_df["Tensile stress"].sort_index(), rtol=1e-4
+    )
+    assert_allclose(df["Strain"], df["Extension"] / 26.0 * 100)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_summarise_derived_stress_and_strain(
+    base_yield, load_extension_folder, backend
+):
+
+    truth_df = base_yield.summarise()
+
+    obj = BaseMechanicalTest(
+        folder=load_extension_folder,
+        header=8,
+        id_row=3,
+        strain1=0.3,
+        strain2=0.6,
+        backend=backend,
+    )
+    df = obj.summarise()
+
+    assert df["Specimen ID"].tolist() == truth_df["Specimen ID"].tolist()
+    assert_allclose(
+        df["Strength"].astype(float), truth_df["Strength"].astype(float), rtol=1e-4
+    )
+    assert df["Modulus"].astype(float).gt(0).all()
+
+
+def test_derived_stress_needs_geometry(load_extension_folder):
+
+    for fp in load_extension_folder.glob("*.csv"):
+        text = fp.read_text()
+        fp.write_text(text.replace("Width,", "Operator,"))
+
+    obj = BaseMechanicalTest(folder=load_extension_folder, header=8, id_row=3)
+
+    with pytest.raises(ValueError, match="Deriving stress needs an 'Area'"):
+        obj.load_all()
+
+
+def test_summarise_methods(base_yield):
+
+    obj = base_yield
+    obj.methods = ["chord", "secant", "rp0.2", "ReH"]
+
+    df = obj.summarise()
+
+    assert df.columns.tolist() == [
+        "Specimen ID",
+        "Strength",
+        "Modulus",
+        "Yield Strength",
+        "Chord Modulus",
+        "Secant Modulus",
+        "Rp0.2",
+        "ReH",
+    ]
+    assert_allclose(df["Rp0.2"].astype(float), df["Yield Strength"].astype(float))
+    assert_allclose(
+        df["Chord Modulus"].astype(float), df["Modulus"].astype(float), rtol=0.1
+    )
+
+
+def test_summarise_methods_unknown(base_yield):
+
+    obj = base_yield
+    obj.methods = ["youngs"]
+
+    with pytest.raises(ValueError, match="Unknown method"):
+        obj.summarise()
+
+
+def test_summarise_window_methods_are_streamed(base_no_yield, monkeypatch):
+
+    obj = base_no_yield
+    obj.methods = ["chord", "secant", "tangent"]
+    # Too small to keep any curves, so every summarise reads the files
+    monkeypatch.setattr(base, "PARSE_CACHE_BYTES", 0)
+
+    truth_df = obj.summarise()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Whole file loaded")
+
+    monkeypatch.setattr(obj, "_load", fail)
+
+    assert_frame_equal(obj.summarise(), truth_df)
+
+    obj.methods = ["reh"]
+
+    with pytest.raises(AssertionError, match="Whole file loaded"):
+        obj.summarise()
+
+
+def test_summarise_full_curve_methods_reuse_streamed_curves(base_no_yield, monkeypatch):
+
+    obj = base_no_yield
+    obj.methods = ["chord"]
+    obj.summarise()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Whole file loaded")
+
+    monkeypatch.setattr(obj, "_load", fail)
+
+    obj.methods = ["reh"]
+
+    assert obj.summarise()["ReH"].notna().all()
+
+
+def test_plot_curves_uses_passed_data(base_yield, monkeypatch):
+
+    obj = base_yield
+    data = obj.load_all()
+    obj._cache.clear()
+
+    def fail():
+        raise AssertionError("Data loaded again")
+
+    monkeypatch.setattr(obj, "load_all", fail)
+
+    plot = obj.plot_curves(data=data)
+
+    assert isinstance(plot, alt.Chart)
+
+
+def test_plot_curves_uses_cached_data(base_yield, monkeypatch):
+
+    obj = base_yield
+    obj.load_all()
+
+    def fail():
+        raise AssertionError("Data loaded again")
+
+    monkeypatch.setattr(obj, "load_all", fail)
+
+    assert isinstance(obj.plot_curves(), alt.Chart)
+
+    # Any change to the settings means the cached data can't be used
+    obj.strain2 = 0.02
+
+    with pytest.raises(AssertionError, match="Data loaded again"):
+        obj.plot_curves()
+
+
+def test_cached_only_ungrouped_summary(base_yield):
+
+    obj = base_yield
+
+    assert obj._cached("summarise") is None
+
+    df = obj.summarise()
+
+    assert obj._cached("summarise") is df
+
+    obj.summarise(by="Width")
+
+    assert obj._cached("summarise") is df
+
+
+def test_markers(base_yield):
+
+    obj = base_yield
+    data = obj.load_all()
+    summary = obj.summarise()
+
+    markers = obj._markers(data, summary)
+
+    assert markers.columns.tolist() == [
+        "Specimen ID",
+        obj.strain_col,
+        obj.stress_col,
+        "Marker",
+    ]
+    assert markers["Marker"].value_counts().to_dict() == {
+        "Strength": 10,
+        "Yield Strength": 10,
+    }
+
+    strength = markers[markers["Marker"] == "Strength"].set_index("Specimen ID")
+    # Index labels repeat between specimens
+    data = data.reset_index(drop=True)
+    peaks = data.loc[data.groupby("Specimen ID")[obj.stress_col].idxmax()]
+
+    for _, peak in peaks.iterrows():
+        assert strength.loc[peak["Specimen ID"], obj.strain_col] == peak[obj.strain_col]
+
+    yields = markers[markers["Marker"] == "Yield Strength"]
+    truth = summary.set_index("Specimen ID")["Yield Strength"].astype(float)
+
+    assert_allclose(
+        yields[obj.stress_col], truth.loc[yields["Specimen ID"].astype(str)], rtol=0
+    )
+
+
+def test_markers_by_position(base_yield):
+
+    obj = base_yield
+    data = obj.load_all()
+    summary = obj.summarise()
+
+    expected = obj._markers(data, summary)
+
+    # Round tripped summary values (e.g. through a CSV) are no longer exact
+    nudged = summary.assign(
+        **{
+            col: summary[col].astype(float) * (1 + 1e-12)
+            for col in ("Strength", "Yield Strength")
+        }
+    )
+
+    pd.testing.assert_frame_equal(obj._markers(data, nudged), expected)
+
+
+def test_markers_yield_before_strength():
+
+    obj = BaseMechanicalTest(folder=".", strain_col="e", stress_col="s")
+    data = pd.DataFrame(
+        {"Specimen ID": "1", "e": [0, 1, 2, 3, 4], "s": [0.0, 5.0, 9.0, 6.0, 5.0]}
+    )
+    summary = pd.DataFrame(
+        {"Specimen ID": ["1"], "Strength": [9.0], "Yield Strength": [5.0]}
+    )
+
+    markers = obj._markers(data, summary)
+
+    assert markers["e"].tolist() == [2, 1]
+    assert markers["Marker"].tolist() == ["Strength", "Yield Strength"]
+
+
+def test_markers_none_in_summary(base_yield):
+
+    obj = base_yield
+
+    markers = obj._markers(obj.load_all(), pd.DataFrame({"Specimen ID": ["1"]}))
+
+    assert markers.empty
+    assert markers.columns.tolist() == [
+        "Specimen ID",
+        obj.strain_col,
+        obj.stress_col,
+        "Marker",
+    ]
+
+
+def test_plot_curves_markers(base_yield, monkeypatch):
+
+    obj = base_yield
+    obj.summarise()
+
+    def fail():
+        raise AssertionError("Summarised again")
+
+    monkeypatch.setattr(obj, "summarise", fail)
+
+    plot = obj.plot_curves(markers=True)
+
+    assert isinstance(plot, alt.LayerChart)
+
+    plot_json = json.loads(plot.to_json())
+
+    assert plot_json["layer"][1]["mark"]["type"] == "point"
+    assert plot_json["layer"][1]["encoding"]["shape"]["field"] == "Marker"
+
+
+def test_plot_curves_markers_no_yield(base_no_yield):
+
+    obj = base_no_yield
+
+    plot = obj.plot_curves(markers=True)
+
+    markers = obj._markers(obj.load_all(), obj.summarise())
+
+    assert isinstance(plot, alt.LayerChart)
+    assert markers["Marker"].unique().tolist() == ["Strength"]
+
+
+@pytest.mark.parametrize(
+    "file_format, reader",
+    [
+        ("parquet", pd.read_parquet),
+        ("arrow", pd.read_feather),
+        ("hdf5", functools.partial(pd.read_hdf, key="data")),
+    ],
+)
+def test_export_round_trips(base_yield, tmp_path, file_format, reader):
+
+    pytest.importorskip("tables" if file_format == "hdf5" else "pyarrow")
+
+    obj = base_yield
+
+    curves_path, summary_path = obj.export(tmp_path, format=file_format)
+
+    curves = reader(curves_path)
+    summary = reader(summary_path)
+
+    expected_curves = obj.load_all().reset_index(drop=True)
+    expected_summary = obj.summarise()
+
+    assert isinstance(curves["Specimen ID"].dtype, pd.CategoricalDtype)
+    assert curves["Specimen ID"].tolist() == expected_curves["Specimen ID"].tolist()
+    assert_allclose(
+        curves.drop(columns="Specimen ID").to_numpy(),
+        expected_curves.drop(columns="Specimen ID").to_numpy(dtype=float),
+    )
+
+    assert summary.columns.tolist() == expected_summary.columns.tolist()
+    assert summary["Specimen ID"].tolist() == expected_summary["Specimen ID"].tolist()
+    assert_allclose(
+        summary.drop(columns="Specimen ID").to_numpy(),
+        expected_summary.drop(columns="Specimen ID").to_numpy(dtype=float),
+    )
+
+
+def test_export_writes_summary_in_batches(base_yield, tmp_path, monkeypatch):
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    monkeypatch.setattr(base, "SUMMARY_BATCH", 3)
+
+    _, summary_path = base_yield.export(tmp_path)
+
+    # 10 specimens in batches of 3, curves are a specimen at a time
+    assert pq.ParquetFile(summary_path).num_row_groups == 4
+    assert pq.ParquetFile(tmp_path.joinpath("curves.parquet")).num_row_groups == 10
+
+
+def test_export_summary_matches_summarise(base_yield, tmp_path, count_loads):
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    obj = base_yield
+    obj.screen = "flag"
+
+    _, summary_path = obj.export(tmp_path)
+    summary = pq.read_table(summary_path).to_pandas()
+
+    expected = obj.summarise()
+
+    # The summary came from the curves loaded for export
+    assert len(count_loads) == 10
+    assert summary.columns.tolist() == expected.columns.tolist()
+    assert summary["Flags"].astype(str).tolist() == expected["Flags"].tolist()
+    assert_allclose(
+        summary.drop(columns=["Specimen ID", "Flags"]).to_numpy(),
+        expected.drop(columns=["Specimen ID", "Flags"]).to_numpy(dtype=float),
+    )
+
+
+def test_export_errors_collect(base_yield, malformed_yield_folder, tmp_path):
+
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    obj = base_yield
+    obj.folder = malformed_yield_folder
+
+    with pytest.raises(gzip.BadGzipFile):
+        obj.export(tmp_path)
+
+    curves_path, summary_path = obj.export(tmp_path, errors="collect")
+    curves = pq.read_table(curves_path).to_pandas()
+    summary = pq.read_table(summary_path).to_pandas()
+
+    assert curves["Specimen ID"].nunique() == 10
+    assert len(summary) == 12
+    assert summary["Error"].notna().sum() == 2
+
+
+def test_export_raises_on_invalid_format(base_yield, tmp_path):
+
+    with pytest.raises(ValueError):
+        base_yield.export(tmp_path, format="xlsx")
+
+
+def test_writer_is_abstract(tmp_path):
+
+    with pytest.raises(TypeError, match="abstract"):
+        writers.Writer(tmp_path.joinpath("file"))
+
+
+def test_detect_break_truncates_load_all(base_yield, fractured_yield_folder):
+
+    obj = base_yield
+    expected = obj.load_all()
+
+    obj.folder = fractured_yield_folder
+    obj.detect_break = True
+
+    assert_frame_equal(obj.load_all(), expected)
+
+
+def test_detect_break_summarise(base_yield, fractured_yield_folder):
+
+    obj = base_yield
+    expected = obj.summarise()
+    last_strain = [obj._load(f)[obj.strain_col].iloc[-1] for f in obj._find_files()]
+
+    obj.folder = fractured_yield_folder
+
+    # The noise after fracture falls in the modulus window and ruins the fit
+    assert not np.allclose(
+        obj.summarise()["Modulus"].astype(float), expected["Modulus"].astype(float)
+    )
+
+    obj.detect_break = True
+    df = obj.summarise()
+
+    assert_frame_equal(df.drop(columns="Strain at Break"), expected)
+    assert_allclose(df["Strain at Break"].astype(float), last_strain)
+
+
+def test_truncate_keeps_data_without_a_break(base_yield):
+
+    obj = base_yield
+    df = pd.DataFrame(
+        {obj.strain_col: [0.0, 1.0, 2.0, 3.0], obj.stress_col: [0.0, 10.0, 9.0, 6.0]}
+    )
+
+    assert_frame_equal(obj._truncate(df), df)
+
+
+def test_truncate_cuts_at_first_drop_after_peak(base_yield):
+
+    obj = base_yield
+    df = pd.DataFrame(
+        {
+            obj.strain_col: [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+            # The 4.0 is below half the peak but comes before it
+            obj.stress_col: [1.0, 10.0, 8.0, 4.0, 12.0, 0.5],
+        }
+    )
+
+    assert_frame_equal(obj._truncate(df), df.iloc[:5])
+
+
+def test_summarise_dedupe_flag(base_yield, duplicated_yield_folder, monkeypatch):
+
+    truth_df = base_yield.summarise()
+
+    obj = base_yield
+    obj.folder = duplicated_yield_folder
+    obj.dedupe = "flag"
+
+    calls = []
+    original = BaseMechanicalTest._summarise_file
+
+    def summarise_file(self, fp):
+        calls.append(fp)
+        return original(self, fp)
+
+    monkeypatch.setattr(BaseMechanicalTest, "_summarise_file", summarise_file)
+
+    df = obj.summarise()
+
+    # Each distinct specimen is only analysed once
+    assert len(calls) == 10
+    assert df["Specimen ID"].tolist() == truth_df["Specimen ID"].tolist() + [
+        "108",
+        "009",
+    ]
+    assert df["Duplicate Of"].tolist()[:10] == [pd.NA] * 10
+    assert df["Duplicate Of"].tolist()[10:] == ["008", "009"]
+    assert_frame_equal(df.iloc[:10].drop(columns="Duplicate Of"), truth_df)
+
+    copies = df.iloc[10:].drop(columns=["Specimen ID", "Duplicate Of"])
+    originals = df.iloc[:10].set_index("Specimen ID").loc[["008", "009"]]
+    assert_allclose(
+        copies.to_numpy(dtype=float),
+        originals.drop(columns="Duplicate Of").to_numpy(dtype=float),
+    )
+
+
+def test_summarise_dedupe_exclude(base_yield, duplicated_yield_folder):
+
+    truth_df = base_yield.summarise()
+
+    obj = base_yield
+    obj.folder = duplicated_yield_folder
+    obj.dedupe = "exclude"
+
+    assert_frame_equal(obj.summarise(), truth_df)
+
+
+def test_summarise_dedupe_by_folder(base_yield, duplicated_yield_folder):
+
+    obj = base_yield
+    obj.folder = duplicated_yield_folder
+    obj.dedupe = "flag"
+
+    df = obj.summarise(by="Folder")
+
+    assert df["Folder"].tolist() == ["."] * 10 + ["copies"] * 2
+    assert df["Duplicate Of"].notna().sum() == 2
+
+
+def test_stats_dedupe_counts_once(base_yield, duplicated_yield_folder):
+
+    truth_df = base_yield.stats()
+
+    obj = base_yield
+    obj.folder = duplicated_yield_folder
+    obj.dedupe = "flag"
+
+    assert_frame_equal(obj.stats(), truth_df)
+
+
+def test_summarise_dedupe_polars(base_yield, duplicated_yield_folder):
+
+    obj = base_yield
+    obj.folder = duplicated_yield_folder
+    obj.dedupe = "flag"
+
+    truth_df = obj.summarise()
+
+    obj.backend = "polars"
+
+    assert_frame_equal(obj.summarise(), truth_df, check_dtype=False)
+
+
+def test_summarise_dedupe_bad_mode(base_yield):
+
+    obj = base_yield
+    obj.dedupe = "drop"
+
+    with pytest.raises(ValueError, match="dedupe must be one of"):
+        obj.summarise()
+
+
+@pytest.fixture
+def count_loads(monkeypatch):
+    """
+    Records the files BaseMechanicalTest._load parses.
+    """
+
+    calls = []
+    original = BaseMechanicalTest._load
+
+    def load(self, fp, usecols=None):
+        calls.append(fp)
+        return original(self, fp, usecols=usecols)
+
+    monkeypatch.setattr(BaseMechanicalTest, "_load", load)
+
+    return calls
+
+
+def test_summarise_reuses_parsed_curves(base_yield, count_loads):
+
+    obj = base_yield
+
+    first = obj.summarise()
+    obj.strain1, obj.strain2 = 0.01, 0.02
+    second = obj.summarise()
+    obj.expect_yield = False
+    third = obj.summarise()
+
+    # Only the fit window changed so every file is only parsed once
+    assert len(count_loads) == 10
+    assert not first["Modulus"].equals(second["Modulus"])
+    assert_series_equal(third["Modulus"], second["Modulus"])
+
+
+@pytest.mark.parametrize("expect_yield", [True, False])
+def test_summarise_strain2_change_reads_nothing(
+    base_no_yield, monkeypatch, expect_yield
+):
+
+    obj = base_no_yield
+    obj.expect_yield = expect_yield
+
+    opened = []
+    original = base._open_text
+
+    def open_text(fp):
+        opened.append(fp)
+        return original(fp)
+
+    monkeypatch.setattr(base, "_open_text", open_text)
+
+    first = obj.summarise()
+    assert opened
+
+    opened.clear()
+    for strain2 in (0.2, 0.25):
+        obj.strain2 = strain2
+        summary = obj.summarise()
+
+    assert opened == []
+    assert not summary["Modulus"].equals(first["Modulus"])
+
+
+def test_reduce_caches_parsed_curve(base_no_yield):
+
+    obj = base_no_yield
+    fp = obj._find_files()[0]
+
+    obj._reduce(fp)
+    cached = obj._parsed[obj._parse_key(fp)]
+
+    assert_frame_equal(cached, obj._load(fp, usecols=obj._summary_cols(fp)))
+
+
+def test_summarise_reparses_on_parse_setting_change(base_yield, count_loads):
+
+    obj = base_yield
+
+    obj.summarise()
+    obj.detect_break = True
+    obj.summarise()
+
+    assert len(count_loads) == 20
+
+
+def test_summarise_memoized_per_settings(base_yield, monkeypatch):
+
+    obj = base_yield
+
+    calls = []
+    original = BaseMechanicalTest._summarise_file
+
+    def summarise_file(self, fp):
+        calls.append((fp, self.strain1))
+        return original(self, fp)
+
+    monkeypatch.setattr(BaseMechanicalTest, "_summarise_file", summarise_file)
+
+    first = obj.summarise()
+    obj.strain1 = 0.01
+    obj.summarise()
+    obj.strain1 = 0.005
+    again = obj.summarise()
+
+    assert len(calls) == 20
+    assert_frame_equal(again, first)
+
+
+def test_summarise_changed_file_not_reused(base_yield, tmp_path, count_loads):
+
+    for f in TENS_YIELD.glob("*.csv"):
+        shutil.copy(f, tmp_path.joinpath(f.name))
+
+    obj = base_yield
+    obj.folder = tmp_path
+
+    obj.summarise()
+
+    changed = tmp_path.joinpath("Specimen_RawData_1.csv")
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    obj.summarise()
+
+    assert len(count_loads) == 11
+    assert count_loads[-1] == changed
+
+
+def test_summarise_errors_raise(base_yield, malformed_yield_folder):
+
+    obj = base_yield
+    obj.folder = malformed_yield_folder
+
+    with pytest.raises(ValueError, match="header=8"):
+        obj.summarise()
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_summarise_errors_collect(base_yield, malformed_yield_folder, backend):
+
+    obj = base_yield
+    obj.folder = malformed_yield_folder
+    obj.backend = backend
+
+    df = obj.summarise(errors="collect")
+    with pytest.warns(UserWarning):
+        expected = obj.summarise(errors="skip")
+
+    assert len(df) == 12
+    assert df.columns[-1] == "Error"
+    assert df["Error"].notna().sum() == 2
+    assert df.loc[df["Error"].notna(), "Strength"].isna().all()
+    assert_frame_equal(
+        df[df["Error"].isna()].drop(columns="Error").reset_index(drop=True), expected
+    )
+
+    assert [os.path.basename(f) for f in obj.errors["File"]] == [
+        "Specimen_RawData_11.csv",
+        "Specimen_RawData_12.csv.gz",
+    ]
+    assert obj.errors["Error"].str.contains("header").iloc[0]
+    assert obj.errors["Error"].str.startswith("BadGzipFile").iloc[1]
+    assert obj.errors["Specimen ID"].tolist()[0] == "009"
+
+
+def test_summarise_errors_skip(base_yield, malformed_yield_folder):
+
+    obj = base_yield
+    obj.folder = malformed_yield_folder
+
+    with pytest.warns(UserWarning, match="Skipped 2 files"):
+        df = obj.summarise(errors="skip")
+
+    assert len(df) == 10
+    assert "Error" not in df.columns
+    assert len(obj.errors) == 2
+
+
+def test_summarise_errors_none(base_yield):
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        df = base_yield.summarise(errors="skip")
+
+    assert len(df) == 10
+    assert base_yield.errors.empty
+
+
+def test_summarise_errors_by_and_store(base_yield, malformed_yield_folder, tmp_path):
+
+    obj = base_yield
+    obj.folder = malformed_yield_folder
+    path = tmp_path.joinpath("results.db")
+
+    df = obj.summarise(by="Folder", store=path, errors="collect")
+
+    with results.ResultsStore(path) as store:
+        stored = store.query()
+
+    assert df.columns.tolist()[:2] == ["Specimen ID", "Folder"]
+    assert len(df) == 12
+    assert len(stored) == 10
+
+
+def test_summarise_errors_retried(base_yield, malformed_yield_folder, count_loads):
+
+    obj = base_yield
+    obj.folder = malformed_yield_folder
+
+    with pytest.warns(UserWarning):
+        obj.summarise(errors="skip")
+    calls = len(count_loads)
+
+    fixed = malformed_yield_folder.joinpath("Specimen_RawData_11.csv")
+    shutil.copy(TENS_YIELD.joinpath("Specimen_RawData_1.csv"), fixed)
+
+    df = obj.summarise(errors="collect")
+
+    # Only the failed files are summarised again
+    assert count_loads[calls:] == [
+        fixed,
+        malformed_yield_folder.joinpath("Specimen_RawData_12.csv.gz"),
+    ]
+    assert len(df) == 12
+    assert len(obj.errors) == 1
+
+
+def test_summarise_errors_dedupe_unreadable(base_yield, truncated_gzip_yield_folder):
+
+    obj = base_yield
+    obj.folder = truncated_gzip_yield_folder
+    obj.dedupe = "flag"
+
+    with pytest.raises(EOFError):
+        obj.summarise()
+
+    df = obj.summarise(errors="collect")
+
+    assert len(df) == 13
+    assert obj.errors["File"].tolist() == [
+        str(truncated_gzip_yield_folder.joinpath("Truncated.csv.gz"))
+    ]
+    assert obj.errors["Error"].str.startswith("EOFError").all()
+    assert df["Duplicate Of"].notna().sum() == 2
+
+
+def test_summarise_errors_bad_policy(base_yield):
+
+    with pytest.raises(ValueError, match="errors must be one of"):
+        base_yield.summarise(errors="ignore")
+
+
+@pytest.fixture
+def interrupt_after(monkeypatch):
+    """
+    Makes BaseMechanicalTest._summarise_file raise KeyboardInterrupt after a
+    number of files, recording the files summarised.
+    """
+
+    calls = []
+    original = BaseMechanicalTest._summarise_file
+
+    def interrupt_after(n):
+        def summarise_file(self, fp):
+            if len(calls) == n:
+                raise KeyboardInterrupt
+            calls.append(fp)
+            return original(self, fp)
+
+        monkeypatch.setattr(BaseMechanicalTest, "_summarise_file", summarise_file)
+        return calls
+
+    return interrupt_after
+
+
+def test_summarise_checkpoint_resume(
+    base_yield_no_stress_strain_cols, tmp_path, monkeypatch, interrupt_after
+):
+
+    monkeypatch.setattr(base, "CHECKPOINT_BATCH", 3)
+
+    obj = base_yield_no_stress_strain_cols
+    path = tmp_path.joinpath("checkpoint.jsonl")
+    fresh = copy.deepcopy(obj)
+    expected = copy.deepcopy(obj).summarise()
+
+    calls = interrupt_after(7)
+    with pytest.raises(KeyboardInterrupt):
+        obj.summarise(checkpoint=path)
+
+    # Two full batches saved before the interruption
+    assert len(path.read_text().splitlines()) == 6
+
+    calls.clear()
+    resumed = fresh.summarise(checkpoint=path)
+
+    assert len(calls) == 4
+    assert_frame_equal(resumed, expected)
+    assert len(path.read_text().splitlines()) == 10
+
+
+def test_summarise_checkpoint_other_settings(base_yield, tmp_path, interrupt_after):
+
+    obj = base_yield
+    path = tmp_path.joinpath("checkpoint.jsonl")
+    calls = interrupt_after(100)
+
+    obj.summarise(checkpoint=path)
+    obj.strain2 = 0.02
+    obj.summarise(checkpoint=path)
+
+    assert len(calls) == 20
+    assert len(path.read_text().splitlines()) == 20
+
+
+def test_summarise_checkpoint_changed_file(base_yield, tmp_path, interrupt_after):
+
+    folder = tmp_path.joinpath("data")
+    shutil.copytree(TENS_YIELD, folder)
+
+    obj = base_yield
+    obj.folder = folder
+    path = tmp_path.joinpath("checkpoint.jsonl")
+    fresh = copy.deepcopy(obj)
+    obj.summarise(checkpoint=path)
+
+    changed = folder.joinpath("Specimen_RawData_1.csv")
+    stat = changed.stat()
+    os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    calls = interrupt_after(100)
+    fresh.summarise(checkpoint=path)
+
+    assert calls == [changed]
+
+
+def test_summarise_checkpoint_skips_failed(base_yield, malformed_yield_folder):
+
+    obj = base_yield
+    obj.folder = malformed_yield_folder
+    path = malformed_yield_folder.joinpath("checkpoint.jsonl")
+
+    obj.summarise(errors="collect", checkpoint=path)
+
+    assert len(path.read_text().splitlines()) == 10
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("detect_break", [False, True])
+def test_summarise_after_load_all_reuses_curves(
+    base_yield_no_stress_strain_cols, count_loads, backend, detect_break
+):
+
+    obj = base_yield_no_stress_strain_cols
+    obj.backend = backend
+    obj.detect_break = detect_break
+    expected = copy.deepcopy(obj).summarise()
+
+    obj.load_all()
+    calls = len(count_loads)
+    df = obj.summarise()
+
+    assert len(count_loads) == calls
+    assert_frame_equal(df, expected)
+
+
+def test_summarise_after_load_all_derived(load_extension_folder, count_loads):
+
+    obj = BaseMechanicalTest(
+        load_extension_folder, id_row=3, header=8, strain1=0.3, strain2=0.6
+    )
+    expected = copy.deepcopy(obj).summarise()
+
+    obj.load_all()
+    calls = len(count_loads)
+
+    assert_frame_equal(obj.summarise(), expected)
+    assert len(count_loads) == calls
+
+
+def test_parse_cache_bounded(base_yield, monkeypatch, count_loads):
+
+    monkeypatch.setattr(base, "PARSE_CACHE_BYTES", 1)
+
+    obj = base_yield
+    obj.summarise()
+
+    assert len(obj._parsed) == 1
+    assert (
+        obj._parsed_bytes == obj._parsed[next(iter(obj._parsed))].memory_usage().sum()
+    )
+
+
+def test_sweep_matches_summarise(base_yield, count_loads):
+
+    obj = base_yield
+    obj.expect_yield = False
+    windows = [(0.005, 0.015), (0.01, 0.03), (0.02, 0.1)]
+
+    df = obj.sweep(windows)
+
+    assert df.columns.tolist() == ["Specimen ID", "Strain1", "Strain2", "Modulus"]
+    assert len(df) == 10 * len(windows)
+
+    for strain1, strain2 in windows:
+        obj.strain1, obj.strain2 = strain1, strain2
+        summary = obj.summarise()
+        window = df[(df["Strain1"] == strain1) & (df["Strain2"] == strain2)]
+        assert window["Specimen ID"].tolist() == summary["Specimen ID"].tolist()
+        assert_allclose(window["Modulus"], summary["Modulus"].astype(float), rtol=1e-8)
+
+    # Every curve parsed once for the sweep, then reused by summarise
+    assert len(count_loads) == 10
+
+
+def test_sweep_bad_window(base_yield):
+
+    with pytest.raises(ValueError, match="strain1 <= strain2"):
+        base_yield.sweep([(0.05, 0.01)])
@@ -0,0 +1,163 @@
+"""
+Tests for the calculation method registry.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymechtest import calculators
+from pymechtest.calculators import Curve
+
+
+@pytest.fixture
+def upper_yield_curve():
+    """
+    Linear to 200 MPa at 1% strain (20 GPa), drops to a 190 MPa plateau
+    until 2% then hardens linearly to 300 MPa at 5%.
+    """
+
+    strain = np.round(np.arange(0, 5.0005, 0.001), 3)
+    stress = np.select(
+        [strain <= 1, strain <= 1.01, strain <= 2],
+        [200 * strain, 200 - 1000 * (strain - 1), np.full_like(strain, 190)],
+        190 + 110 * (strain - 2) / 3,
+    )
+
+    return Curve(strain, stress, np.arange(len(strain)), strain1=0.2, strain2=0.6)
+
+
+@pytest.fixture
+def continuous_curve():
+    """
+    Linear to 0.5% strain (20 GPa) then yielding continuously, with no drop.
+    """
+
+    strain = np.linspace(0, 5, 5001)
+    stress = np.where(strain <= 0.5, 200 * strain, 100 + 80 * np.log1p(strain - 0.5))
+
+    return Curve(strain, stress, np.arange(len(strain)), strain1=0.1, strain2=0.4)
+
+
+@pytest.mark.parametrize("method", ["fit", "chord", "secant", "tangent"])
+def test_moduli(upper_yield_curve, method):
+
+    calculator = calculators.get_calculator(method)
+
+    assert calculator.full_curve is False
+    assert calculator.func(upper_yield_curve) == pytest.approx(20)
+
+
+def test_offset_yield(upper_yield_curve):
+
+    assert calculators.offset_yield(upper_yield_curve) == pytest.approx(190)
+
+
+def test_offset_yield_uses_labels(upper_yield_curve):
+
+    # Labels starting at 1 (as they do after the units row is dropped)
+    # mean the point after the intersect is taken
+    curve = Curve(
+        upper_yield_curve.strain,
+        upper_yield_curve.stress,
+        upper_yield_curve.labels + 1,
+        0.2,
+        0.6,
+    )
+
+    slope, intercept = curve.fit
+    delta = np.abs(slope * (curve.strain - 0.2) + intercept - curve.stress)
+
+    assert calculators.offset_yield(curve) == curve.stress[np.argmin(delta) + 1]
+
+
+def test_upper_and_lower_yield(upper_yield_curve):
+
+    assert calculators.get_calculator("ReH").func(upper_yield_curve) == 200
+    assert calculators.get_calculator("ReL").func(upper_yield_curve) == 190
+
+
+def test_upper_and_lower_yield_continuous(continuous_curve):
+
+    assert np.isnan(calculators.upper_yield(continuous_curve))
+    assert np.isnan(calculators.lower_yield(continuous_curve))
+
+
+def test_slope_threshold_yield(upper_yield_curve, continuous_curve):
+
+    assert calculators.slope_threshold_yield(upper_yield_curve) == pytest.approx(
+        200, rel=0.01
+    )
+
+    # Slope falls from 200 to 80 MPa/% at 0.5%
+    assert calculators.slope_threshold_yield(continuous_curve) == pytest.approx(
+        100, rel=0.01
+    )
+
+
+def test_shared_quantities_computed_once(upper_yield_curve, monkeypatch):
+
+    calls = []
+    lstsq = np.linalg.lstsq
+
+    def counting_lstsq(*args, **kwargs):
+        calls.append(1)
+        return lstsq(*args, **kwargs)
+
+    monkeypatch.setattr(np.linalg, "lstsq", counting_lstsq)
+
+    for method in ["fit", "rp0.2", "rp0.5", "slope threshold"]:
+        calculators.get_calculator(method).func(upper_yield_curve)
+
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "name, column, offset",
+    [("rp0.2", "Rp0.2", 0.2), ("Rp0.5", "Rp0.5", 0.5), ("rp1", "Rp1", 1.0)],
+)
+def test_get_calculator_offset(upper_yield_curve, name, column, offset):
+
+    calculator = calculators.get_calculator(name)
+
+    assert calculator.column == column
+    assert calculator.full_curve is True
+    assert calculator.func(upper_yield_curve) == calculators.offset_yield(
+        upper_yield_curve, offset=offset
+    )
+
+
+def test_get_calculator_unknown():
+
+    with pytest.raises(ValueError, match="Unknown method: 'youngs'"):
+        calculators.get_calculator("youngs")
+
+
+def test_register(upper_yield_curve, monkeypatch):
+
+    monkeypatch.setattr(calculators, "CALCULATORS", dict(calculators.CALCULATORS))
+
+    @calculators.register("Peak Strain", "Strain at Strength", full_curve=True)
+    def peak_strain(curve):
+        return curve.strain[curve.peak]
+
+    calculator = calculators.get_calculator("peak strain")
+
+    assert calculator.column == "Strain at Strength"
+    assert_allclose(calculator.func(upper_yield_curve), 5.0)
+
+
+def test_strain_at_break_skips_trailing_nan():
+
+    curve = calculators.Curve(
+        strain=np.array([0.0, 1.0, 2.5, np.nan]),
+        stress=np.array([0.0, 10.0, 5.0, np.nan]),
+        labels=np.arange(4),
+        strain1=0.0,
+        strain2=1.0,
+    )
+
+    assert calculators.strain_at_break(curve) == 2.5
@@ -0,0 +1,99 @@
+"""
+Tests for the summarise checkpoint files.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from pymechtest import checkpoints
+
+KEY = ("data/1.csv", "1000", "200")
+
+
+def row(strength=100.0):
+
+    return pd.Series(
+        {
+            "Specimen ID": "001",
+            "Strength": np.float64(strength),
+            "Points": np.int64(5),
+            "Flags": pd.NA,
+            "Modulus": np.nan,
+        },
+        dtype=object,
+    )
+
+
+def test_read_missing(tmp_path):
+
+    assert checkpoints.read(tmp_path.joinpath("missing.jsonl"), "abc") == {}
+
+
+def test_round_trip(tmp_path):
+
+    path = tmp_path.joinpath("checkpoint.jsonl")
+
+    checkpoints.append(path, "abc", [(KEY, row())])
+    saved = checkpoints.read(path, "abc")
+
+    assert list(saved) == [KEY]
+    assert saved[KEY]["Specimen ID"] == "001"
+    assert saved[KEY]["Strength"] == 100.0
+    assert saved[KEY]["Points"] == 5
+    assert saved[KEY]["Flags"] is None
+    assert np.isnan(saved[KEY]["Modulus"])
+
+
+def test_read_filters_settings(tmp_path):
+
+    path = tmp_path.joinpath("checkpoint.jsonl")
+
+    checkpoints.append(path, "abc", [(KEY, row())])
+    checkpoints.append(path, "def", [(KEY, row(200.0))])
+
+    assert checkpoints.read(path, "def")[KEY]["Strength"] == 200.0
+    assert checkpoints.read(path, "xyz") == {}
+
+
+def test_read_last_wins(tmp_path):
+
+    path = tmp_path.joinpath("checkpoint.jsonl")
+
+    checkpoints.append(path, "abc", [(KEY, row())])
+    checkpoints.append(path, "abc", [(KEY, row(300.0))])
+
+    assert checkpoints.read(path, "abc")[KEY]["Strength"] == 300.0
+
+
+def test_interrupted_write(tmp_path):
+
+    path = tmp_path.joinpath("checkpoint.jsonl")
+    other = ("data/2.csv", "1000", "200")
+
+    checkpoints.append(path, "abc", [(KEY, row())])
+    with open(path, "a") as f:
+        f.write('{"settings": "abc", "fi')
+
+    assert list(checkpoints.read(path, "abc")) == [KEY]
+
+    # The next batch starts on a new line rather than joining the broken one
+    checkpoints.append(path, "abc", [(other, row(400.0))])
+    saved = checkpoints.read(path, "abc")
+
+    assert list(saved) == [KEY, other]
+    assert len(path.read_text().splitlines()) == 3
+    assert json.loads(path.read_text().splitlines()[-1])["file"] == list(other)
+
+
+def test_append_nothing(tmp_path):
+
+    path = tmp_path.joinpath("checkpoint.jsonl")
+
+    checkpoints.append(path, "abc", [])
+
+    assert not path.exists()
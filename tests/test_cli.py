@@ -0,0 +1,175 @@
+"""
+Tests for the command line interface.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pymechtest import Tensile
+from pymechtest.cli import main
+
+TENS_YIELD = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+ARGS = [
+    "summarise",
+    str(TENS_YIELD),
+    "--header",
+    "8",
+    "--id-row",
+    "3",
+    "--strain1",
+    "0.005",
+    "--strain2",
+    "0.015",
+]
+
+
+@pytest.fixture
+def truth_df():
+    return (
+        Tensile(folder=TENS_YIELD, header=8, id_row=3, strain1=0.005, strain2=0.015)
+        .summarise()
+        .astype(
+            {
+                "Specimen ID": object,
+                "Strength": float,
+                "Modulus": float,
+                "Yield Strength": float,
+            }
+        )
+        .sort_values("Specimen ID")
+        .reset_index(drop=True)
+    )
+
+
+def read_csv(text):
+    return (
+        pd.read_csv(io.StringIO(text), dtype={"Specimen ID": str})
+        .sort_values("Specimen ID")
+        .reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_cli_summarise_csv(capsys, truth_df, workers):
+
+    assert main(ARGS + ["--workers", workers]) == 0
+
+    df = read_csv(capsys.readouterr().out)
+
+    assert df.columns.tolist() == [
+        "Specimen ID",
+        "Folder",
+        "Strength",
+        "Modulus",
+        "Yield Strength",
+    ]
+    assert (df["Folder"] == str(TENS_YIELD)).all()
+    pd.testing.assert_frame_equal(df.drop(columns="Folder"), truth_df)
+
+
+def test_cli_summarise_json(capsys, truth_df):
+
+    assert main(ARGS + ["--format", "json"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    df = (
+        pd.DataFrame([json.loads(line) for line in lines])
+        .sort_values("Specimen ID")
+        .reset_index(drop=True)
+    )
+
+    assert len(lines) == 10
+    pd.testing.assert_frame_equal(df.drop(columns="Folder"), truth_df)
+
+
+def test_cli_summarise_output_file(tmp_path, capsys, truth_df):
+
+    output = tmp_path.joinpath("results.csv")
+
+    assert main(ARGS + ["--output", str(output)]) == 0
+
+    assert capsys.readouterr().out == ""
+    pd.testing.assert_frame_equal(
+        read_csv(output.read_text()).drop(columns="Folder"), truth_df
+    )
+
+
+def test_cli_summarise_multiple_folders(capsys, lots_yield_folder):
+
+    args = ARGS.copy()
+    args[1:2] = [str(lots_yield_folder / "lot_a"), str(lots_yield_folder / "lot_b")]
+
+    assert main(args + ["--workers", "2"]) == 0
+
+    df = read_csv(capsys.readouterr().out)
+
+    assert df["Folder"].value_counts().to_dict() == {
+        str(lots_yield_folder / "lot_a"): 5,
+        str(lots_yield_folder / "lot_b"): 5,
+    }
+
+
+def test_cli_summarise_test_options(capsys):
+
+    assert main(ARGS + ["--no-yield", "--method", "chord", "--method", "rp0.5"]) == 0
+
+    df = read_csv(capsys.readouterr().out)
+
+    assert df.columns.tolist() == [
+        "Specimen ID",
+        "Folder",
+        "Strength",
+        "Modulus",
+        "Chord Modulus",
+        "Rp0.5",
+    ]
+
+
+def test_cli_summarise_parquet(tmp_path, truth_df):
+
+    pytest.importorskip("pyarrow")
+
+    output = tmp_path.joinpath("results.parquet")
+
+    assert main(ARGS + ["--format", "parquet", "--output", str(output)]) == 0
+
+    df = pd.read_parquet(output).sort_values("Specimen ID").reset_index(drop=True)
+
+    assert len(df) == 10
+
+
+def test_cli_no_files(tmp_path, capsys):
+
+    with pytest.raises(SystemExit) as e:
+        main(["summarise", str(tmp_path)])
+
+    assert e.value.code == 1
+    assert "no data files found" in capsys.readouterr().err
+
+
+def test_cli_error_names_file(capsys):
+
+    with pytest.raises(SystemExit) as e:
+        main(ARGS + ["--method", "youngs"])
+
+    assert e.value.code == 1
+
+    err = capsys.readouterr().err
+    assert "Unknown method: 'youngs'" in err
+    assert "Specimen_RawData_1.csv" in err
+
+
+def test_cli_invalid_type(capsys):
+
+    with pytest.raises(SystemExit) as e:
+        main(["summarise", str(TENS_YIELD), "--type", "torsion"])
+
+    assert e.value.code == 2
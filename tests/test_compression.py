@@ -30,6 +30,15 @@ def test_compression_init():
     assert obj.strain1 == 0.05
     assert obj.strain2 == 0.15
     assert obj.expect_yield is False
+    assert obj.auto_modulus is False
+    assert obj.stress_units is None
+    assert obj.strain_units is None
+    assert obj.methods is None
+    assert obj.backend == "pandas"
+    assert obj.jit is False
+    assert obj.screen is None
+    assert obj.detect_break is False
+    assert obj.dedupe is None
 
 
 def test_compression_repr():
@@ -51,5 +60,14 @@ def test_compression_repr():
         "stress_col='Compression stress', "
         "strain_col='Compression strain (Strain 1)', "
         "header=8, "
-        "strain1=0.05, strain2=0.15, expect_yield=False)"
+        "strain1=0.05, strain2=0.15, expect_yield=False, "
+        "auto_modulus=False, "
+        "stress_units=None, "
+        "strain_units=None, "
+        "methods=None, "
+        "backend='pandas', "
+        "jit=False, "
+        "screen=None, "
+        "detect_break=False, "
+        "dedupe=None)"
     )
@@ -0,0 +1,255 @@
+"""
+Tests for the Creep class.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import json
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from pymechtest import Creep
+from pymechtest.creep import _fit, _merge, _moments
+
+
+def test_creep_init():
+
+    obj = Creep(
+        folder="made/up/directory",
+        header=8,
+        strain_col="Strain",
+        time_col="Time",
+        id_row=3,
+        points_per_decade=10,
+        transition_time=500.0,
+        chunksize=1000,
+    )
+
+    assert obj.folder == "made/up/directory"
+    assert obj.header == 8
+    assert obj.strain_col == "Strain"
+    assert obj.time_col == "Time"
+    assert obj.id_row == 3
+    assert obj.points_per_decade == 10
+    assert obj.transition_time == 500.0
+    assert obj.chunksize == 1000
+    assert obj.expect_yield is False
+
+
+def test_creep_repr():
+
+    obj = Creep(folder="made/up/directory", strain_col="Strain", id_row=3, header=8)
+
+    assert (
+        obj.__repr__() == "Creep(folder='made/up/directory', "
+        "id_row=3, "
+        "strain_col='Strain', "
+        "time_col=None, "
+        "header=8, "
+        "points_per_decade=20, "
+        "transition_time=None, "
+        "chunksize=100000, "
+        "strain_units=None)"
+    )
+
+
+def test_moments_merge_fit_matches_polyfit():
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(1e6, 1e7, 1000)
+    y = 3e-5 * x + 2 + rng.normal(0, 0.1, 1000)
+    bins = rng.integers(0, 5, 1000)
+
+    # Split into two "chunks" and merge the moments back together
+    first = _moments(bins[:400], x[:400], y[:400])
+    second = _moments(bins[400:], x[400:], y[400:])
+    merged = [_merge(first[b], second[b]) for b in sorted(first)]
+
+    assert_allclose(_fit(merged), np.polyfit(x, y, 1), rtol=1e-9)
+
+
+def test_fit_not_enough_data():
+
+    assert np.isnan(_fit([])).all()
+
+
+def test_creep_summarise(creep_folder):
+
+    obj = Creep(folder=creep_folder, chunksize=7_000)
+
+    df = obj.summarise()
+    values = df.drop(columns="Specimen ID").astype(float)
+
+    assert obj.time_col == "Time (s)"
+    assert obj.strain_col == "Strain (%)"
+
+    assert df.columns.tolist() == [
+        "Specimen ID",
+        "Duration",
+        "Final Strain",
+        "Transition Time",
+        "Primary Coefficient",
+        "Primary Exponent",
+        "Secondary Creep Rate",
+    ]
+    assert df["Specimen ID"].tolist() == ["Creep_1.csv", "Creep_2.csv"]
+
+    assert_allclose(values["Primary Exponent"], 0.3, rtol=0.01)
+    assert_allclose(values["Primary Coefficient"], [0.2, 0.3], rtol=0.02)
+    assert_allclose(values["Secondary Creep Rate"], 1e-5, rtol=1e-6)
+    assert (
+        (values["Transition Time"] > 900) & (values["Transition Time"] < 1500)
+    ).all()
+
+    # Decimated, so the last point is a bin mean rather than the last sample
+    final = np.array([0.2, 0.3]) * 1000**0.3 + 1e-5 * (1e5 - 1000)
+    assert_allclose(values["Final Strain"], final, rtol=1e-3)
+    assert_allclose(values["Duration"], 1e5, rtol=0.05)
+
+
+def test_creep_summarise_transition_time(creep_folder):
+
+    obj = Creep(folder=creep_folder, transition_time=1000)
+
+    df = obj.summarise().drop(columns="Specimen ID").astype(float)
+
+    assert_allclose(df["Transition Time"], 1000)
+    assert_allclose(df["Primary Exponent"], 0.3, rtol=1e-6)
+    assert_allclose(df["Primary Coefficient"], [0.2, 0.3], rtol=1e-6)
+    assert_allclose(df["Secondary Creep Rate"], 1e-5, rtol=1e-6)
+
+
+def test_creep_chunksize_doesnt_change_results(creep_folder):
+
+    one = Creep(folder=creep_folder).summarise()
+    many = Creep(folder=creep_folder, chunksize=3_333).summarise()
+
+    pd.testing.assert_frame_equal(one, many, rtol=1e-9)
+
+
+def test_creep_load_all_is_decimated(creep_folder):
+
+    obj = Creep(folder=creep_folder, points_per_decade=10)
+
+    df = obj.load_all()
+
+    assert df.columns.tolist() == ["Specimen ID", "Time (s)", "Strain (%)"]
+    assert df["Specimen ID"].dtype == "category"
+
+    # At most one point per bin over the 5 decades from 1 to 10^5 s, the
+    # shortest bins in the first decade hold no 1 Hz samples
+    assert df.groupby("Specimen ID").size().tolist() == [48, 48]
+
+    for _, curve in df.groupby("Specimen ID"):
+        assert curve["Time (s)"].is_monotonic_increasing
+        assert curve["Strain (%)"].is_monotonic_increasing
+
+
+def test_creep_never_loads_whole_file(creep_folder, monkeypatch):
+
+    read_csv = pd.read_csv
+
+    def chunked_only(*args, **kwargs):
+        if not kwargs.get("chunksize") and kwargs.get("nrows") != 0:
+            raise AssertionError("Whole file read into memory")
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", chunked_only)
+
+    obj = Creep(folder=creep_folder, chunksize=10_000)
+
+    obj.summarise()
+    obj.load_all()
+
+
+def test_creep_no_time_col(tmp_path):
+
+    pd.DataFrame({"Strain": [1, 2, 3]}).to_csv(tmp_path.joinpath("a.csv"), index=False)
+
+    with pytest.raises(ValueError, match="Could not detect time_col."):
+        Creep(folder=tmp_path).summarise()
+
+
+def test_creep_strain_units(creep_folder):
+
+    percent = Creep(folder=creep_folder).summarise()
+    fraction = Creep(folder=creep_folder, strain_units="mm/mm").summarise()
+
+    assert_allclose(
+        fraction["Final Strain"].astype(float),
+        100 * percent["Final Strain"].astype(float),
+    )
+
+
+def test_creep_no_positive_time(tmp_path):
+
+    pd.DataFrame({"Time (s)": [-2.0, -1.0, 0.0], "Strain (%)": [0.0, 0.1, 0.2]}).to_csv(
+        tmp_path.joinpath("a.csv"), index=False
+    )
+
+    with pytest.raises(ValueError, match="No samples with a positive 'Time \\(s\\)'"):
+        Creep(folder=tmp_path).summarise()
+
+
+def test_creep_transition_ignores_falling_strain(creep_folder):
+
+    expected = Creep(folder=creep_folder).summarise()
+
+    # Strain briefly drops well into primary creep, e.g. a bump of the rig
+    fp = creep_folder.joinpath("Creep_1.csv")
+    df = pd.read_csv(fp)
+    df.loc[df["Time (s)"].between(100, 150), "Strain (%)"] -= 0.05
+    df.to_csv(fp, index=False)
+
+    df = Creep(folder=creep_folder).summarise()
+
+    assert_allclose(
+        df["Transition Time"].astype(float),
+        expected["Transition Time"].astype(float),
+    )
+
+
+def test_creep_plot_curves_strain_against_time(creep_folder):
+
+    obj = Creep(folder=creep_folder)
+
+    plot_json = json.loads(obj.plot_curves().to_json())
+
+    assert plot_json["encoding"]["x"]["field"] == "Time (s)"
+    assert plot_json["encoding"]["y"]["field"] == "Strain (%)"
+    assert plot_json["encoding"]["y"]["title"] == "Creep Strain (%)"
+    assert plot_json["title"] == "Creep Curves"
+
+    with pytest.raises(TypeError, match="not supported"):
+        obj.plot_curves(markers=True)
+
+
+def test_creep_view_strain_against_time(creep_folder):
+
+    server = Creep(folder=creep_folder).view()
+    try:
+        url = server.url + "curves?x_min=10&x_max=100"
+        with urllib.request.urlopen(url, timeout=10) as response:
+            rows = json.loads(response.read())
+    finally:
+        server.close()
+
+    assert rows
+    assert all(10 <= row["Strain"] <= 100 for row in rows)
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [("sweep", ([(0.1, 0.2)],)), ("export", ("out",)), ("report", ("out.html",))],
+)
+def test_creep_unsupported(creep_folder, method, args):
+
+    obj = Creep(folder=creep_folder)
+
+    with pytest.raises(TypeError, match=f"Creep.{method} is not supported"):
+        getattr(obj, method)(*args)
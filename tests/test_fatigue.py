@@ -0,0 +1,140 @@
+"""
+Tests for the Fatigue class.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from pandas.testing import assert_frame_equal
+
+from pymechtest import Fatigue
+
+
+def test_fatigue_init():
+
+    obj = Fatigue(
+        folder="made/up/directory",
+        header=8,
+        stress_col="Stress",
+        strain_col="Strain",
+        id_row=3,
+        chunksize=1000,
+        cycle_interval=10,
+    )
+
+    assert obj.folder == "made/up/directory"
+    assert obj.header == 8
+    assert obj.stress_col == "Stress"
+    assert obj.strain_col == "Strain"
+    assert obj.id_row == 3
+    assert obj.chunksize == 1000
+    assert obj.cycle_interval == 10
+    assert obj.expect_yield is False
+
+
+def test_fatigue_repr():
+
+    obj = Fatigue(
+        folder="made/up/directory",
+        stress_col="Stress",
+        strain_col="Strain",
+        id_row=3,
+        header=8,
+    )
+
+    assert (
+        obj.__repr__() == "Fatigue(folder='made/up/directory', "
+        "id_row=3, "
+        "stress_col='Stress', "
+        "strain_col='Strain', "
+        "header=8, "
+        "chunksize=100000, cycle_interval=1, "
+        "stress_units=None, strain_units=None)"
+    )
+
+
+def test_fatigue_cycles(fatigue_folder):
+
+    obj = Fatigue(folder=fatigue_folder)
+
+    df = obj.cycles()
+
+    # Peak to peak, so one fewer than the number of periods
+    assert len(df) == 199
+    assert df["Cycle"].to_list() == list(range(1, 200))
+    assert (df["Specimen ID"] == "Fatigue_1.csv").all()
+
+    # Loop area pi * A * B in MPa %, reported in MJ/m^3
+    # A cycle can be a sample short/long as the peak drifts, hence the tolerance
+    assert_allclose(df["Hysteresis Energy"], 0.01 * np.pi * 0.5 * 20, rtol=0.03)
+    assert_allclose(
+        df["Hysteresis Energy"].median(), 0.01 * np.pi * 0.5 * 20, rtol=2e-3
+    )
+
+    # Stiffness degrades (all but the odd peak drift cycle) by about 20%
+    assert (np.diff(df["Stiffness"]) < 0).mean() > 0.95
+    assert_allclose(df["Stiffness"].iloc[-1] / df["Stiffness"].iloc[0], 0.8, atol=0.03)
+
+
+@pytest.mark.parametrize("chunksize", [7, 333, 1000])
+def test_fatigue_cycles_independent_of_chunksize(fatigue_folder, chunksize):
+
+    truth_df = Fatigue(folder=fatigue_folder, chunksize=1_000_000).cycles()
+    test_df = Fatigue(folder=fatigue_folder, chunksize=chunksize).cycles()
+
+    assert_frame_equal(test_df, truth_df)
+
+
+def test_fatigue_cycle_interval(fatigue_folder):
+
+    obj = Fatigue(folder=fatigue_folder, cycle_interval=50)
+
+    assert obj.cycles()["Cycle"].to_list() == [1, 51, 101, 151]
+
+
+def test_fatigue_summarise(fatigue_folder):
+
+    obj = Fatigue(folder=fatigue_folder, chunksize=500, cycle_interval=50)
+
+    df = obj.summarise()
+
+    assert df.columns.to_list() == [
+        "Specimen ID",
+        "Cycles",
+        "Initial Stiffness",
+        "Final Stiffness",
+        "Stiffness Retention",
+        "Hysteresis Energy",
+    ]
+
+    # summarise uses every cycle regardless of cycle_interval
+    cycles = Fatigue(folder=fatigue_folder).cycles()
+
+    assert df["Cycles"].iloc[0] == 199
+    assert_allclose(df["Initial Stiffness"].iloc[0], cycles["Stiffness"].iloc[0])
+    assert_allclose(df["Final Stiffness"].iloc[0], cycles["Stiffness"].iloc[-1])
+    assert_allclose(df["Hysteresis Energy"].iloc[0], cycles["Hysteresis Energy"].sum())
+
+
+@pytest.mark.parametrize("chunksize", [5, 1000])
+def test_fatigue_rainflow_astm_example(rainflow_folder, chunksize):
+
+    obj = Fatigue(folder=rainflow_folder, chunksize=chunksize)
+
+    counts = obj.rainflow().groupby("Range")["Count"].sum().to_dict()
+
+    assert counts == {3.0: 0.5, 4.0: 1.5, 6.0: 0.5, 8.0: 1.0, 9.0: 0.5}
+
+
+@pytest.mark.parametrize(
+    "method, args", [("sweep", ([(0.1, 0.2)],)), ("export", ("out",)), ("view", ())]
+)
+def test_fatigue_unsupported(fatigue_folder, method, args):
+
+    obj = Fatigue(folder=fatigue_folder)
+
+    with pytest.raises(TypeError, match=f"Fatigue.{method} is not supported"):
+        getattr(obj, method)(*args)
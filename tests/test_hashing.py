@@ -0,0 +1,80 @@
+"""
+Tests for the content hashing used to find duplicate specimens.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import hashlib
+import io
+import sys
+import types
+
+import pytest
+
+from pymechtest import hashing
+
+TABLE = "Time,Strain,Stress\n(s),(%),(MPa)\n0.0,0.0,0.0\n0.1,0.1,20.0\n"
+
+
+def test_check_mode():
+
+    for mode in hashing.MODES:
+        hashing.check_mode(mode)
+
+    with pytest.raises(ValueError, match="dedupe must be one of"):
+        hashing.check_mode("drop")
+
+
+def test_table_hash_ignores_metadata_and_line_endings():
+
+    original = io.StringIO("Specimen ID,1\nWidth,10\n\n" + TABLE, newline=None)
+    copy = io.StringIO(
+        "Specimen ID,2\nWidth,12\n" + TABLE.replace("\n", "\r\n"), newline=None
+    )
+
+    assert hashing.table_hash(original, header=2) == hashing.table_hash(copy, header=2)
+
+
+def test_table_hash_differs_for_different_table():
+
+    original = io.StringIO("Specimen ID,1\n" + TABLE)
+    changed = io.StringIO("Specimen ID,1\n" + TABLE.replace("20.0", "20.1"))
+
+    assert hashing.table_hash(original, header=1) != hashing.table_hash(
+        changed, header=1
+    )
+
+
+def test_table_hash_uses_xxhash(monkeypatch):
+
+    fake = types.ModuleType("xxhash")
+    fake.xxh3_64 = lambda: hashlib.md5()  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "xxhash", fake)
+
+    assert (
+        hashing.table_hash(io.StringIO(TABLE), header=0)
+        == hashlib.md5(TABLE.encode()).hexdigest()
+    )
+
+
+@pytest.mark.parametrize("block_size", [7, hashing.BLOCK_SIZE])
+def test_table_hash_falls_back_to_blake2b(monkeypatch, block_size):
+
+    monkeypatch.setitem(sys.modules, "xxhash", None)
+    monkeypatch.setattr(hashing, "BLOCK_SIZE", block_size)
+
+    assert (
+        hashing.table_hash(io.StringIO(TABLE), header=0)
+        == hashlib.blake2b(TABLE.encode(), digest_size=8).hexdigest()
+    )
+
+
+def test_first_copies():
+
+    assert hashing.first_copies(["a", "b", "a", "c", "b", "a"]) == [0, 1, 0, 3, 1, 0]
+
+
+def test_first_copies_unhashed():
+
+    assert hashing.first_copies(["a", None, "a", None]) == [0, 1, 0, 3]
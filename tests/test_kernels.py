@@ -0,0 +1,231 @@
+"""
+Tests for the fused strength/modulus/yield kernel, which should match the
+calculators on all the test data.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymechtest import Tensile, calculators, kernels
+
+from .test_utils import TENS_NO_YIELD, TENS_YIELD, paths
+
+KERNELS = [kernels._fused_metrics, kernels._numpy_metrics, kernels.curve_metrics]
+
+
+def expected_metrics(curve):
+
+    return (
+        np.nanmax(curve.stress),
+        *curve.fit,
+        calculators.offset_yield(curve),
+    )
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("filepath", paths)
+def test_kernel_matches_calculators(kernel, filepath):
+
+    obj = Tensile(filepath.parent, id_row=3, header=8)
+    curve = obj._curve(obj._load(filepath))
+
+    metrics = kernel(
+        curve.strain, curve.stress, curve.labels, curve.strain1, curve.strain2, 0.2
+    )
+
+    assert_allclose(metrics, expected_metrics(curve), rtol=1e-10)
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_kernel_skips_nan(kernel):
+
+    strain = np.array([0.0, 0.1, np.nan, 0.2, 0.3, 0.4])
+    stress = np.array([0.0, 10.0, 99.0, np.nan, 30.0, 35.0])
+    labels = np.arange(len(strain))
+
+    strength, slope, intercept, _ = kernel(strain, stress, labels, 0.0, 0.3, 0.2)
+
+    assert strength == 99.0
+    assert_allclose(
+        [slope, intercept],
+        np.polyfit([0.0, 0.1, 0.3], [0.0, 10.0, 30.0], 1),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_kernel_too_few_points_in_window(kernel):
+
+    strain = np.array([0.0, 1.0, 2.0])
+    stress = np.array([0.0, 5.0, 6.0])
+
+    metrics = kernel(strain, stress, np.arange(3), 0.5, 1.5, 0.2)
+
+    assert metrics[0] == 6.0
+    assert np.isnan(metrics[1:]).all()
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_kernel_raises_on_label_past_end(kernel):
+
+    strain = np.array([0.0, 0.1, 0.2, 0.3])
+    stress = np.array([0.0, 1.0, 2.0, 2.5])
+    # Labels start at 1 (the units row was label 0) so the last point's label
+    # is past the end, exactly the case offset_yield raises on
+    labels = np.arange(1, 5)
+
+    with pytest.raises(IndexError):
+        kernel(strain, stress, labels, 0.0, 0.2, 0.05)
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_kernel_nan_offset_skips_yield(kernel):
+
+    strain = np.array([0.0, 0.1, 0.2, 0.3])
+    stress = np.array([0.0, 1.0, 2.0, 2.5])
+
+    metrics = kernel(strain, stress, np.arange(1, 5), 0.0, 0.2, np.nan)
+
+    assert_allclose(metrics[:2], [2.5, 10.0])
+    assert np.isnan(metrics[3])
+
+
+@pytest.mark.parametrize(
+    "folder, kwargs",
+    [
+        (TENS_YIELD, {}),
+        (TENS_YIELD, {"auto_modulus": True, "methods": ["chord", "reh"]}),
+        (TENS_NO_YIELD, {"expect_yield": False}),
+    ],
+)
+def test_summarise_jit_matches(folder, kwargs):
+
+    expected = Tensile(folder, id_row=3, header=8, **kwargs).summarise()
+    summary = Tensile(folder, id_row=3, header=8, jit=True, **kwargs).summarise()
+
+    assert summary.columns.tolist() == expected.columns.tolist()
+    assert summary["Specimen ID"].tolist() == expected["Specimen ID"].tolist()
+    assert_allclose(
+        summary.drop(columns="Specimen ID").to_numpy(dtype=float),
+        expected.drop(columns="Specimen ID").to_numpy(dtype=float),
+        rtol=1e-10,
+    )
+
+
+def test_curve_metrics_falls_back_to_numpy(monkeypatch):
+
+    monkeypatch.setattr(kernels, "_compiled", lambda: None)
+
+    calls = []
+    original = kernels._numpy_metrics
+
+    def numpy_metrics(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(kernels, "_numpy_metrics", numpy_metrics)
+
+    strain = np.linspace(0, 1, 50)
+    kernels.curve_metrics(strain, 100 * strain, np.arange(50), 0.1, 0.5)
+
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("block", [kernels.WINDOW_BLOCK, 1000])
+@pytest.mark.parametrize("filepath", paths)
+def test_window_slopes_matches_fit(filepath, block, monkeypatch):
+
+    monkeypatch.setattr(kernels, "WINDOW_BLOCK", block)
+
+    obj = Tensile(filepath.parent, id_row=3, header=8)
+    df = obj._load(filepath)
+    strain = df[obj.strain_col].to_numpy(dtype=float)
+    stress = df[obj.stress_col].to_numpy(dtype=float)
+
+    strain1 = np.array([0.005, 0.01, 0.02, 0.05])
+    strain2 = np.array([0.015, 0.03, 0.1, 0.25])
+
+    expected = [
+        calculators.Curve(strain, stress, df.index.to_numpy(), s1, s2).fit[0]
+        for s1, s2 in zip(strain1, strain2)
+    ]
+
+    assert_allclose(
+        kernels.window_slopes(strain, stress, strain1, strain2), expected, rtol=1e-8
+    )
+
+
+def test_window_slopes_nan_and_too_few_points():
+
+    strain = np.array([0.0, 0.1, np.nan, 0.2, 0.3, 0.4])
+    stress = np.array([0.0, 10.0, 99.0, 20.0, np.nan, 40.0])
+
+    slopes = kernels.window_slopes(
+        strain, stress, np.array([0.0, 0.0, 0.35, 5.0]), np.array([0.2, 0.3, 0.4, 6.0])
+    )
+
+    assert_allclose(slopes[0], 100.0)
+    # Missing stress in the window, one point and no points
+    assert np.isnan(slopes[1:]).all()
+
+
+def reference_rainflow(points):
+
+    cycles, stack = [], []
+    for point in points:
+        stack.append(point)
+        while len(stack) >= 3:
+            if abs(stack[-1] - stack[-2]) < abs(stack[-2] - stack[-3]):
+                break
+            if len(stack) == 3:
+                cycles.append((stack[0], stack[1], 0.5))
+                del stack[0]
+            else:
+                cycles.append((stack[-3], stack[-2], 1.0))
+                del stack[-3:-1]
+
+    return cycles, stack
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("blocks", [1, 7, 1000])
+def test_rainflow_cycles_matches_reference(compiled, blocks, monkeypatch):
+
+    if not compiled:
+        monkeypatch.setattr(kernels, "_compiled_rainflow", lambda: None)
+
+    rng = np.random.default_rng(42)
+    steps = rng.uniform(1, 10, 5000) * np.where(np.arange(5000) % 2, 1, -1)
+    points = np.cumsum(steps)
+
+    cycles = []
+    stack = np.empty(0)
+    for block in np.array_split(points, blocks):
+        starts, ends, counts, stack = kernels.rainflow_cycles(block, stack)
+        cycles.extend(zip(starts.tolist(), ends.tolist(), counts.tolist()))
+
+    expected, expected_stack = reference_rainflow(points.tolist())
+
+    assert cycles == expected
+    assert stack.tolist() == expected_stack
+
+
+def test_rainflow_cycles_astm_example():
+
+    # ASTM E1049 figure 6 reversals
+    points = np.array([-2.0, 1, -3, 5, -1, 3, -4, 4, -2])
+
+    starts, ends, counts, stack = kernels.rainflow_cycles(points, np.empty(0))
+
+    assert list(zip(np.abs(starts - ends).tolist(), counts.tolist())) == [
+        (3.0, 0.5),
+        (4.0, 0.5),
+        (4.0, 1.0),
+        (8.0, 0.5),
+    ]
+    # The rest are half cycles
+    assert stack.tolist() == [5.0, -4.0, 4.0, -2.0]
@@ -0,0 +1,170 @@
+"""
+Tests for the HTML and PDF reports.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import json
+import re
+import sys
+import types
+
+import pytest
+
+from pymechtest import Tensile, report
+from pymechtest.base import BaseMechanicalTest
+
+from .test_utils import TENS_NO_YIELD, TENS_YIELD
+
+
+def make_test(folder):
+
+    return Tensile(folder, id_row=3, header=8, strain1=0.005, strain2=0.015)
+
+
+def embedded_spec(page):
+
+    spec = re.search(r'vegaEmbed\("#curves", (.*), \{"actions": false\}\);', page)
+
+    return json.loads(spec.group(1).replace("<\\/", "</"))
+
+
+def test_report_html(tmp_path):
+
+    obj = make_test(TENS_YIELD)
+
+    fp = obj.report(tmp_path.joinpath("lot.html"), basis="B")
+    page = fp.read_text()
+
+    assert fp == tmp_path.joinpath("lot.html").resolve()
+    assert "<title>Tensile Report: Tens_Yield</title>" in page
+    assert "B-basis" in page
+    assert page.replace(report.vega_scripts(), "").count("<table") == 3
+    assert "10 specimens" in page
+    # The vega scripts are inlined so the report renders offline
+    assert "cdn.jsdelivr.net" not in page
+    assert "<script src=" not in page
+    assert report.vega_scripts() in page
+
+    # Curves and markers are inlined rather than served by the data server
+    spec = embedded_spec(page)
+    assert "url" not in json.dumps(spec)
+    assert len(spec["datasets"]) == 2
+
+
+def test_vega_scripts_inlined(monkeypatch):
+
+    altair_viewer = pytest.importorskip("altair_viewer")
+
+    monkeypatch.setattr(
+        altair_viewer,
+        "get_bundled_script",
+        lambda package, version: f"var {package[:4]} = '{version}</Script>';",
+    )
+    report.vega_scripts.cache_clear()
+    try:
+        scripts = report.vega_scripts()
+    finally:
+        report.vega_scripts.cache_clear()
+
+    assert scripts.count("<script>") == 3
+    assert scripts.count("</script>") == 3
+    assert "var vega = '5<\\/Script>';" in scripts
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_report_loads_data_once(tmp_path, monkeypatch, backend):
+
+    calls = []
+    original_load = BaseMechanicalTest._load
+    original_scan = BaseMechanicalTest._scan
+
+    def load(self, fp, usecols=None):
+        calls.append(usecols)
+        return original_load(self, fp, usecols=usecols)
+
+    def scan(self, fp, usecols=None):
+        calls.append(usecols)
+        return original_scan(self, fp, usecols=usecols)
+
+    monkeypatch.setattr(BaseMechanicalTest, "_load", load)
+    monkeypatch.setattr(BaseMechanicalTest, "_scan", scan)
+
+    obj = make_test(TENS_YIELD)
+    obj.backend = backend
+    obj.report(tmp_path.joinpath("lot.html"))
+
+    # Each file loaded once in full for the curves, the summary is calculated
+    # from those and the markers and stats reuse the summary
+    assert calls == [None] * 10
+
+
+def test_report_png(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(report, "render_png", lambda chart, method: b"png bytes")
+
+    page = make_test(TENS_YIELD).report(tmp_path.joinpath("lot.html"), charts="png")
+
+    text = page.read_text()
+    assert 'src="data:image/png;base64,cG5nIGJ5dGVz"' in text
+    assert "vega-embed" not in text
+
+
+def test_report_pdf(tmp_path, monkeypatch):
+
+    written = {}
+
+    class HTML:
+        def __init__(self, string):
+            written["html"] = string
+
+        def write_pdf(self, target):
+            written["target"] = target
+
+    monkeypatch.setitem(sys.modules, "weasyprint", types.SimpleNamespace(HTML=HTML))
+    monkeypatch.setattr(report, "render_png", lambda chart, method: b"png bytes")
+
+    fp = make_test(TENS_YIELD).report(tmp_path.joinpath("lot.pdf"), format="pdf")
+
+    assert written["target"] == str(fp)
+    assert "data:image/png;base64" in written["html"]
+
+
+def test_report_pdf_needs_weasyprint(tmp_path, monkeypatch):
+
+    monkeypatch.setitem(sys.modules, "weasyprint", None)
+
+    with pytest.raises(ImportError, match=r"pymechtest\[pdf\]"):
+        make_test(TENS_YIELD).report(tmp_path.joinpath("lot.pdf"), format="pdf")
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [({"format": "docx"}, "format must be"), ({"charts": "svg"}, "charts must be")],
+)
+def test_report_bad_options(tmp_path, kwargs, match):
+
+    with pytest.raises(ValueError, match=match):
+        make_test(TENS_YIELD).report(tmp_path.joinpath("lot.html"), **kwargs)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_reports(tmp_path, workers):
+
+    tests = [make_test(TENS_YIELD), make_test(TENS_NO_YIELD)]
+    tests[1].expect_yield = False
+
+    files = report.build_reports(tests, tmp_path.joinpath("reports"), workers=workers)
+
+    assert [f.name for f in files] == ["Tens_Yield.html", "Tens_No_Yield.html"]
+    assert all(f.exists() for f in files)
+    assert "Tensile Report: Tens_No_Yield" in files[1].read_text()
+
+
+def test_build_reports_repeated_names(tmp_path):
+
+    with pytest.raises(ValueError, match="Folder names must be unique"):
+        report.build_reports(
+            [make_test(TENS_YIELD), make_test(TENS_YIELD)], tmp_path, workers=1
+        )
@@ -0,0 +1,205 @@
+"""
+Tests for the SQLite results store.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from pymechtest import Compression, Tensile, results
+
+from .test_utils import TENS_YIELD
+
+
+@pytest.fixture
+def summary():
+
+    return pd.DataFrame(
+        {
+            "Specimen ID": ["1", "2", "3"],
+            "Strength": [100.0, 110.0, np.nan],
+            "Modulus": [200.0, 210.0, 220.0],
+            "Flags": pd.array(["", "R2", pd.NA], dtype="string"),
+        }
+    ).convert_dtypes()
+
+
+@pytest.fixture
+def store(tmp_path):
+
+    with results.ResultsStore(tmp_path.joinpath("results.db")) as store:
+        yield store
+
+
+def add(store, summary, material, settings=None):
+
+    return store.add(
+        summary,
+        "Tensile",
+        settings or {"strain1": 0.05},
+        [Path(f"{material}/{i}.csv") for i in summary["Specimen ID"]],
+        [{"Material": material}] * len(summary),
+    )
+
+
+def test_settings_hash():
+
+    assert results.settings_hash(
+        {"a": 1, "b": None}, "Tensile"
+    ) == results.settings_hash({"b": None, "a": 1}, "Tensile")
+    assert results.settings_hash({"a": 1}, "Tensile") != results.settings_hash(
+        {"a": 2}, "Tensile"
+    )
+    assert results.settings_hash({"a": 1}, "Tensile") != results.settings_hash(
+        {"a": 1}, "Compression"
+    )
+    assert len(results.settings_hash({"a": 1}, "Tensile")) == 16
+
+
+def test_repr(tmp_path):
+
+    path = tmp_path.joinpath("results.db")
+
+    with results.ResultsStore(path) as store:
+        assert repr(store) == f"ResultsStore(path={path!r})"
+
+
+def test_query_all(store, summary):
+
+    key = add(store, summary, "X")
+
+    df = store.query()
+
+    assert df.columns.tolist() == results.ID_COLUMNS + ["Strength", "Modulus"]
+    assert df["Specimen ID"].tolist() == ["1", "2", "3"]
+    assert df["Settings Hash"].unique().tolist() == [key]
+    assert df["Test"].unique().tolist() == ["Tensile"]
+    assert_allclose(df["Strength"], [100.0, 110.0, np.nan])
+    assert_allclose(df["Modulus"], [200.0, 210.0, 220.0])
+
+
+def test_query_filters(store, summary):
+
+    add(store, summary, "X")
+    add(store, summary.assign(Modulus=[1.0, 2.0, 3.0]), "Y")
+
+    df = store.query("Modulus", test="Tensile", where={"Material": "Y"})
+
+    assert df.columns.tolist() == results.ID_COLUMNS + ["Modulus"]
+    assert df["Modulus"].tolist() == [1.0, 2.0, 3.0]
+
+    assert store.query(test="Compression").empty
+    assert store.query(where={"Flags": "R2"})["File"].tolist() == [
+        str(Path("X/2.csv")),
+        str(Path("Y/2.csv")),
+    ]
+
+
+def test_query_since_until(store, summary):
+
+    add(store, summary, "X")
+
+    assert len(store.query(since="2000-01-01")) == 3
+    assert store.query(since="9999-01-01").empty
+    assert store.query(until="2000-01-01").empty
+
+
+def test_add_replaces_same_settings(store, summary):
+
+    add(store, summary, "X")
+    add(store, summary.assign(Modulus=[1.0, 2.0, 3.0]), "X")
+
+    df = store.query("Modulus")
+
+    assert df["Modulus"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_add_keeps_other_settings(store, summary):
+
+    first = add(store, summary, "X")
+    second = add(store, summary, "X", settings={"strain1": 0.1})
+
+    assert first != second
+    assert len(store.query()) == 6
+    assert len(store.query(settings_hash=second)) == 3
+
+
+def test_add_file_count_mismatch(store, summary):
+
+    with pytest.raises(ValueError, match="Got 1 files for a summary of 3"):
+        store.add(summary, "Tensile", {}, [Path("1.csv")])
+
+
+def test_metadata(store, summary):
+
+    add(store, summary, "X")
+
+    df = store.metadata(["2"])
+
+    assert df.columns.tolist() == [
+        "Settings Hash",
+        "Specimen ID",
+        "File",
+        "Flags",
+        "Material",
+    ]
+    assert df[["Flags", "Material"]].values.tolist() == [["R2", "X"]]
+
+
+def test_summarise_store(tmp_path):
+
+    obj = Tensile(TENS_YIELD, id_row=3, header=8, strain1=0.005, strain2=0.015)
+    path = tmp_path.joinpath("results.db")
+
+    summary = obj.summarise(store=path)
+
+    with results.ResultsStore(path) as store:
+        df = store.query(test="Tensile", where={"Thickness": "1.98900"})
+        metadata = store.metadata()
+
+    stored = summary.set_index("Specimen ID").loc[df["Specimen ID"]]
+
+    assert len(df) > 0
+    assert_allclose(df["Modulus"], stored["Modulus"].astype(float))
+    assert df["Settings Hash"].unique().tolist() == [
+        results.settings_hash(obj._settings(), "Tensile")
+    ]
+    assert sorted(metadata["File"]) == sorted(str(f) for f in obj._find_files())
+
+
+def test_summarise_store_screen_exclude(tmp_path, base_yield):
+
+    obj = base_yield
+    obj.screen = "exclude"
+
+    with results.ResultsStore(tmp_path.joinpath("results.db")) as store:
+        summary = obj.summarise(store=store)
+        df = store.query()
+
+    assert df["Specimen ID"].tolist() == summary["Specimen ID"].tolist()
+    assert summary.index.tolist() == list(range(len(summary)))
+
+
+def test_summarise_store_test_types(tmp_path):
+
+    path = tmp_path.joinpath("results.db")
+    kwargs = dict(id_row=3, header=8, strain1=0.005, strain2=0.015)
+
+    Tensile(TENS_YIELD, **kwargs).summarise(store=path)
+    Compression(TENS_YIELD, **kwargs).summarise(store=path)
+
+    with results.ResultsStore(path) as store:
+        tensile = store.query("Modulus", test="Tensile")
+        compression = store.query("Modulus", test="Compression")
+
+    # Same files and settings, but neither overwrites nor absorbs the other
+    assert len(tensile) == len(compression) == 10
+    assert tensile["Test"].unique().tolist() == ["Tensile"]
+    assert compression["Test"].unique().tolist() == ["Compression"]
+    assert set(tensile["Settings Hash"]).isdisjoint(compression["Settings Hash"])
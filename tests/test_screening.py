@@ -0,0 +1,205 @@
+"""
+Tests for the data quality screening.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy.testing import assert_allclose
+
+from pymechtest import Tensile, calculators, screening
+
+from .test_utils import TENS_YIELD
+
+
+def make_curve(strain, stress):
+
+    strain = np.asarray(strain, dtype=float)
+    stress = np.asarray(stress, dtype=float)
+
+    return calculators.Curve(
+        strain=strain,
+        stress=stress,
+        labels=np.arange(len(strain)),
+        strain1=0.05,
+        strain2=0.15,
+    )
+
+
+def test_diagnostics_clean_curve():
+
+    strain = np.linspace(0, 1, 101)
+    curve = make_curve(strain, 2000 * strain)
+
+    diagnostics = screening.diagnostics(curve)
+
+    assert_allclose(diagnostics["R2"], 1)
+    assert diagnostics["Strain Reversals"] == 0
+    assert_allclose(diagnostics["Max Gap"], 1)
+    assert_allclose(diagnostics["Zero Offset"], 0, atol=1e-12)
+
+
+def test_diagnostics_slipping_extensometer():
+
+    strain = np.linspace(0, 1, 101)
+    stress = 2000 * strain
+    # Strain jumps back 0.2 % half way up
+    strain[50:] -= 0.2
+
+    diagnostics = screening.diagnostics(make_curve(strain, stress))
+
+    assert diagnostics["Strain Reversals"] > screening.MAX_REVERSALS
+
+
+def test_diagnostics_strain_gap():
+
+    strain = np.concatenate([np.linspace(0, 0.5, 100), np.linspace(5, 5.5, 100)])
+
+    diagnostics = screening.diagnostics(make_curve(strain, 200 * strain))
+
+    assert diagnostics["Max Gap"] > screening.MAX_GAP
+
+
+def test_diagnostics_strain_offset():
+
+    strain = np.linspace(0, 1, 101)
+
+    diagnostics = screening.diagnostics(make_curve(strain, 2000 * (strain - 0.1)))
+
+    assert_allclose(diagnostics["Zero Offset"], 0.1)
+
+
+def test_diagnostics_non_linear_modulus():
+
+    strain = np.linspace(0, 1, 101)
+
+    diagnostics = screening.diagnostics(
+        make_curve(strain, 2000 * strain * np.where(strain > 0.1, 0.1, 1))
+    )
+
+    assert diagnostics["R2"] < screening.MIN_R_SQUARED
+
+
+def test_diagnostics_empty_window():
+
+    strain = np.linspace(1, 2, 11)
+
+    diagnostics = screening.diagnostics(make_curve(strain, 2000 * strain))
+
+    assert np.isnan(diagnostics["R2"])
+
+
+def test_flags():
+
+    summary = pd.DataFrame(
+        {
+            "Specimen ID": list("abcdef"),
+            "Strength": [100.0, 101.0, 99.0, 100.5, 99.5, 150.0],
+            "Modulus": [200.0, 201.0, 199.0, 200.5, 199.5, 200.2],
+            "R2": [0.999, 0.5, 0.999, 0.999, 0.999, 0.999],
+            "Strain Reversals": [0.0, 0.0, 0.2, 0.0, 0.0, 0.0],
+            "Max Gap": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+            "Zero Offset": [0.0, 0.0, 0.0, -0.3, 0.0, 0.0],
+        }
+    )
+
+    assert screening.flags(summary).tolist() == [
+        "",
+        "Non linear modulus",
+        "Strain reversals",
+        "Zero offset",
+        "",
+        "Strength outlier",
+    ]
+
+
+def test_check_mode_raises():
+
+    with pytest.raises(ValueError):
+        screening.check_mode("drop")
+
+
+def test_summarise_flag(base_yield):
+
+    obj = base_yield
+    obj.screen = "flag"
+
+    df = obj.summarise()
+
+    assert df.columns.tolist() == [
+        "Specimen ID",
+        "Strength",
+        "Modulus",
+        "Yield Strength",
+        "R2",
+        "Strain Reversals",
+        "Max Gap",
+        "Zero Offset",
+        "Flags",
+    ]
+    assert df.loc[df["Flags"] != "", "Specimen ID"].tolist() == ["007"]
+    assert df.loc[3, "Flags"] == "Strength outlier"
+
+
+def test_summarise_exclude(base_yield):
+
+    obj = base_yield
+    expected = obj.summarise()
+
+    obj.screen = "exclude"
+    df = obj.summarise()
+
+    assert df.columns.tolist() == expected.columns.tolist()
+    assert "007" not in df["Specimen ID"].tolist()
+    assert len(df) == len(expected) - 1
+
+
+def test_stats_exclude(base_yield):
+
+    obj = base_yield
+    obj.screen = "exclude"
+
+    assert obj.stats().loc["count", "Strength"] == 9
+
+
+def test_summarise_exclude_by_folder(base_yield, lots_yield_folder):
+
+    obj = base_yield
+    obj.folder = lots_yield_folder
+    expected = obj.summarise(by="Folder").set_index("Specimen ID")["Folder"]
+
+    obj.screen = "exclude"
+    df = obj.summarise(by="Folder")
+
+    # Folders still line up with their specimens after the exclusion
+    assert df.set_index("Specimen ID")["Folder"].to_dict() == (
+        expected.drop("007").to_dict()
+    )
+
+
+def test_summarise_invalid_screen(base_yield):
+
+    obj = base_yield
+    obj.screen = "drop"
+
+    with pytest.raises(ValueError):
+        obj.summarise()
+
+
+def test_polars_screening_matches_pandas():
+
+    pytest.importorskip("polars")
+
+    kwargs = dict(id_row=3, header=8, strain1=0.005, strain2=0.015, screen="flag")
+
+    expected = Tensile(TENS_YIELD, **kwargs).summarise()
+    df = Tensile(TENS_YIELD, backend="polars", **kwargs).summarise()
+
+    assert df["Flags"].tolist() == expected["Flags"].tolist()
+    assert_allclose(
+        df[list(screening.DIAGNOSTIC_COLUMNS)].to_numpy(dtype=float),
+        expected[list(screening.DIAGNOSTIC_COLUMNS)].to_numpy(dtype=float),
+    )
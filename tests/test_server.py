@@ -0,0 +1,246 @@
+"""
+Tests for the local HTTP analysis service.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import concurrent.futures
+import gzip
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from pymechtest import Tensile, server
+from pymechtest.server import AnalysisServer, _parse_query, make_server
+
+TENS_YIELD = Path(__file__).parents[1].resolve().joinpath("tests/data/Tens_Yield")
+
+QUERY = "type=tensile&header=8&id_row=3&strain1=0.005&strain2=0.015"
+
+
+@pytest.fixture(scope="module")
+def url():
+    """
+    A running server on a free port, shared by all the tests in this module.
+    """
+
+    server = make_server(port=0, workers=1, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_port}"
+
+    server.shutdown()
+    server.server_close()
+    server.pool.shutdown()
+
+
+def request(url, data=None):
+    """
+    Makes a request, returning (status, decoded JSON body).
+    """
+
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data)) as r:
+            return r.status, json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_parse_query():
+
+    assert _parse_query(QUERY + "&expect_yield=false&method=chord&method=rp0.5") == (
+        "tensile",
+        "specimen.csv",
+        {
+            "header": 8,
+            "id_row": 3,
+            "strain1": 0.005,
+            "strain2": 0.015,
+            "expect_yield": False,
+            "methods": ["chord", "rp0.5"],
+        },
+    )
+
+
+def test_parse_query_filename_is_only_a_name():
+
+    assert _parse_query("filename=../../etc/passwd")[1] == "passwd"
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [("type=torsion", "type must be one of"), ("colour=red", "Unknown parameter")],
+)
+def test_parse_query_invalid(query, message):
+
+    with pytest.raises(ValueError, match=message):
+        _parse_query(query)
+
+
+def test_health(url):
+
+    assert request(url + "/health") == (200, {"status": "ok"})
+
+
+def test_summarise(url):
+
+    fp = sorted(TENS_YIELD.glob("*.csv"))[0]
+
+    status, body = request(f"{url}/summarise?{QUERY}", data=fp.read_bytes())
+
+    obj = Tensile(folder=TENS_YIELD, header=8, id_row=3, strain1=0.005, strain2=0.015)
+    truth = obj._summarise_file(fp)
+
+    assert status == 200
+    assert body.keys() == truth.to_dict().keys()
+    assert body["Specimen ID"] == truth["Specimen ID"]
+    assert body["Modulus"] == pytest.approx(truth["Modulus"])
+    assert body["Yield Strength"] == pytest.approx(truth["Yield Strength"])
+
+
+def test_summarise_compressed_with_filename(url):
+
+    fp = sorted(TENS_YIELD.glob("*.csv"))[0]
+    query = "header=8&strain1=0.005&strain2=0.015&filename=spec_1.csv.gz"
+
+    status, body = request(
+        f"{url}/summarise?{query}", data=gzip.compress(fp.read_bytes())
+    )
+
+    assert status == 200
+    assert body["Specimen ID"] == "spec_1.csv"
+
+
+def test_summarise_bad_query(url):
+
+    status, body = request(f"{url}/summarise?colour=red", data=b"a,b\n1,2\n")
+
+    assert status == 400
+    assert "Unknown parameter" in body["error"]
+
+
+def test_summarise_no_file(url):
+
+    assert request(f"{url}/summarise", data=b"")[0] == 400
+
+
+def test_summarise_bad_data(url):
+
+    status, body = request(f"{url}/summarise", data=b"a,b\n1,2\n")
+
+    assert status == 422
+    assert body["error"] == "Could not detect stress_col."
+
+
+def test_not_found(url):
+
+    assert request(url + "/nothing")[0] == 404
+    assert request(url + "/nothing", data=b"x")[0] == 404
+
+
+def test_make_server_starts_every_worker():
+
+    started = make_server(port=0, workers=2, quiet=True)
+
+    try:
+        processes = list(started.pool._processes.values())
+        assert len(processes) == 2
+        assert all(p.is_alive() for p in processes)
+    finally:
+        started.server_close()
+        started.pool.shutdown()
+
+
+def test_summarise_unexpected_error(monkeypatch):
+    def analyse(*args):
+        raise IndexError("index 0 is out of bounds")
+
+    monkeypatch.setattr(server, "_analyse", analyse)
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    running = AnalysisServer(("127.0.0.1", 0), pool, quiet=True)
+    thread = threading.Thread(target=running.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        status, body = request(
+            f"http://127.0.0.1:{running.server_port}/summarise", data=b"a,b\n1,2\n"
+        )
+    finally:
+        running.shutdown()
+        running.server_close()
+        pool.shutdown()
+
+    assert status == 500
+    assert body["error"] == "Internal error: IndexError: index 0 is out of bounds"
+
+
+@pytest.fixture
+def small_server():
+    """
+    A server accepting uploads of at most 100 bytes, with a thread pool so
+    it starts quickly.
+    """
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    running = AnalysisServer(("127.0.0.1", 0), pool, quiet=True, max_body=100)
+    thread = threading.Thread(target=running.serve_forever, daemon=True)
+    thread.start()
+
+    yield running
+
+    running.shutdown()
+    running.server_close()
+    pool.shutdown()
+
+
+def post_raw(port, content_length, body=b""):
+    """
+    POSTs to /summarise with whatever Content-Length header is passed,
+    returning (status, decoded JSON body).
+    """
+
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        connection.putrequest("POST", "/summarise")
+        connection.putheader("Content-Length", content_length)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("content_length", ["abc", "-5", "1.5"])
+def test_summarise_invalid_content_length(small_server, content_length):
+
+    status, body = post_raw(small_server.server_port, content_length, b"a,b\n")
+
+    assert status == 400
+    assert body["error"] == f"Invalid Content-Length: {content_length!r}"
+
+
+def test_summarise_too_large(small_server):
+
+    status, body = post_raw(small_server.server_port, "101", b"x" * 101)
+
+    assert status == 413
+    assert body["error"] == "File too large: 101 bytes. The limit is 100 bytes."
+
+
+def test_make_server_max_body():
+
+    made = make_server(port=0, workers=1, quiet=True, max_body=5)
+
+    try:
+        assert made.max_body == 5
+    finally:
+        made.server_close()
+        made.pool.shutdown()
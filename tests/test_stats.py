@@ -0,0 +1,183 @@
+"""
+Tests for the stats extension module.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymechtest import stats
+
+# Published exact one-sided 95% confidence tolerance factors
+normal_k_factors = [
+    (5, "B", 3.407),
+    (10, "B", 2.355),
+    (30, "B", 1.777),
+    (10, "A", 3.981),
+    (30, "A", 3.064),
+]
+
+
+@pytest.mark.parametrize("n, basis, k", normal_k_factors)
+def test_normal_k_factor_approximation(n, basis, k):
+
+    assert_allclose(stats._normal_k(n, basis), k, rtol=0.01)
+
+
+def test_weibull_fit_recovers_parameters():
+
+    rng = np.random.default_rng(42)
+    data = 500 * rng.weibull(20, size=20_000)
+
+    shape, scale = stats.weibull_fit(data)
+
+    assert_allclose(shape, 20, rtol=0.02)
+    assert_allclose(scale, 500, rtol=0.01)
+
+
+def test_weibull_fit_raises_on_non_positive():
+
+    with pytest.raises(ValueError):
+        stats.weibull_fit(np.array([1.0, 2.0, 0.0]))
+
+
+@pytest.mark.parametrize("distribution", ["normal", "lognormal", "weibull"])
+def test_basis_values_below_minimum(distribution):
+
+    rng = np.random.default_rng(1)
+    data = rng.normal(500, 20, size=15)
+
+    b_basis = stats.basis_value(data, basis="B", distribution=distribution)
+    a_basis = stats.basis_value(data, basis="A", distribution=distribution)
+
+    assert a_basis < b_basis < data.mean()
+
+
+def test_normal_basis_value():
+
+    data = np.array([100.0, 102.0, 98.0, 101.0, 99.0, 100.0, 103.0, 97.0, 100.0, 100.0])
+
+    expected = data.mean() - stats._normal_k(10, "B") * data.std(ddof=1)
+
+    assert_allclose(stats.basis_value(data), expected)
+
+
+def test_basis_value_ignores_nan():
+
+    data = np.array([100.0, 102.0, np.nan, 98.0])
+
+    assert_allclose(stats.basis_value(data), stats.basis_value(data[~np.isnan(data)]))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"basis": "C"},
+        {"distribution": "gamma"},
+    ],
+)
+def test_basis_value_raises_on_bad_args(kwargs):
+
+    with pytest.raises(ValueError):
+        stats.basis_value(np.array([1.0, 2.0, 3.0]), **kwargs)
+
+
+def test_basis_value_raises_on_too_few_values():
+
+    with pytest.raises(ValueError):
+        stats.basis_value(np.array([1.0]))
+
+
+def test_basis_values_per_column():
+
+    x = np.random.default_rng(2).normal(100, 5, size=(20, 4))
+    x[:, 1] = np.nan
+    x[1:, 2] = np.nan
+    x[0, 3] = -1
+
+    values = stats.basis_values(x, basis="B", distribution="weibull")
+
+    assert values[0] == stats.basis_value(x[:, 0], basis="B", distribution="weibull")
+    assert np.isnan(values[1:]).all()
+    assert np.isfinite(stats.basis_values(x[:, 3:], basis="B")).all()
+
+
+@pytest.mark.parametrize("kwargs", [{"basis": "C"}, {"distribution": "gamma"}])
+def test_basis_values_raises_on_bad_args(kwargs):
+
+    with pytest.raises(ValueError):
+        stats.basis_values(np.ones((5, 0)), **kwargs)
+
+
+def test_bootstrap_ci_reproducible_and_brackets_mean():
+
+    data = np.random.default_rng(0).normal(100, 5, size=(20, 3))
+
+    lower, upper = stats.bootstrap_ci(data, n_resamples=5000, seed=7)
+    lower_again, upper_again = stats.bootstrap_ci(data, n_resamples=5000, seed=7)
+
+    assert lower.shape == upper.shape == (3,)
+    assert np.all(lower < data.mean(axis=0))
+    assert np.all(upper > data.mean(axis=0))
+    assert_allclose(lower, lower_again)
+    assert_allclose(upper, upper_again)
+
+
+@pytest.mark.parametrize("statistic", ["mean", "median", "std", "cov%"])
+def test_bootstrap_ci_statistics(statistic):
+
+    data = np.random.default_rng(3).normal(100, 5, size=30)
+
+    lower, upper = stats.bootstrap_ci(data, statistic=statistic, seed=1)
+
+    assert lower < upper
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"statistic": "mode"},
+        {"confidence": 1.5},
+    ],
+)
+def test_bootstrap_ci_raises_on_bad_args(kwargs):
+
+    with pytest.raises(ValueError):
+        stats.bootstrap_ci(np.array([1.0, 2.0, 3.0]), **kwargs)
+
+
+def test_bootstrap_ci_blocks_match_one_batch(monkeypatch):
+
+    data = np.random.default_rng(0).normal(100, 5, size=(50, 2))
+
+    expected = stats.bootstrap_ci(data, n_resamples=1000, seed=3)
+
+    # 7 resamples of 50 values at a time
+    monkeypatch.setattr(stats, "RESAMPLE_BLOCK", 350)
+    blocked = stats.bootstrap_ci(data, n_resamples=1000, seed=3)
+
+    assert_allclose(blocked, expected)
+
+
+def test_bootstrap_ci_drops_missing_values():
+
+    values = np.random.default_rng(1).normal(100, 5, size=30)
+    with_nan = np.concatenate([values, [np.nan] * 10])
+
+    lower, upper = stats.bootstrap_ci(with_nan, seed=5)
+    expected = stats.bootstrap_ci(values, seed=5)
+
+    assert_allclose((lower, upper), expected)
+
+
+def test_bootstrap_ci_columns_with_too_few_values():
+
+    data = np.array([[1.0, np.nan, 4.0], [2.0, np.nan, np.nan], [3.0, 5.0, np.nan]])
+
+    lower, upper = stats.bootstrap_ci(data, statistic="std", seed=0)
+
+    assert lower[0] < upper[0]
+    assert np.isnan(lower[1:]).all() and np.isnan(upper[1:]).all()
@@ -0,0 +1,111 @@
+"""
+Tests for the unit conversion functions.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import pytest
+
+from pymechtest import units
+
+
+@pytest.mark.parametrize(
+    "unit, factor",
+    [
+        (None, 1.0),
+        ("MPa", 1.0),
+        ("(MPa)", 1.0),
+        (" N/mm^2 ", 1.0),
+        ("kPa", 1e-3),
+        ("Pa", 1e-6),
+        ("GPa", 1e3),
+        ("psi", 6.894757e-3),
+        ("[ksi]", 6.894757),
+    ],
+)
+def test_stress_factor(unit, factor):
+
+    assert units.stress_factor(unit) == pytest.approx(factor)
+
+
+@pytest.mark.parametrize(
+    "unit, factor",
+    [
+        (None, 1.0),
+        ("%", 1.0),
+        ("(%)", 1.0),
+        ("mm/mm", 100.0),
+        ("in/in", 100.0),
+        ("Microstrain", 1e-4),
+        ("µε", 1e-4),
+    ],
+)
+def test_strain_factor(unit, factor):
+
+    assert units.strain_factor(unit) == pytest.approx(factor)
+
+
+def test_stress_factor_unrecognised():
+
+    with pytest.raises(ValueError, match="Unrecognised stress units: 'N'"):
+        units.stress_factor("N")
+
+
+def test_strain_factor_unrecognised():
+
+    with pytest.raises(ValueError, match="Unrecognised strain units: '\\(mm\\)'"):
+        units.strain_factor("(mm)")
+
+
+@pytest.mark.parametrize(
+    "unit, factor",
+    [
+        (None, 1.0),
+        ("(N)", 1.0),
+        ("kN", 1e3),
+        ("(MN)", 1e6),
+        ("mN", 1e-3),
+        ("lbf", 4.448222),
+        ("kgf", 9.80665),
+    ],
+)
+def test_load_factor(unit, factor):
+
+    assert units.load_factor(unit) == pytest.approx(factor)
+
+
+@pytest.mark.parametrize(
+    "unit, power, factor",
+    [
+        (None, 1, 1.0),
+        ("(mm)", 1, 1.0),
+        ("m", 1, 1e3),
+        ("in", 1, 25.4),
+        ("mm^2", 2, 1.0),
+        ("cm²", 2, 100.0),
+        ("in2", 2, 645.16),
+    ],
+)
+def test_length_factor(unit, power, factor):
+
+    assert units.length_factor(unit, power=power) == pytest.approx(factor)
+
+
+def test_load_factor_unrecognised():
+
+    with pytest.raises(ValueError, match="Unrecognised load units: '\\(MPa\\)'"):
+        units.load_factor("(MPa)")
+
+
+@pytest.mark.parametrize("unit", ["mn", "Mn"])
+def test_load_factor_ambiguous_case(unit):
+
+    with pytest.raises(ValueError, match="Unrecognised load units"):
+        units.load_factor(unit)
+
+
+def test_length_factor_unrecognised():
+
+    with pytest.raises(ValueError, match="Unrecognised length units: 'ft'"):
+        units.length_factor("ft")
@@ -0,0 +1,163 @@
+"""
+Tests for the level of detail curve viewer.
+
+Author: Tom Fleet
+Created: 19/10/2026
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pymechtest import Tensile, viewer
+
+from .test_utils import TENS_YIELD
+
+
+@pytest.fixture
+def curves():
+
+    # Two long noisy curves with a single sharp peak each
+    rng = np.random.default_rng(0)
+    frames = []
+    for spec_id, peak in [("1", 30_000), ("2", 70_000)]:
+        strain = np.linspace(0, 10, 100_000)
+        stress = strain * 10 + rng.normal(0, 0.1, strain.size)
+        stress[peak] = 500
+        frames.append(pd.DataFrame({"Specimen ID": spec_id, "e": strain, "s": stress}))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture(scope="module")
+def server():
+
+    obj = Tensile(TENS_YIELD, id_row=3, header=8, strain1=0.005, strain2=0.015)
+    server = obj.view()
+    yield server
+    server.close()
+
+
+def get(url):
+
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read().decode()
+
+
+def test_decimate_short_curve_untouched():
+
+    assert viewer.decimate(np.arange(10.0), 20).tolist() == list(range(10))
+
+
+def test_decimate_keeps_ends_and_extremes():
+
+    y = np.sin(np.linspace(0, 20, 50_001))
+    y[12_345] = 5
+    y[40_000] = -5
+
+    kept = viewer.decimate(y, 400)
+
+    assert len(kept) <= 400
+    assert np.all(np.diff(kept) > 0)
+    assert kept[0] == 0 and kept[-1] == len(y) - 1
+    assert 12_345 in kept and 40_000 in kept
+
+
+def test_query_overview(curves):
+
+    index = viewer.CurveIndex(curves, "e", "s")
+    df = index.query(max_points=500)
+
+    assert len(index) == 2
+    assert df.columns.tolist() == ["Specimen ID", "Strain", "Stress"]
+    assert df["Specimen ID"].value_counts().max() <= 500
+    assert df.groupby("Specimen ID")["Stress"].max().tolist() == [500, 500]
+
+
+def test_query_range_full_detail(curves):
+
+    index = viewer.CurveIndex(curves, "e", "s")
+    df = index.query(x_min=2.0, x_max=2.05)
+
+    # ~500 points per specimen in range, all returned
+    expected = curves[curves["e"].between(2.0, 2.05)]
+    assert len(df) == len(expected)
+    assert df["Strain"].between(2.0, 2.05).all()
+
+
+def test_query_range_decimated(curves):
+
+    index = viewer.CurveIndex(curves, "e", "s")
+    df = index.query(x_min=2.0)
+
+    assert df["Specimen ID"].value_counts().max() <= viewer.MAX_POINTS
+    assert df["Strain"].min() >= 2.0
+    assert df["Stress"].max() == 500
+
+
+def test_query_max_points_capped(curves):
+
+    df = viewer.CurveIndex(curves, "e", "s").query(max_points=10**6)
+
+    assert df["Specimen ID"].value_counts().max() <= viewer.MAX_POINTS
+
+
+def test_query_max_points_too_small(curves):
+
+    with pytest.raises(ValueError, match="max_points must be at least 4"):
+        viewer.CurveIndex(curves, "e", "s").query(max_points=2)
+
+
+def test_query_drops_nans():
+
+    data = pd.DataFrame(
+        {"Specimen ID": "1", "e": [0.0, 1.0, np.nan, 3.0], "s": [0.0, np.nan, 2, 3]}
+    )
+
+    df = viewer.CurveIndex(data, "e", "s").query()
+
+    assert df["Strain"].tolist() == [0.0, 3.0]
+
+
+def test_view_page(server):
+
+    page = get(server.url)
+
+    assert "<title>Tensile Stress Strain Curves</title>" in page
+    assert 'fetch("/curves"' in page
+    for src in viewer.report.VEGA_SCRIPTS:
+        assert src in page
+
+
+def test_view_curves(server):
+
+    rows = json.loads(get(server.url + "curves?max_points=100"))
+    df = pd.DataFrame(rows)
+
+    assert df["Specimen ID"].nunique() == 10
+    assert df["Specimen ID"].value_counts().max() <= 100
+
+
+def test_view_curves_range(server):
+
+    rows = json.loads(get(server.url + "curves?x_min=0.5&x_max=1"))
+
+    assert rows
+    assert all(0.5 <= row["Strain"] <= 1 for row in rows)
+
+
+@pytest.mark.parametrize(
+    "path, status",
+    [("curves?x_min=abc", 400), ("curves?colour=red", 400), ("nothing", 404)],
+)
+def test_view_errors(server, path, status):
+
+    with pytest.raises(urllib.error.HTTPError) as e:
+        get(server.url + path)
+
+    assert e.value.code == status
+    assert "error" in json.loads(e.value.read())